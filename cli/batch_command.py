@@ -1,9 +1,12 @@
 """Batch export command for multi-workflow documents."""
 
+import os
 import shutil
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -49,6 +52,30 @@ def _sanitize_workflow_name(workflow_name: str) -> str:
     return safe_name.strip().replace(" ", "_")
 
 
+def _unique_workflow_names(workflows) -> List[Tuple[str, str]]:
+    """Return ``(title, safe_name)`` per workflow with collision-free file names.
+
+    Titles that sanitize to the same name (or differ only in case) would
+    otherwise write, and render through, the same output file concurrently,
+    so duplicates get the workflow index as a suffix.
+    """
+    names = []
+    used = set()
+    for index, workflow in enumerate(workflows, 1):
+        workflow_name = workflow.title or f"Workflow_{index}"
+        safe_name = _sanitize_workflow_name(workflow_name) or f"Workflow_{index}"
+        if safe_name.lower() in used:
+            base = safe_name
+            suffix = index
+            safe_name = f"{base}_{suffix}"
+            while safe_name.lower() in used:
+                suffix += 1
+                safe_name = f"{base}_{suffix}"
+        used.add(safe_name.lower())
+        names.append((workflow_name, safe_name))
+    return names
+
+
 def _resolve_output_file(
     *,
     output_dir: Path,
@@ -69,6 +96,7 @@ def _process_single_workflow(
     pipeline: FlowchartPipeline,
     workflow,
     workflow_name: str,
+    safe_name: str,
     output_dir: Path,
     output_format: str,
     zip_output: bool,
@@ -79,7 +107,6 @@ def _process_single_workflow(
         return "no_steps"
 
     flowchart = pipeline.build_flowchart(steps, title=workflow_name)
-    safe_name = _sanitize_workflow_name(workflow_name)
     output_file = _resolve_output_file(
         output_dir=output_dir,
         safe_name=safe_name,
@@ -103,9 +130,21 @@ def _finalize_zip_export(output_dir: Path, output_format: str) -> Path:
     return zip_path
 
 
+def _batch_worker_count(pipeline_config: PipelineConfig, workflow_count: int) -> int:
+    """Number of workflows to process concurrently.
+
+    Heuristic extraction and the renderers are independent per workflow.
+    LLM-backed extraction already saturates the CPU/GPU and holds a large
+    model in memory, so those runs stay sequential.
+    """
+    if pipeline_config.extraction != "heuristic":
+        return 1
+    return max(1, min(workflow_count, os.cpu_count() or 1))
+
+
 def _run_batch_processing(
     *,
-    pipeline: FlowchartPipeline,
+    pipeline_config: PipelineConfig,
     workflows,
     output_dir: Path,
     output_format: str,
@@ -113,28 +152,41 @@ def _run_batch_processing(
 ) -> Tuple[int, int]:
     success_count = 0
     failed_count = 0
+    local = threading.local()
+
+    def process(workflow, workflow_name: str, safe_name: str) -> str:
+        # Pipelines keep per-run metadata, so each worker thread gets its own.
+        if not hasattr(local, "pipeline"):
+            local.pipeline = FlowchartPipeline(pipeline_config)
+        return _process_single_workflow(
+            pipeline=local.pipeline,
+            workflow=workflow,
+            workflow_name=workflow_name,
+            safe_name=safe_name,
+            output_dir=output_dir,
+            output_format=output_format,
+            zip_output=zip_output,
+        )
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
-    ) as progress:
+    ) as progress, ThreadPoolExecutor(
+        max_workers=_batch_worker_count(pipeline_config, len(workflows))
+    ) as executor:
         task = progress.add_task("Processing workflows...", total=len(workflows))
 
-        for index, workflow in enumerate(workflows, 1):
-            workflow_name = workflow.title or f"Workflow_{index}"
-            safe_name = _sanitize_workflow_name(workflow_name)
-            progress.update(task, description=f"Processing: {safe_name}")
+        futures = {}
+        for workflow, (workflow_name, safe_name) in zip(workflows, _unique_workflow_names(workflows)):
+            futures[executor.submit(process, workflow, workflow_name, safe_name)] = safe_name
+
+        for future in as_completed(futures):
+            safe_name = futures[future]
+            progress.update(task, description=f"Processed: {safe_name}")
 
             try:
-                status = _process_single_workflow(
-                    pipeline=pipeline,
-                    workflow=workflow,
-                    workflow_name=workflow_name,
-                    output_dir=output_dir,
-                    output_format=output_format,
-                    zip_output=zip_output,
-                )
+                status = future.result()
                 if status == "ok":
                     success_count += 1
                 else:
@@ -190,10 +242,8 @@ def batch_export(
         output_dir.mkdir(parents=True, exist_ok=True)
         console.print(f"[cyan]Output directory: {output_dir}[/cyan]")
 
-    pipeline = FlowchartPipeline(pipeline_config or PipelineConfig())
-
     success_count, failed_count = _run_batch_processing(
-        pipeline=pipeline,
+        pipeline_config=pipeline_config or PipelineConfig(),
         workflows=workflows,
         output_dir=output_dir,
         output_format=format,
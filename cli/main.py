@@ -12,25 +12,35 @@ from src.version_check import check_python_version
 
 check_python_version(raise_error=True)
 
+import functools  # noqa: E402
+import hashlib  # noqa: E402
+from collections import OrderedDict  # noqa: E402
 from pathlib import Path  # noqa: E402
-from typing import Optional  # noqa: E402
+from typing import TYPE_CHECKING, List, NoReturn, Optional, Tuple  # noqa: E402
 
 import typer  # noqa: E402
 from rich.console import Console  # noqa: E402
 from rich.table import Table  # noqa: E402
 
-from cli.batch_command import batch_export  # noqa: E402
-from cli.import_command import import_and_generate  # noqa: E402
-from cli.tutorial_command import tutorial_command  # noqa: E402
-from src.builder.graph_builder import GraphBuilder  # noqa: E402
-from src.builder.validator import ISO5807Validator  # noqa: E402
-from src.pipeline import FlowchartPipeline, PipelineConfig  # noqa: E402
+from cli.reporter import JsonReporter, Reporter, get_reporter  # noqa: E402
+
+# The pipeline pulls in spaCy, Pillow and the renderers, so commands import
+# it on demand; `--help`, `info` and `version` stay fast.
+if TYPE_CHECKING:
+    from src.pipeline import FlowchartPipeline, PipelineConfig
 
 app = typer.Typer(
     name="flowchart",
     help="ISO 5807 Flowchart Generator - Transform workflows into professional flowcharts"
 )
 console = Console()
+err_console = Console(stderr=True, highlight=False)
+
+
+def _fail(markup: str, code: int = 1) -> NoReturn:
+    """Print an error to stderr and exit with ``code``."""
+    err_console.print(markup)
+    raise typer.Exit(code)
 
 
 def _build_pipeline_config(
@@ -46,8 +56,10 @@ def _build_pipeline_config(
     d2_layout: str = "elk",
     n_gpu_layers: int = -1,
     n_ctx: int = 8192,
-) -> PipelineConfig:
+) -> "PipelineConfig":
     """Build a PipelineConfig from CLI options."""
+    from src.pipeline import PipelineConfig
+
     return PipelineConfig(
         extraction=extraction,
         renderer=renderer,
@@ -64,32 +76,36 @@ def _build_pipeline_config(
     )
 
 
-def _read_workflow_text(input_file: Path) -> str:
+def _read_workflow_text(input_file: Path, reporter: Reporter) -> str:
     if not input_file.exists():
-        console.print(f"[red]âŒ Error: Input file not found: {input_file}[/red]")
+        reporter.event(
+            "error",
+            f"[red]❌ Error: Input file not found: {input_file}[/red]",
+            message=f"Input file not found: {input_file}",
+        )
         raise typer.Exit(1)
 
-    console.print(f"[cyan]ðŸ“„ Reading workflow from: {input_file}[/cyan]")
+    reporter.event("reading", f"[cyan]📄 Reading workflow from: {input_file}[/cyan]", path=str(input_file))
     try:
-        with open(input_file, "r", encoding="utf-8") as file_handle:
-            return file_handle.read()
+        return input_file.read_text(encoding="utf-8")
     except Exception as exc:
-        console.print(f"[red]âŒ Error reading file: {exc}[/red]")
+        reporter.event("error", f"[red]❌ Error reading file: {exc}[/red]", message=f"Error reading file: {exc}")
         raise typer.Exit(1)
 
 
-def _print_config_issues(pipeline: FlowchartPipeline) -> None:
+def _print_config_issues(pipeline: "FlowchartPipeline", reporter: Reporter) -> None:
     config_issues = pipeline.validate_config()
     if not config_issues:
         return
-    console.print("[yellow]âš ï¸  Configuration warnings:[/yellow]")
+    reporter.note("[yellow]⚠️  Configuration warnings:[/yellow]")
     for issue in config_issues:
-        console.print(f"  [yellow]â€¢ {issue}[/yellow]")
-    console.print()
+        reporter.event("config_warning", f"  [yellow]• {issue}[/yellow]", message=issue)
+    reporter.note("")
 
 
 def _print_active_config(
-    pipeline: FlowchartPipeline,
+    pipeline: "FlowchartPipeline",
+    reporter: Reporter,
     *,
     extraction: str,
     renderer: str,
@@ -98,40 +114,70 @@ def _print_active_config(
     graphviz_engine: str,
     d2_layout: str,
 ) -> str:
-    caps = pipeline.get_capabilities()
-    resolved_extraction = extraction if extraction != "auto" else caps["extractors"]["recommended"]
-    resolved_renderer = renderer if renderer != "auto" else caps["renderers"]["recommended"]
-    console.print(f"[dim]  Extraction: {resolved_extraction} | Renderer: {resolved_renderer}[/dim]")
-    if extraction == "auto" or renderer == "auto":
-        console.print("[dim]  (auto-selected based on system capabilities)[/dim]")
+    auto_selected = extraction == "auto" or renderer == "auto"
+    resolved_extraction, resolved_renderer = extraction, renderer
+    if auto_selected:
+        # Capability probes are only needed to resolve "auto".
+        caps = pipeline.get_capabilities()
+        if extraction == "auto":
+            resolved_extraction = caps["extractors"]["recommended"]
+        if renderer == "auto":
+            resolved_renderer = caps["renderers"]["recommended"]
+    reporter.event(
+        "config",
+        f"[dim]  Extraction: {resolved_extraction} | Renderer: {resolved_renderer}[/dim]",
+        extraction=resolved_extraction,
+        renderer=resolved_renderer,
+        auto_selected=auto_selected,
+    )
+    if auto_selected:
+        reporter.note("[dim]  (auto-selected based on system capabilities)[/dim]")
     if resolved_extraction == "local-llm" and model_path:
-        console.print(f"[dim]  Model: {model_path} | Quantization: {quantization}[/dim]")
+        reporter.note(f"[dim]  Model: {model_path} | Quantization: {quantization}[/dim]")
     if resolved_renderer == "graphviz":
-        console.print(f"[dim]  Graphviz engine: {graphviz_engine}[/dim]")
+        reporter.note(f"[dim]  Graphviz engine: {graphviz_engine}[/dim]")
     elif resolved_renderer == "d2":
-        console.print(f"[dim]  D2 layout: {d2_layout}[/dim]")
-    console.print()
+        reporter.note(f"[dim]  D2 layout: {d2_layout}[/dim]")
+    reporter.note("")
     return resolved_renderer
 
 
-def _validate_flowchart_or_exit(flowchart) -> None:
-    console.print("[cyan]âœ… Validating ISO 5807 compliance...[/cyan]")
-    validator = ISO5807Validator()
-    is_valid, errors, warnings_list = validator.validate(flowchart)
+def _validate_flowchart_or_exit(
+    flowchart,
+    reporter: Reporter,
+    interactive: bool = True,
+    result: Optional[Tuple[bool, List[str], List[str]]] = None,
+) -> None:
+    """Report ISO 5807 validation, reusing ``result`` when the pipeline already validated."""
+    reporter.note("[cyan]✅ Validating ISO 5807 compliance...[/cyan]")
+    if result is None:
+        from src.builder.validator import ISO5807Validator
+
+        result = ISO5807Validator().validate(flowchart)
+    is_valid, errors, warnings_list = result
     if errors:
-        console.print("[red]\nâŒ Validation Errors:[/red]")
+        reporter.note("[red]\n❌ Validation Errors:[/red]")
         for error in errors:
-            console.print(f"  [red]â€¢ {error}[/red]")
+            reporter.note(f"  [red]• {error}[/red]")
     if warnings_list:
-        console.print("[yellow]\nâš ï¸  Validation Warnings:[/yellow]")
+        reporter.note("[yellow]\n⚠️  Validation Warnings:[/yellow]")
         for warning in warnings_list:
-            console.print(f"  [yellow]â€¢ {warning}[/yellow]")
+            reporter.note(f"  [yellow]• {warning}[/yellow]")
+    if is_valid:
+        summary = "[green]✓ Flowchart is ISO 5807 compliant[/green]"
+    else:
+        summary = "[red]❌ Flowchart has validation errors[/red]"
+    reporter.event(
+        "validated",
+        summary,
+        valid=is_valid,
+        errors=errors,
+        warnings=warnings_list,
+    )
     if is_valid:
-        console.print("[green]âœ“ Flowchart is ISO 5807 compliant[/green]")
         return
 
-    console.print("[red]âŒ Flowchart has validation errors[/red]")
-    if not typer.confirm("\nContinue anyway?", default=False):
+    if not interactive or not typer.confirm("\nContinue anyway?", default=False):
         raise typer.Exit(1)
 
 
@@ -150,6 +196,8 @@ def tutorial(
         flowchart tutorial
         flowchart tutorial --skip-intro
     """
+    from cli.tutorial_command import tutorial_command
+
     tutorial_command(skip_intro=skip_intro)
 
 
@@ -197,9 +245,10 @@ def batch(
         flowchart batch guide.docx --zip --split-mode subsection
         flowchart batch workflow.pdf -o ./output --format png
     """
+    from cli.batch_command import batch_export
+
     if not input_file.exists():
-        console.print(f"[red]❌ Error: Input file not found: {input_file}[/red]")
-        raise typer.Exit(1)
+        _fail(f"[red]❌ Error: Input file not found: {input_file}[/red]")
 
     config = _build_pipeline_config(
         extraction=extraction,
@@ -267,9 +316,11 @@ def import_document(
         flowchart import --clipboard --extraction local-llm --model-path ./model.gguf
         flowchart import process.pdf --renderer auto --extraction auto
     """
+    from cli.import_command import import_and_generate
+    from src.pipeline import FlowchartPipeline
+
     if not input_file and not clipboard:
-        console.print("[red]❌ Error: Specify input file or use --clipboard[/red]")
-        raise typer.Exit(1)
+        _fail("[red]❌ Error: Specify input file or use --clipboard[/red]")
 
     config = _build_pipeline_config(
         extraction=extraction,
@@ -337,6 +388,9 @@ def generate(
     graphviz_engine: str = typer.Option("dot", "--gv-engine", help="Graphviz engine"),
     d2_layout: str = typer.Option("elk", "--d2-layout", help="D2 layout engine"),
     kroki_url: str = typer.Option("http://localhost:8000", "--kroki-url", help="Kroki URL"),
+    json_output: bool = typer.Option(
+        False, "--json", help="Write newline-delimited JSON progress events instead of rich output"
+    ),
 ):
     """
     Generate a flowchart from workflow text file.
@@ -346,11 +400,21 @@ def generate(
         flowchart generate workflow.txt --renderer auto --extraction auto
         flowchart generate workflow.txt --renderer graphviz --gv-engine neato
         flowchart generate workflow.txt --extraction local-llm -q 4bit --model-path ./model.gguf
+        flowchart generate workflow.txt --json
     """
+    from src.pipeline import FlowchartPipeline
+
     del width, height
 
-    console.print("[bold blue]⚙️  ISO 5807 Flowchart Generator[/bold blue]\n")
-    workflow_text = _read_workflow_text(input_file)
+    reporter = get_reporter(json_output, console, err_console)
+    reporter.note("[bold blue]⚙️  ISO 5807 Flowchart Generator[/bold blue]\n")
+    workflow_text = _read_workflow_text(input_file, reporter)
+
+    if format is None:
+        format = output.suffix.lstrip(".")
+    if format == "mmd":
+        # Mermaid source is the output itself; no other renderer is involved.
+        renderer = "mermaid"
 
     config = _build_pipeline_config(
         extraction=extraction,
@@ -368,9 +432,10 @@ def generate(
     )
     pipeline = FlowchartPipeline(config)
 
-    _print_config_issues(pipeline)
+    _print_config_issues(pipeline, reporter)
     resolved_renderer = _print_active_config(
         pipeline,
+        reporter,
         extraction=extraction,
         renderer=renderer,
         model_path=model_path,
@@ -379,28 +444,108 @@ def generate(
         d2_layout=d2_layout,
     )
 
-    console.print("[cyan]🧠 Extracting workflow steps...[/cyan]")
-    steps = pipeline.extract_steps(workflow_text)
-    console.print(f"[green]✓ Extracted {len(steps)} workflow steps[/green]")
-
-    console.print("[cyan]🔨 Building flowchart graph...[/cyan]")
-    title = input_file.stem.replace("_", " ").title()
-    flowchart = pipeline.build_flowchart(steps, title=title)
-    console.print(
-        f"[green]✓ Created {len(flowchart.nodes)} nodes and {len(flowchart.connections)} connections[/green]"
+    with reporter.status("[cyan]🧠 Extracting workflow steps...[/cyan]"):
+        steps = pipeline.extract_steps(workflow_text)
+    reporter.event("extracted", f"[green]✓ Extracted {len(steps)} workflow steps[/green]", count=len(steps))
+
+    title = " ".join(word.capitalize() for word in input_file.stem.replace("_", " ").split())
+    with reporter.status("[cyan]🔨 Building flowchart graph...[/cyan]"):
+        flowchart = pipeline.build_flowchart(steps, title=title)
+    reporter.event(
+        "built",
+        f"[green]✓ Created {len(flowchart.nodes)} nodes and {len(flowchart.connections)} connections[/green]",
+        nodes=len(flowchart.nodes),
+        connections=len(flowchart.connections),
     )
 
     if validate:
-        _validate_flowchart_or_exit(flowchart)
+        _validate_flowchart_or_exit(
+            flowchart,
+            reporter,
+            interactive=not isinstance(reporter, JsonReporter),
+            result=pipeline.get_last_validation(),
+        )
+
+    with reporter.status(f"[cyan]🖨️ Rendering to {format.upper()} via {resolved_renderer}...[/cyan]"):
+        rendered = pipeline.render(flowchart, str(output), format=format)
+    if not rendered:
+        reporter.event("error", "[red]❌ Rendering failed[/red]", message="Rendering failed")
+        raise typer.Exit(1)
 
-    if format is None:
-        format = output.suffix.lstrip(".")
+    # Report what was actually written; the pipeline may have fallen back
+    # to another renderer or to an .html file.
+    render_metadata = pipeline.get_last_render_metadata()
+    written = render_metadata.get("output_path") or str(output)
+    final_renderer = render_metadata.get("final_renderer") or resolved_renderer
+    reporter.event(
+        "rendered",
+        f"\n[bold green]✅ Success! Flowchart saved to: {written}[/bold green]",
+        output=written,
+        format="html" if final_renderer == "html" else format,
+        renderer=final_renderer,
+        fallback_chain=render_metadata.get("fallback_chain", []),
+    )
 
-    console.print(f"[cyan]🖨️ Rendering to {format.upper()} via {resolved_renderer}...[/cyan]")
-    if not pipeline.render(flowchart, str(output), format=format):
-        raise typer.Exit(1)
 
-    console.print(f"\n[bold green]✅ Success! Flowchart saved to: {output}[/bold green]")
+VALIDATION_CACHE_SIZE = 64
+
+ValidationSummary = Tuple[int, int, int, bool, Tuple[str, ...], Tuple[str, ...]]
+
+# Validation results keyed by (text fingerprint, extraction, model path), so
+# re-validating an unchanged workflow in the same process (tutorial, tests,
+# editor integrations) skips extraction and the validator entirely.
+_VALIDATION_CACHE: "OrderedDict[Tuple[str, str, Optional[str]], ValidationSummary]" = OrderedDict()
+
+
+def _workflow_fingerprint(workflow_text: str) -> str:
+    return hashlib.blake2b(workflow_text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _validate_workflow_text(
+    workflow_text: str,
+    extraction: str,
+    model_path: Optional[str],
+) -> ValidationSummary:
+    """Extract, build and validate a workflow, memoizing the summary."""
+    key = (_workflow_fingerprint(workflow_text), extraction, model_path)
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        _VALIDATION_CACHE.move_to_end(key)
+        return cached
+
+    from src.builder.graph_builder import GraphBuilder
+    from src.builder.validator import ISO5807Validator
+    from src.pipeline import FlowchartPipeline
+
+    config = _build_pipeline_config(extraction=extraction, model_path=model_path)
+    steps = FlowchartPipeline(config).extract_steps(workflow_text)
+    flowchart = GraphBuilder().build(steps)
+    is_valid, errors, warnings_list = ISO5807Validator().validate(flowchart)
+
+    summary = (
+        len(steps),
+        len(flowchart.nodes),
+        len(flowchart.connections),
+        is_valid,
+        tuple(errors),
+        tuple(warnings_list),
+    )
+    _VALIDATION_CACHE[key] = summary
+    if len(_VALIDATION_CACHE) > VALIDATION_CACHE_SIZE:
+        _VALIDATION_CACHE.popitem(last=False)
+    return summary
+
+
+def validate_workflow_file(
+    input_file: Path,
+    extraction: str = "heuristic",
+    model_path: Optional[str] = None,
+) -> ValidationSummary:
+    """Validate a workflow file in-process, as `flowchart validate` does.
+
+    Returns (steps, nodes, connections, is_valid, errors, warnings).
+    """
+    return _validate_workflow_text(input_file.read_text(encoding="utf-8"), extraction, model_path)
 
 
 @app.command()
@@ -420,29 +565,18 @@ def validate(
     console.print("[bold blue]✅ ISO 5807 Validator[/bold blue]\n")
 
     if not input_file.exists():
-        console.print(f"[red]❌ Error: Input file not found: {input_file}[/red]")
-        raise typer.Exit(1)
+        _fail(f"[red]❌ Error: Input file not found: {input_file}[/red]")
 
-    with open(input_file, "r", encoding="utf-8") as f:
-        workflow_text = f.read()
-
-    config = _build_pipeline_config(extraction=extraction, model_path=model_path)
-    pipeline = FlowchartPipeline(config)
-    steps = pipeline.extract_steps(workflow_text)
+    workflow_text = input_file.read_text(encoding="utf-8")
+    step_count, node_count, connection_count, is_valid, errors, warnings_list = _validate_workflow_text(
+        workflow_text, extraction, model_path
+    )
 
     if verbose:
         console.print(f"Extraction method: {extraction}")
-        console.print(f"Parsed {len(steps)} workflow steps\n")
-
-    builder = GraphBuilder()
-    flowchart = builder.build(steps)
-
-    if verbose:
-        console.print(f"Nodes: {len(flowchart.nodes)}")
-        console.print(f"Connections: {len(flowchart.connections)}\n")
-
-    validator = ISO5807Validator()
-    is_valid, errors, warnings_list = validator.validate(flowchart)
+        console.print(f"Parsed {step_count} workflow steps\n")
+        console.print(f"Nodes: {node_count}")
+        console.print(f"Connections: {connection_count}\n")
 
     if errors:
         console.print("[red]\n❌ Validation Errors:[/red]")
@@ -464,19 +598,24 @@ def validate(
 
 
 @app.command()
-def renderers():
+def renderers(
+    refresh_caps: bool = typer.Option(
+        False, "--refresh-caps", help="Ignore cached capability probes and re-detect"
+    ),
+):
     """
     Show available rendering and extraction engines with system capabilities.
 
     Example:
         flowchart renderers
+        flowchart renderers --refresh-caps
     """
     from src.capability_detector import CapabilityDetector
 
     console.print("[bold blue]🔍 System Capability Assessment[/bold blue]\n")
 
     detector = CapabilityDetector()
-    caps = detector.detect()
+    caps = detector.detect(force_refresh=refresh_caps)
 
     # Hardware
     hw_table = Table(show_header=True, header_style="bold cyan", title="Hardware")
@@ -562,31 +701,38 @@ def renderers():
     console.print("\n[dim]Use --extraction auto --renderer auto for adaptive selection[/dim]")
 
 
-@app.command()
-def info():
-    """Display information about ISO 5807 standard and supported symbols."""
-    console.print("[bold blue]📊 ISO 5807 Flowchart Standard[/bold blue]\n")
-    console.print("[bold]Supported Symbols:[/bold]\n")
+ISO_SYMBOLS = (
+    ("Terminator", "Oval", "Start/End points"),
+    ("Process", "Rectangle", "Processing steps"),
+    ("Decision", "Diamond", "Conditional branching"),
+    ("Input/Output", "Parallelogram", "Data I/O operations"),
+    ("Database", "Cylinder", "Database operations"),
+    ("Display", "Hexagon", "Screen output"),
+    ("Document", "Wavy Rectangle", "Document generation"),
+    ("Predefined", "Double Rectangle", "Sub-routines/functions"),
+    ("Manual", "Trapezoid", "Manual operations"),
+)
 
+
+@functools.lru_cache(maxsize=None)
+def _build_info_table() -> Table:
+    """Build the static ISO 5807 symbol table once; rich re-renders it on each print."""
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Symbol", style="cyan")
     table.add_column("Shape", style="yellow")
     table.add_column("Use Case", style="green")
-
-    symbols = [
-        ("Terminator", "Oval", "Start/End points"),
-        ("Process", "Rectangle", "Processing steps"),
-        ("Decision", "Diamond", "Conditional branching"),
-        ("Input/Output", "Parallelogram", "Data I/O operations"),
-        ("Database", "Cylinder", "Database operations"),
-        ("Display", "Hexagon", "Screen output"),
-        ("Document", "Wavy Rectangle", "Document generation"),
-        ("Predefined", "Double Rectangle", "Sub-routines/functions"),
-        ("Manual", "Trapezoid", "Manual operations"),
-    ]
-    for symbol, shape, use_case in symbols:
+    for symbol, shape, use_case in ISO_SYMBOLS:
         table.add_row(symbol, shape, use_case)
-    console.print(table)
+    return table
+
+
+@app.command()
+def info():
+    """Display information about ISO 5807 standard and supported symbols."""
+    console.print("[bold blue]📊 ISO 5807 Flowchart Standard[/bold blue]\n")
+    console.print("[bold]Supported Symbols:[/bold]\n")
+
+    console.print(_build_info_table())
 
 
 @app.command()
@@ -0,0 +1,99 @@
+"""Progress reporting for CLI commands.
+
+``RichReporter`` prints the usual colored console output. ``JsonReporter``
+skips rich entirely and writes one JSON object per line to stdout so CI
+jobs and other tools can consume progress without parsing markup. Anything
+else printed while a JSON-mode step runs is sent to stderr so stdout stays
+valid NDJSON.
+"""
+
+import contextlib
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, ContextManager, Optional, TextIO
+
+from rich.console import Console
+
+
+class Reporter(ABC):
+    """Base reporter interface used by CLI commands."""
+
+    @abstractmethod
+    def event(self, name: str, markup: str, **fields: Any) -> None:
+        """Report a progress event.
+
+        Args:
+            name: Machine-readable event name (e.g. ``"extracted"``)
+            markup: Rich-markup message for human output
+            **fields: Structured payload for machine output
+        """
+
+    @abstractmethod
+    def note(self, markup: str) -> None:
+        """Report human-only detail that has no structured equivalent."""
+
+    def status(self, markup: str) -> ContextManager[Any]:
+        """Context manager shown while a long-running step is in progress."""
+        return contextlib.nullcontext()
+
+
+class RichReporter(Reporter):
+    """Reporter that prints rich-formatted messages to the console.
+
+    ``error`` events go to ``err_console`` (stderr) when one is given.
+    """
+
+    def __init__(self, console: Optional[Console] = None, err_console: Optional[Console] = None):
+        self.console = console or Console()
+        self.err_console = err_console or self.console
+
+    def event(self, name: str, markup: str, **fields: Any) -> None:
+        if name == "error":
+            self.err_console.print(markup)
+        else:
+            self.console.print(markup)
+
+    def note(self, markup: str) -> None:
+        self.console.print(markup)
+
+    def status(self, markup: str) -> ContextManager[Any]:
+        return self.console.status(markup)
+
+
+class JsonReporter(Reporter):
+    """Reporter that writes newline-delimited JSON events."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+
+    def event(self, name: str, markup: str, **fields: Any) -> None:
+        self.stream.write(json.dumps({"event": name, **fields}, default=str) + "\n")
+        self.stream.flush()
+
+    def note(self, markup: str) -> None:
+        return
+
+    def status(self, markup: str) -> ContextManager[Any]:
+        # Pipeline stages and renderers may print diagnostics; keep them off
+        # the event stream.
+        return contextlib.redirect_stdout(sys.stderr)
+
+
+def json_output_requested(flag: bool = False) -> bool:
+    """Return True when JSON output was requested by flag or FLOWCHART_JSON."""
+    if flag:
+        return True
+    return os.environ.get("FLOWCHART_JSON", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def get_reporter(
+    json_output: bool = False,
+    console: Optional[Console] = None,
+    err_console: Optional[Console] = None,
+) -> Reporter:
+    """Select a reporter for the current invocation."""
+    if json_output_requested(json_output):
+        return JsonReporter()
+    return RichReporter(console, err_console)
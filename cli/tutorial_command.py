@@ -1,5 +1,6 @@
 """Interactive tutorial command for new users."""
 import os
+import shlex
 import time
 from pathlib import Path
 
@@ -11,6 +12,19 @@ from rich.prompt import Confirm, Prompt
 console = Console()
 
 
+def _pause(seconds: float = 1.0) -> None:
+    """Pause between tutorial steps, scaled by FLOWCHART_TUTORIAL_PACE.
+
+    ``FLOWCHART_TUTORIAL_PACE=0`` removes the pauses (e.g. for CI smoke runs).
+    """
+    try:
+        pace = float(os.environ.get("FLOWCHART_TUTORIAL_PACE", "1"))
+    except ValueError:
+        pace = 1.0
+    if pace > 0:
+        time.sleep(seconds * pace)
+
+
 def tutorial_command(skip_intro: bool = typer.Option(False, "--skip-intro", help="Skip introduction")):
     """Interactive tutorial to learn flowchart generation."""
 
@@ -27,25 +41,25 @@ def tutorial_command(skip_intro: bool = typer.Option(False, "--skip-intro", help
             console.print("[dim]Tutorial cancelled. Run 'flowchart tutorial' when ready![/dim]")
             return
 
-    # Create tutorial workspace
+    # Create tutorial workspace. Files are addressed through this path rather
+    # than chdir, so the process working directory is left untouched.
     tutorial_dir = Path("flowchart_tutorial")
     tutorial_dir.mkdir(exist_ok=True)
-    os.chdir(tutorial_dir)
 
     console.print("\n[green]✓[/green] Created tutorial workspace: [cyan]flowchart_tutorial/[/cyan]")
-    time.sleep(1)
+    _pause()
 
     # Step 1: Simple workflow
-    step_1_simple_workflow()
+    step_1_simple_workflow(tutorial_dir)
 
     # Step 2: Decision branches
-    step_2_decision_workflow()
+    step_2_decision_workflow(tutorial_dir)
 
     # Step 3: Different renderers
-    step_3_renderers()
+    step_3_renderers(tutorial_dir)
 
     # Step 4: Batch processing
-    step_4_batch_processing()
+    step_4_batch_processing(tutorial_dir)
 
     # Step 5: Advanced features
     step_5_advanced()
@@ -64,7 +78,33 @@ def tutorial_command(skip_intro: bool = typer.Option(False, "--skip-intro", help
     ))
 
 
-def step_1_simple_workflow():
+def _run_flowchart_command(cmd: str) -> bool:
+    """Run a ``flowchart ...`` command line in this process instead of a subshell.
+
+    Reusing the current interpreter keeps the already-imported modules and
+    the cached spaCy model, so each tutorial step skips a full CLI startup.
+    """
+    from cli.main import app  # deferred: loading the full CLI is only needed once a step runs
+
+    try:
+        exit_code = app(shlex.split(cmd)[1:], standalone_mode=False)
+    except typer.Exit as exc:
+        return not exc.exit_code
+    except typer.Abort:
+        return False
+    except Exception as exc:
+        # Usage errors (bad option, missing argument) come from the click
+        # bundled with typer; show them like the standalone CLI would.
+        show = getattr(exc, "show", None)
+        if callable(show):
+            show()
+        else:
+            console.print(f"[red]❌ {exc}[/red]")
+        return False
+    return not exit_code
+
+
+def step_1_simple_workflow(workdir: Path):
     """Step 1: Create a simple linear workflow."""
     console.print("\n[bold cyan]📝 Step 1: Your First Flowchart[/bold cyan]")
     console.print("Let's create a simple workflow with just a few steps.\n")
@@ -82,23 +122,24 @@ def step_1_simple_workflow():
         return
 
     # Write workflow file
-    with open("simple_workflow.txt", "w") as f:
-        f.write(workflow_text)
+    input_file = workdir / "simple_workflow.txt"
+    input_file.write_text(workflow_text, encoding="utf-8")
 
-    console.print("\n[green]✓[/green] Created [cyan]simple_workflow.txt[/cyan]")
+    console.print(f"\n[green]✓[/green] Created [cyan]{input_file.as_posix()}[/cyan]")
 
     # Show command
-    cmd = "flowchart generate simple_workflow.txt -o simple.png --renderer graphviz"
+    output_file = workdir / "simple.png"
+    cmd = f"flowchart generate {input_file.as_posix()} -o {output_file.as_posix()} --renderer graphviz"
     console.print(f"\n[bold]Command:[/bold] [cyan]{cmd}[/cyan]")
 
     if Confirm.ask("\n[yellow]Run this command?[/yellow]", default=True):
         console.print("\n[dim]Running command...[/dim]")
-        os.system(cmd)
-        console.print("\n[green]✓[/green] Flowchart generated: [cyan]simple.png[/cyan]")
-        time.sleep(1)
+        if _run_flowchart_command(cmd):
+            console.print(f"\n[green]✓[/green] Flowchart generated: [cyan]{output_file.as_posix()}[/cyan]")
+        _pause()
 
 
-def step_2_decision_workflow():
+def step_2_decision_workflow(workdir: Path):
     """Step 2: Add decision branches."""
     console.print("\n[bold cyan]🔀 Step 2: Decision Branches[/bold cyan]")
     console.print("Flowcharts often include decisions. Let's add some!\n")
@@ -118,23 +159,24 @@ def step_2_decision_workflow():
     if not Confirm.ask("\n[yellow]Generate this flowchart?[/yellow]", default=True):
         return
 
-    with open("login_workflow.txt", "w") as f:
-        f.write(workflow_text)
+    input_file = workdir / "login_workflow.txt"
+    input_file.write_text(workflow_text, encoding="utf-8")
 
-    console.print("\n[green]✓[/green] Created [cyan]login_workflow.txt[/cyan]")
+    console.print(f"\n[green]✓[/green] Created [cyan]{input_file.as_posix()}[/cyan]")
 
-    cmd = "flowchart generate login_workflow.txt -o login.svg --renderer graphviz -f svg"
+    output_file = workdir / "login.svg"
+    cmd = f"flowchart generate {input_file.as_posix()} -o {output_file.as_posix()} --renderer graphviz -f svg"
     console.print(f"\n[bold]Command:[/bold] [cyan]{cmd}[/cyan]")
     console.print("[dim]Note: We're using SVG format this time (scalable!)[/dim]")
 
     if Confirm.ask("\n[yellow]Run this command?[/yellow]", default=True):
         console.print("\n[dim]Running command...[/dim]")
-        os.system(cmd)
-        console.print("\n[green]✓[/green] Flowchart generated: [cyan]login.svg[/cyan]")
-        time.sleep(1)
+        if _run_flowchart_command(cmd):
+            console.print(f"\n[green]✓[/green] Flowchart generated: [cyan]{output_file.as_posix()}[/cyan]")
+        _pause()
 
 
-def step_3_renderers():
+def step_3_renderers(workdir: Path):
     """Step 3: Try different renderers."""
     console.print("\n[bold cyan]🎨 Step 3: Different Rendering Engines[/bold cyan]")
     console.print("The tool supports multiple rendering engines. Let's compare!\n")
@@ -155,20 +197,22 @@ def step_3_renderers():
         return
 
     output_ext = "html" if renderer == "html" else "png"
+    input_file = workdir / "login_workflow.txt"
+    output_file = workdir / f"login_{renderer}.{output_ext}"
     cmd = (
-        f"flowchart generate login_workflow.txt -o login_{renderer}.{output_ext} "
+        f"flowchart generate {input_file.as_posix()} -o {output_file.as_posix()} "
         f"--renderer {renderer}"
     )
     console.print(f"\n[bold]Command:[/bold] [cyan]{cmd}[/cyan]")
 
     if Confirm.ask("\n[yellow]Run this command?[/yellow]", default=True):
         console.print("\n[dim]Running command...[/dim]")
-        os.system(cmd)
-        console.print(f"\n[green]✓[/green] Flowchart generated with {renderer} renderer!")
-        time.sleep(1)
+        if _run_flowchart_command(cmd):
+            console.print(f"\n[green]✓[/green] Flowchart generated with {renderer} renderer!")
+        _pause()
 
 
-def step_4_batch_processing():
+def step_4_batch_processing(workdir: Path):
     """Step 4: Batch processing demo."""
     console.print("\n[bold cyan]📦 Step 4: Batch Processing[/bold cyan]")
     console.print("Process multiple workflows from a single document!\n")
@@ -198,18 +242,21 @@ Section 2: Password Reset
     if not Confirm.ask("\n[yellow]Generate batch flowcharts?[/yellow]", default=True):
         return
 
-    with open("multi_workflows.txt", "w") as f:
-        f.write(multi_workflow)
+    input_file = workdir / "multi_workflows.txt"
+    input_file.write_text(multi_workflow, encoding="utf-8")
 
-    cmd = "flowchart batch multi_workflows.txt --split-mode section --format png"
+    output_dir = workdir / "multi_workflows_workflows"
+    cmd = f"flowchart batch {input_file.as_posix()} -o {output_dir.as_posix()} --split-mode section --format png"
     console.print(f"\n[bold]Command:[/bold] [cyan]{cmd}[/cyan]")
     console.print("[dim]This will create separate flowcharts for each section[/dim]")
 
     if Confirm.ask("\n[yellow]Run this command?[/yellow]", default=True):
         console.print("\n[dim]Running command...[/dim]")
-        os.system(cmd)
-        console.print("\n[green]✓[/green] Multiple flowcharts generated in [cyan]flowcharts/[/cyan] directory!")
-        time.sleep(1)
+        if _run_flowchart_command(cmd):
+            console.print(
+                f"\n[green]✓[/green] Multiple flowcharts generated in [cyan]{output_dir.as_posix()}/[/cyan] directory!"
+            )
+        _pause()
 
 
 def step_5_advanced():
@@ -231,7 +278,7 @@ def step_5_advanced():
         console.print(f"  [green]{cmd}[/green]\n")
 
     console.print("[bold]Pro Tip:[/bold] Run [cyan]flowchart --help[/cyan] to see all commands!")
-    time.sleep(2)
+    _pause(2)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Run this to test all features:
     python quickstart.py
 """
 
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
@@ -39,10 +40,10 @@ def check_dependencies():
     
     missing = []
     for module, install_cmd in dependencies:
-        try:
-            __import__(module.replace('-', '_'))
+        # find_spec locates the package without running its import-time code
+        if importlib.util.find_spec(module.replace('-', '_')) is not None:
             print(f"  ✅ {module}")
-        except ImportError:
+        else:
             print(f"  ❌ {module} - Missing")
             missing.append(install_cmd)
     
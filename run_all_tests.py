@@ -1,34 +1,88 @@
 #!/usr/bin/env python3
 """Comprehensive test runner - runs all tests and validations."""
 
+import importlib.util
+import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 
-def run_command(cmd: list, description: str) -> bool:
-    """Run a command and return success status."""
-    print("\n" + "="*60)
-    print(f"🔍 {description}")
-    print("="*60)
-    
+# A suite that runs longer than this is treated as hung and killed.
+SUITE_TIMEOUT_SECONDS = 600
+
+
+def run_command(cmd: list, timeout: float = SUITE_TIMEOUT_SECONDS) -> Tuple[Optional[int], str]:
+    """Run a command with its output captured; return (exit code, output)."""
     try:
         result = subprocess.run(
             cmd,
-            capture_output=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            check=False
+            check=False,
+            timeout=timeout
         )
-        
-        if result.returncode == 0:
-            print(f"\n✅ {description} - PASSED")
-            return True
-        else:
-            print(f"\n❌ {description} - FAILED (exit code {result.returncode})")
-            return False
+        return result.returncode, result.stdout
+    except subprocess.TimeoutExpired as e:
+        partial = e.output or ""
+        if isinstance(partial, bytes):
+            partial = partial.decode(errors="replace")
+        return None, f"{partial}\nTimed out after {timeout:g}s"
     except Exception as e:
-        print(f"\n❌ {description} - ERROR: {e}")
+        return None, str(e)
+
+
+def report(description: str, returncode: Optional[int], output: str) -> bool:
+    """Print a finished suite's captured output and return success status."""
+    print("\n" + "="*60)
+    print(f"🔍 {description}")
+    print("="*60)
+    if output:
+        print(output.rstrip())
+
+    if returncode is None:
+        print(f"\n❌ {description} - ERROR")
         return False
+    if returncode == 0:
+        print(f"\n✅ {description} - PASSED")
+        return True
+    print(f"\n❌ {description} - FAILED (exit code {returncode})")
+    return False
+
+
+def validate_examples(example_files: list) -> List[Tuple[Path, Optional[int], str]]:
+    """Validate example workflows in this process, importing the CLI once.
+
+    Returns one (example, exit code, output) entry per file, using the same
+    exit code convention as ``flowchart validate``.
+    """
+    from cli.main import validate_workflow_file
+
+    outcomes = []
+    for example in example_files:
+        try:
+            _, _, _, is_valid, errors, warnings_list = validate_workflow_file(example)
+        except Exception as e:
+            outcomes.append((example, None, str(e)))
+            continue
+        lines = [f"  Error: {error}" for error in errors]
+        lines += [f"  Warning: {warning}" for warning in warnings_list]
+        outcomes.append((example, 0 if is_valid else 1, "\n".join(lines)))
+    return outcomes
+
+
+def pytest_parallel_args() -> list:
+    """Spread a pytest run across cores when pytest-xdist is installed.
+
+    ``--dist loadfile`` keeps each test module on one worker so module-level
+    setup (spaCy model loads, Flask app imports) happens once per file.
+    """
+    if importlib.util.find_spec("xdist") is None:
+        return []
+    return ["-n", "auto", "--dist", "loadfile"]
 
 
 def main():
@@ -40,50 +94,48 @@ def main():
 
     """)
     
-    results = {}
-    
-    # 1. Code validation
-    results['code_validation'] = run_command(
-        [sys.executable, "validate_code.py"],
-        "Code Syntax & Structure Validation"
-    )
+    # The suites are independent, so they run side by side. Output is captured
+    # per suite and printed as each one finishes to keep it readable.
+    xdist_args = pytest_parallel_args()
+    core_suites = [
+        ('code_validation', [sys.executable, "validate_code.py"],
+         "Code Syntax & Structure Validation"),
+        # One pytest run covers unit and E2E tests (marked `e2e`), so pytest,
+        # its plugins and conftest are imported once. Use -m "not e2e" to skip E2E.
+        ('pytest_suite', [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short", *xdist_args],
+         "Unit & End-to-End Tests"),
+        ('quick_validation', [sys.executable, "test_runner.py"],
+         "Quick Validation Tests"),
+    ]
     
-    # 2. Unit tests
-    results['unit_tests'] = run_command(
-        [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short", "-k", "not test_e2e"],
-        "Unit Tests"
-    )
+    examples_dir = Path("examples")
+    example_files = sorted(examples_dir.glob("*.txt")) if examples_dir.exists() else []
     
-    # 3. E2E tests
-    results['e2e_tests'] = run_command(
-        [sys.executable, "-m", "pytest", "tests/test_e2e.py", "-v", "--tb=short"],
-        "End-to-End Integration Tests"
-    )
+    # Leave a couple of cores for the OS and the suites' own subprocesses.
+    max_workers = max(1, (os.cpu_count() or 1) - 2)
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Examples share one in-process job so the CLI and parser load once.
+        examples_future = executor.submit(validate_examples, example_files)
+        futures = {
+            executor.submit(run_command, cmd): (key, description)
+            for key, cmd, description in core_suites
+        }
+        for future in as_completed(futures):
+            key, description = futures[future]
+            outcomes[key] = report(description, *future.result())
+        for example, returncode, output in examples_future.result():
+            outcomes[f"example:{example.name}"] = report(f"Validate {example.name}", returncode, output)
     
-    # 4. Quick validation with test_runner
-    results['quick_validation'] = run_command(
-        [sys.executable, "test_runner.py"],
-        "Quick Validation Tests"
-    )
+    results = {key: outcomes[key] for key, _, _ in core_suites}
     
     # 5. Example validation
     print("\n" + "="*60)
     print("🔍 Example Files Validation")
     print("="*60)
     
-    examples_dir = Path("examples")
     if examples_dir.exists():
-        example_files = list(examples_dir.glob("*.txt"))
-        examples_passed = 0
-        
-        for example in example_files:
-            result = run_command(
-                [sys.executable, "-m", "cli.main", "validate", str(example)],
-                f"Validate {example.name}"
-            )
-            if result:
-                examples_passed += 1
-        
+        examples_passed = sum(1 for example in example_files if outcomes[f"example:{example.name}"])
         results['examples'] = examples_passed == len(example_files)
         print(f"\n✅ Examples validation: {examples_passed}/{len(example_files)} passed")
     else:
@@ -1,45 +1,69 @@
 #!/usr/bin/env python3
 """Auto-fix code formatting issues for CI/CD compliance."""
 
-import subprocess
+import contextlib
+import importlib
+import io
+import os
 import sys
 from pathlib import Path
 
 
-def run_command(cmd, description):
-    """Run a command and report status."""
+def _load_entry_point(module_name, attr):
+    """Import a tool's CLI entry point, or return None when not installed."""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    return getattr(module, attr, None)
+
+
+def _capture_stream():
+    """Text stream backed by bytes, for tools that write to ``sys.stdout.buffer``."""
+    return io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+
+
+def run_tool(module_name, attr, argv, description, package):
+    """Run a Python tool's CLI entry point in this interpreter and report status.
+
+    black, isort and flake8 are all importable, so calling their ``main``
+    directly avoids forking a fresh interpreter for each tool.
+    """
     print(f"\n{'='*60}")
     print(f"🔧 {description}")
     print(f"{'='*60}")
-    print(f"Running: {' '.join(cmd)}\n")
-    
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
-        if result.stdout:
-            print(result.stdout)
-        
-        if result.returncode == 0:
-            print(f"✅ {description} - COMPLETED")
-            return True
-        else:
-            print(f"⚠️  {description} - HAD WARNINGS")
-            if result.stderr:
-                print(f"Stderr: {result.stderr}")
-            return False
-            
-    except FileNotFoundError:
-        print(f"❌ Command not found. Install with: pip install {cmd[0]}")
+    print(f"Running: {package} {' '.join(argv)}\n")
+
+    entry_point = _load_entry_point(module_name, attr)
+    if entry_point is None:
+        print(f"❌ Command not found. Install with: pip install {package}")
         return False
+
+    stdout, stderr = _capture_stream(), _capture_stream()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                returncode = entry_point(argv)
+            except SystemExit as exc:
+                returncode = exc.code
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
 
+    output = stdout.buffer.getvalue().decode("utf-8", errors="replace")
+    errors = stderr.buffer.getvalue().decode("utf-8", errors="replace")
+    if output:
+        print(output)
+
+    if not returncode:
+        print(f"✅ {description} - COMPLETED")
+        return True
+    else:
+        print(f"⚠️  {description} - HAD WARNINGS")
+        if errors:
+            print(f"Stderr: {errors}")
+        return False
+
 
 def main():
     """Main execution."""
@@ -60,42 +84,30 @@ def main():
     results = []
     
     # 1. Auto-fix with black
-    results.append(run_command(
-        ['black'] + existing_dirs,
-        "Format code with Black"
+    results.append(run_tool(
+        'black', 'main', existing_dirs,
+        "Format code with Black", 'black'
     ))
     
     # 2. Auto-fix with isort
-    results.append(run_command(
-        ['isort'] + existing_dirs,
-        "Sort imports with isort"
+    # black and flake8 already spread files across cores; isort needs --jobs.
+    # The tools themselves stay sequential: black and isort both rewrite the
+    # same files, and flake8 has to lint the formatted result.
+    results.append(run_tool(
+        'isort.main', 'main', existing_dirs + ['--jobs', str(os.cpu_count() or 1)],
+        "Sort imports with isort", 'isort'
     ))
     
     # 3. Check with flake8 (non-fixing)
-    print(f"\n{'='*60}")
-    print("🔍 Checking code quality with flake8")
-    print(f"{'='*60}")
-    
-    flake8_result = subprocess.run(
-        ['flake8'] + existing_dirs + [
+    results.append(run_tool(
+        'flake8.main.cli', 'main', existing_dirs + [
             '--max-line-length=120',
             '--extend-ignore=E203,W503',
             '--statistics',
             '--count'
         ],
-        capture_output=True,
-        text=True
-    )
-    
-    if flake8_result.stdout:
-        print(flake8_result.stdout)
-    
-    if flake8_result.returncode == 0:
-        print("✅ No flake8 issues found")
-        results.append(True)
-    else:
-        print("⚠️  Some flake8 warnings (review manually)")
-        results.append(False)
+        "Check code quality with flake8", 'flake8'
+    ))
     
     # Summary
     print(f"\n{'='*60}")
@@ -1,8 +1,9 @@
 """Graph builder for flowchart construction."""
 
+from collections import deque
 from typing import Dict, List, Optional
 
-from src.models import Flowchart, WorkflowStep
+from src.models import Flowchart, WorkflowStep, is_start_label
 from src.parser.workflow_analyzer import WorkflowAnalyzer
 
 
@@ -120,6 +121,18 @@ class GraphBuilder:
             elif node.position is None:
                 node.position = (last_group_y + 120, col_spacing)
 
+    def _find_start_node_id(self, flowchart: Flowchart) -> Optional[str]:
+        """Return the BFS root: the START node, else the first node."""
+        if not flowchart.nodes:
+            return None
+        # WorkflowAnalyzer always emits START as the first node
+        if flowchart.nodes[0].id == "START":
+            return "START"
+        for node in flowchart.nodes:
+            if "START" in node.id or is_start_label(node.label):
+                return node.id
+        return flowchart.nodes[0].id
+
     def _calculate_levels(self, flowchart: Flowchart) -> Dict[str, int]:
         """
         Calculate hierarchical level for each node.
@@ -132,22 +145,21 @@ class GraphBuilder:
         """
         levels = {}
 
-        # Find start node
-        start_nodes = [n for n in flowchart.nodes if "START" in n.id or "start" in n.label.lower()]
-        if not start_nodes:
-            # No explicit start, use first node
-            if flowchart.nodes:
-                start_nodes = [flowchart.nodes[0]]
-
-        if not start_nodes:
+        start_id = self._find_start_node_id(flowchart)
+        if start_id is None:
             return levels
 
+        # Outgoing adjacency, built once so the BFS is O(N + E)
+        successors: Dict[str, List[str]] = {}
+        for conn in flowchart.connections:
+            successors.setdefault(conn.from_node, []).append(conn.to_node)
+
         # BFS to assign levels
-        queue = [(start_nodes[0].id, 0)]
+        queue = deque([(start_id, 0)])
         visited = set()
 
         while queue:
-            node_id, level = queue.pop(0)
+            node_id, level = queue.popleft()
 
             if node_id in visited:
                 continue
@@ -155,9 +167,8 @@ class GraphBuilder:
             visited.add(node_id)
             levels[node_id] = level
 
-            # Find outgoing connections
-            for conn in flowchart.connections:
-                if conn.from_node == node_id and conn.to_node not in visited:
-                    queue.append((conn.to_node, level + 1))
+            for to_node in successors.get(node_id, ()):
+                if to_node not in visited:
+                    queue.append((to_node, level + 1))
 
         return levels
@@ -2,7 +2,9 @@
 
 from typing import Dict, List, Tuple
 
-from src.models import ConnectionType, Flowchart, NodeType
+from src.models import Connection, ConnectionType, Flowchart, NodeType, is_end_label, is_start_label
+
+_VALID_NODE_TYPES = frozenset(NodeType)
 
 
 class ISO5807Validator:
@@ -11,6 +13,10 @@ class ISO5807Validator:
     def __init__(self):
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self._outgoing: Dict[str, List[Connection]] = {}
+        self._incoming: Dict[str, List[Connection]] = {}
+        self._terminator_roles: Dict[str, Tuple[bool, bool]] = {}
+        self._structure_result: Tuple[bool, List[str]] = (True, [])
 
     def validate(self, flowchart: Flowchart) -> Tuple[bool, List[str], List[str]]:
         """
@@ -25,6 +31,15 @@ class ISO5807Validator:
         self.errors = []
         self.warnings = []
 
+        # Index connections once; the per-node checks below look them up by id
+        self._outgoing = {}
+        self._incoming = {}
+        for conn in flowchart.connections:
+            self._outgoing.setdefault(conn.from_node, []).append(conn)
+            self._incoming.setdefault(conn.to_node, []).append(conn)
+        self._terminator_roles = self._classify_labels(flowchart)
+        self._structure_result = flowchart.validate_structure() if flowchart.nodes else (True, [])
+
         # Run validation checks
         self._validate_structure(flowchart)
         self._validate_symbols(flowchart)
@@ -36,6 +51,14 @@ class ISO5807Validator:
         is_valid = len(self.errors) == 0
         return is_valid, self.errors, self.warnings
 
+    def _classify_labels(self, flowchart: Flowchart) -> Dict[str, Tuple[bool, bool]]:
+        """Map each terminator node id to (is_start, is_end) from its label."""
+        return {
+            n.id: (is_start_label(n.label), is_end_label(n.label))
+            for n in flowchart.nodes
+            if n.node_type == NodeType.TERMINATOR
+        }
+
     def _validate_structure(self, flowchart: Flowchart) -> None:
         """Validate basic flowchart structure."""
         # Check minimum requirements
@@ -46,18 +69,16 @@ class ISO5807Validator:
         if len(flowchart.nodes) < 2:
             self.warnings.append("Flowchart has fewer than 2 nodes (start + end minimum)")
 
-        # Use built-in validation
-        is_valid, validation_errors = flowchart.validate_structure()
+        # Use built-in validation (computed once in validate())
+        is_valid, validation_errors = self._structure_result
         if not is_valid:
             self.errors.extend(validation_errors)
 
     def _validate_symbols(self, flowchart: Flowchart) -> None:
         """Validate ISO 5807 symbol usage."""
         # Check that only valid node types are used
-        valid_types = set(NodeType.__members__.values())
-
         for node in flowchart.nodes:
-            if node.node_type not in valid_types:
+            if node.node_type not in _VALID_NODE_TYPES:
                 self.errors.append(f"Invalid node type '{node.node_type}' for node '{node.id}'")
 
     def _validate_connections(self, flowchart: Flowchart) -> None:
@@ -80,18 +101,15 @@ class ISO5807Validator:
         self,
         outgoing: List,
     ) -> Tuple[set, set]:
-        yes_targets = {
-            c.to_node
-            for c in outgoing
-            if c.connection_type == ConnectionType.YES
-            or (c.label and "yes" in c.label.lower())
-        }
-        no_targets = {
-            c.to_node
-            for c in outgoing
-            if c.connection_type == ConnectionType.NO
-            or (c.label and "no" in c.label.lower())
-        }
+        yes, no = ConnectionType.YES, ConnectionType.NO
+        yes_targets = set()
+        no_targets = set()
+        for c in outgoing:
+            label = c.label.lower() if c.label else ""
+            if c.connection_type == yes or "yes" in label:
+                yes_targets.add(c.to_node)
+            if c.connection_type == no or "no" in label:
+                no_targets.add(c.to_node)
         return yes_targets, no_targets
 
     def _validate_decision_target_convergence(
@@ -128,7 +146,7 @@ class ISO5807Validator:
         flowchart: Flowchart,
         node_map: Dict[str, object],
     ) -> None:
-        outgoing = [c for c in flowchart.connections if c.from_node == node.id]
+        outgoing = self._outgoing.get(node.id, [])
 
         if len(outgoing) < 2:
             self.errors.append(
@@ -157,13 +175,14 @@ class ISO5807Validator:
         """Validate decision nodes have proper branches."""
         node_map = {n.id: n for n in flowchart.nodes}
 
-        for node in flowchart.nodes:
-            if node.node_type != NodeType.DECISION:
-                continue
+        # node_type is stored as its string value (use_enum_values), so compare with ==
+        decisions = [n for n in flowchart.nodes if n.node_type == NodeType.DECISION]
+        for node in decisions:
             self._validate_single_decision_node(node, flowchart, node_map)
 
     def _validate_terminators(self, flowchart: Flowchart) -> None:
         """Validate terminator (start/end) nodes."""
+        roles = self._terminator_roles
         terminators = [n for n in flowchart.nodes if n.node_type == NodeType.TERMINATOR]
 
         if not terminators:
@@ -171,27 +190,21 @@ class ISO5807Validator:
             return
 
         # Check for start node
-        start_nodes = [n for n in terminators if "start" in n.label.lower() or "begin" in n.label.lower()]
+        start_nodes = [n for n in terminators if roles[n.id][0]]
         if not start_nodes:
             self.warnings.append("No explicit START terminator found")
         elif len(start_nodes) > 1:
             self.errors.append(f"Multiple START nodes found: {len(start_nodes)}")
 
         # Check for end node
-        end_nodes = [
-            n
-            for n in terminators
-            if "end" in n.label.lower()
-            or "finish" in n.label.lower()
-            or "stop" in n.label.lower()
-        ]
+        end_nodes = [n for n in terminators if roles[n.id][1]]
         if not end_nodes:
             self.warnings.append("No explicit END terminator found")
 
         # Start node should have no incoming connections (except from itself in edge cases)
         if start_nodes:
             start_id = start_nodes[0].id
-            incoming = [c for c in flowchart.connections if c.to_node == start_id and c.from_node != start_id]
+            incoming = [c for c in self._incoming.get(start_id, []) if c.from_node != start_id]
             if incoming:
                 self.errors.append(
                     f"START node '{start_id}' has {len(incoming)} incoming connection(s) - "
@@ -200,7 +213,7 @@ class ISO5807Validator:
 
         # End nodes should have no outgoing connections
         for end_node in end_nodes:
-            outgoing = [c for c in flowchart.connections if c.from_node == end_node.id]
+            outgoing = self._outgoing.get(end_node.id, [])
             if outgoing:
                 self.errors.append(f"END node '{end_node.id}' has {len(outgoing)} outgoing connection(s)")
 
@@ -217,11 +230,12 @@ class ISO5807Validator:
                 )
 
     def _build_graph(self, flowchart: Flowchart) -> Dict[str, List[str]]:
-        graph: Dict[str, List[str]] = {node.id: [] for node in flowchart.nodes}
-        for conn in flowchart.connections:
-            if conn.from_node in graph:
-                graph[conn.from_node].append(conn.to_node)
-        return graph
+        # Reuses the outgoing index built in validate() instead of appending
+        # edge by edge into a fresh adjacency map.
+        return {
+            node.id: [c.to_node for c in self._outgoing.get(node.id, ())]
+            for node in flowchart.nodes
+        }
 
     def _dfs_has_cycle(
         self,
@@ -230,17 +244,26 @@ class ISO5807Validator:
         visited: set,
         rec_stack: set,
     ) -> bool:
+        # Iterative DFS with an explicit stack of (node, successor iterator)
+        # pairs, so long linear charts cannot hit the recursion limit.
         visited.add(node_id)
         rec_stack.add(node_id)
+        stack = [(node_id, iter(graph.get(node_id, [])))]
 
-        for neighbor in graph.get(node_id, []):
-            if neighbor not in visited:
-                if self._dfs_has_cycle(neighbor, graph, visited, rec_stack):
+        while stack:
+            current, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor in rec_stack:
                     return True
-            elif neighbor in rec_stack:
-                return True
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    rec_stack.add(neighbor)
+                    stack.append((neighbor, iter(graph.get(neighbor, []))))
+                    break
+            else:
+                stack.pop()
+                rec_stack.discard(current)
 
-        rec_stack.remove(node_id)
         return False
 
     def _has_invalid_cycles(self, flowchart: Flowchart) -> bool:
@@ -249,7 +272,15 @@ class ISO5807Validator:
         visited = set()
         rec_stack = set()
 
-        for node_id in graph:
+        # Search from the START terminator first: most loops are reachable
+        # from it, so the first DFS usually settles the answer.
+        start_id = next((node_id for node_id, (is_start, _) in self._terminator_roles.items() if is_start), None)
+        node_ids = list(graph)
+        if start_id is not None:
+            node_ids.remove(start_id)
+            node_ids.insert(0, start_id)
+
+        for node_id in node_ids:
             if node_id not in visited:
                 if self._dfs_has_cycle(node_id, graph, visited, rec_stack):
                     return True
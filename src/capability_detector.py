@@ -5,12 +5,120 @@ and Docker containers to automatically select the best extraction method and
 rendering engine for the current environment.
 """
 
+import json
 import os
 import platform
-import shutil
+import socket
 import subprocess
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from ctypes.util import find_library
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlparse
+
+# A probe returns a partial update of SystemCapabilities fields. A "warnings"
+# entry is appended to caps.warnings; all other keys overwrite the field.
+CapabilityPatch = Dict[str, Any]
+
+# Probe results are persisted so repeated CLI/API invocations skip the
+# subprocess and HTTP probes. Service reachability goes stale much faster
+# than hardware, so it gets a shorter TTL. Package and binary lookups are
+# never persisted (see _run_probes).
+CAPS_CACHE_TTL_SECONDS = 300.0
+SERVICE_CACHE_TTL_SECONDS = 30.0
+CAPS_CACHE_VERSION = 2
+
+PROBE_NAMES = ('ram', 'gpu', 'python_packages', 'binaries', 'services')
+
+# Connect timeout for service port probes: loopback answers (or refuses)
+# immediately, remote hosts get the same budget as an HTTP health check.
+LOCAL_PROBE_TIMEOUT_SECONDS = 0.5
+REMOTE_PROBE_TIMEOUT_SECONDS = 3.0
+_LOOPBACK_HOSTS = frozenset({'localhost', '127.0.0.1', '::1'})
+
+# Display order for the available_* sets (cheapest / always-on first).
+EXTRACTOR_ORDER = ('heuristic', 'ollama', 'local-llm')
+RENDERER_ORDER = ('html', 'mermaid', 'graphviz', 'd2', 'kroki')
+
+
+def ordered(values: Iterable[str], order: Iterable[str]) -> List[str]:
+    """List values in the given display order; unknown values sort last."""
+    rank = {name: index for index, name in enumerate(order)}
+    return sorted(values, key=lambda name: (rank.get(name, len(rank)), name))
+
+
+def _default_cache_path() -> Path:
+    """Resolve the on-disk capability cache file.
+
+    Priority:
+    1. FLOWCHART_CAPS_CACHE env var
+    2. ~/.cache/flowcharts/caps.json
+    """
+    override = os.environ.get('FLOWCHART_CAPS_CACHE', '').strip()
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / '.cache' / 'flowcharts' / 'caps.json'
+
+
+# get_summary() projections: (summary key, SystemCapabilities field) pairs.
+# getattr over a constant table is used rather than dataclasses.asdict(),
+# which deep-copies every field and costs ~10x the whole summary.
+_HARDWARE_SUMMARY_FIELDS = (
+    ('platform', 'platform'),
+    ('arch', 'arch'),
+    ('cpu_count', 'cpu_count'),
+    ('total_ram_gb', 'total_ram_gb'),
+    ('available_ram_gb', 'available_ram_gb'),
+    ('gpu_backend', 'gpu_backend'),
+    ('cuda_device', 'cuda_device_name'),
+    ('cuda_vram_gb', 'cuda_vram_gb'),
+)
+_OLLAMA_SUMMARY_FIELDS = (
+    ('reachable', 'ollama_reachable'),
+    ('base_url', 'ollama_base_url'),
+    ('models_count', 'ollama_models_count'),
+    ('recommended_model', 'ollama_recommended_model'),
+)
+_LOCAL_LLM_SUMMARY_FIELDS = (
+    ('has_llama_cpp', 'has_llama_cpp'),
+    ('has_instructor', 'has_instructor'),
+    ('gpu', 'gpu_backend'),
+)
+
+
+def _project(caps: 'SystemCapabilities', fields) -> Dict[str, Any]:
+    """Copy the listed capability fields into a dict under their summary keys."""
+    return {key: getattr(caps, name) for key, name in fields}
+
+
+def _usable_cpu_count() -> int:
+    """CPUs this process may run on, honoring affinity masks and cgroup pinning."""
+    if hasattr(os, 'sched_getaffinity'):
+        try:
+            return len(os.sched_getaffinity(0)) or 1
+        except OSError:
+            pass
+    return os.cpu_count() or 1
+
+
+def _port_open(url: str) -> bool:
+    """Return True if a TCP connection to the URL's host and port succeeds."""
+    try:
+        parsed = urlparse(url)
+        host = parsed.hostname or 'localhost'
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+    except ValueError:
+        return False
+    timeout = LOCAL_PROBE_TIMEOUT_SECONDS if host in _LOOPBACK_HOSTS else REMOTE_PROBE_TIMEOUT_SECONDS
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
 
 
 @dataclass
@@ -57,8 +165,8 @@ class SystemCapabilities:
     # Derived recommendations
     recommended_extraction: str = "heuristic"
     recommended_renderer: str = "mermaid"
-    available_extractors: List[str] = field(default_factory=lambda: ["heuristic"])
-    available_renderers: List[str] = field(default_factory=lambda: ["mermaid", "html"])
+    available_extractors: Set[str] = field(default_factory=lambda: {"heuristic"})
+    available_renderers: Set[str] = field(default_factory=lambda: {"mermaid", "html"})
     warnings: List[str] = field(default_factory=list)
 
 
@@ -69,92 +177,270 @@ class CapabilityDetector:
     services to determine optimal extraction and rendering strategies.
     """
 
-    def __init__(self, kroki_url: str = "http://localhost:8000", ollama_base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        kroki_url: str = "http://localhost:8000",
+        ollama_base_url: str = "http://localhost:11434",
+        cache_path: Optional[Path] = None,
+        cache_ttl: float = CAPS_CACHE_TTL_SECONDS,
+        kroki_deep_check: bool = False,
+    ):
         self.kroki_url = kroki_url
+        self.kroki_deep_check = kroki_deep_check  # GET /health instead of a port probe
         self.ollama_base_url = ollama_base_url
+        self.cache_path = Path(cache_path) if cache_path is not None else _default_cache_path()
+        self.cache_ttl = cache_ttl  # 0 disables the on-disk cache
         self._cache: Optional[SystemCapabilities] = None
+        self._patches: Dict[str, CapabilityPatch] = {}  # probe name -> result
+        self._http = None
+
+    @property
+    def http(self):
+        """Keep-alive requests.Session shared by the HTTP service probes.
+
+        Repeated refreshes (web polling, ``?refresh=true``) reuse pooled
+        connections instead of opening a new socket per probe.
+        """
+        if self._http is None:
+            import requests
+            self._http = requests.Session()
+        return self._http
 
     def detect(self, force_refresh: bool = False) -> SystemCapabilities:
         """Run full system capability detection.
 
-        Results are cached after first call unless force_refresh=True.
+        Results are cached in memory after the first call, and individual
+        probe results are reused from the on-disk cache while fresh.
+        force_refresh=True bypasses both.
         """
         if self._cache is not None and not force_refresh:
             return self._cache
+        if force_refresh:
+            self._patches.clear()
 
+        caps = self._assemble(PROBE_NAMES, force_refresh=force_refresh)
+        self._cache = caps
+        return caps
+
+    def _detect_partial(self, names) -> SystemCapabilities:
+        """Run only the named probes, reusing any that already ran.
+
+        Fields owned by other probes keep their defaults, so callers must
+        only read fields (and recommendations) backed by the probes they
+        asked for. A finished full detect() is returned as-is.
+        """
+        if self._cache is not None:
+            return self._cache
+        return self._assemble(names)
+
+    def _assemble(self, names, force_refresh: bool = False) -> SystemCapabilities:
+        """Build a SystemCapabilities from the named probes' results."""
         caps = SystemCapabilities()
-        caps.platform = platform.system()
-        caps.arch = platform.machine()
-        caps.cpu_count = os.cpu_count() or 1
-
-        self._detect_ram(caps)
-        self._detect_gpu(caps)
-        self._detect_python_packages(caps)
-        self._detect_binaries(caps)
-        self._detect_services(caps)
+        uname = platform.uname()
+        caps.platform = uname.system
+        caps.arch = uname.machine
+        caps.cpu_count = _usable_cpu_count()
+
+        self._run_probes(names, caps.platform, force_refresh)
+        # Patches are merged in a fixed order to keep warnings stable.
+        for name in PROBE_NAMES:
+            if name in self._patches:
+                self._apply_patch(caps, self._patches[name])
         self._compute_recommendations(caps)
-
-        self._cache = caps
         return caps
 
+    def _run_probes(self, names, system: str, force_refresh: bool = False) -> None:
+        """Record patches for the named probes that have not run yet."""
+        pending = [name for name in PROBE_NAMES if name in names and name not in self._patches]
+        if not pending:
+            return
+
+        # (probe, args, cache key, disk TTL). A TTL of 0 keeps the result off
+        # disk: package and PATH lookups are cheap and depend on the current
+        # interpreter and environment, which a per-user cache file cannot see.
+        probes = {
+            'ram': (self._detect_ram, (), None, self.cache_ttl),
+            'gpu': (self._detect_gpu, (system,), system, self.cache_ttl),
+            'python_packages': (self._detect_python_packages, (), None, 0),
+            'binaries': (self._detect_binaries, (), None, 0),
+            'services': (self._detect_services, (),
+                         [self.kroki_url, self.ollama_base_url, self.kroki_deep_check],
+                         min(self.cache_ttl, SERVICE_CACHE_TTL_SECONDS)),
+        }
+        disk_cache = {} if force_refresh else self._load_disk_cache()
+        now = time.time()
+
+        # The probes are independent and mostly wait on subprocesses or HTTP,
+        # so the stale ones run side by side; each is bounded by its own timeout.
+        futures: Dict[str, Future] = {}
+        fresh = {}
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            for name in pending:
+                probe, args, key, ttl = probes[name]
+                entry = disk_cache.get(name)
+                if entry and entry.get('key') == key and now - entry.get('timestamp', 0) < ttl:
+                    self._patches[name] = entry['patch']
+                else:
+                    futures[name] = executor.submit(probe, *args)
+
+            for name, future in futures.items():
+                patch = future.result()
+                self._patches[name] = patch
+                if probes[name][3] > 0:
+                    fresh[name] = {'timestamp': now, 'key': probes[name][2], 'patch': patch}
+
+        if fresh:
+            self._save_disk_cache({**disk_cache, **fresh})
+
+    def _load_disk_cache(self) -> Dict[str, Any]:
+        """Read cached probe results; any unreadable cache counts as empty."""
+        if self.cache_ttl <= 0:
+            return {}
+        try:
+            cached = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cached, dict) or cached.get('version') != CAPS_CACHE_VERSION:
+            return {}
+        probes = cached.get('probes')
+        return probes if isinstance(probes, dict) else {}
+
+    def _save_disk_cache(self, probes: Dict[str, Any]) -> None:
+        """Atomically write probe results; failures only cost a re-probe."""
+        if self.cache_ttl <= 0:
+            return
+        payload = json.dumps({'version': CAPS_CACHE_VERSION, 'probes': probes})
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_name, self.cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
+
+    @staticmethod
+    def _apply_patch(caps: SystemCapabilities, patch: CapabilityPatch) -> None:
+        """Merge a probe result into caps."""
+        for name, value in patch.items():
+            if name == 'warnings':
+                caps.warnings.extend(value)
+            else:
+                setattr(caps, name, value)
+
     # ── Hardware ──
 
-    def _detect_ram(self, caps: SystemCapabilities):
+    def _detect_ram(self) -> CapabilityPatch:
         """Detect total and available RAM."""
         try:
             import psutil
             mem = psutil.virtual_memory()
-            caps.total_ram_gb = round(mem.total / (1024 ** 3), 1)
-            caps.available_ram_gb = round(mem.available / (1024 ** 3), 1)
+            return {
+                'total_ram_gb': round(mem.total / (1024 ** 3), 1),
+                'available_ram_gb': round(mem.available / (1024 ** 3), 1),
+            }
         except ImportError:
             # Fallback: read /proc/meminfo on Linux
+            fields = {'MemTotal:': 'total_ram_gb', 'MemAvailable:': 'available_ram_gb'}
+            patch: CapabilityPatch = {}
             try:
                 with open('/proc/meminfo', 'r') as f:
                     for line in f:
-                        if line.startswith('MemTotal:'):
-                            caps.total_ram_gb = round(int(line.split()[1]) / (1024 ** 2), 1)
-                        elif line.startswith('MemAvailable:'):
-                            caps.available_ram_gb = round(int(line.split()[1]) / (1024 ** 2), 1)
+                        label, _, rest = line.partition(' ')
+                        if label in fields:
+                            patch[fields[label]] = round(int(rest.split()[0]) / (1024 ** 2), 1)
+                            if len(patch) == len(fields):
+                                break
             except Exception:
-                caps.warnings.append("Could not detect RAM. Install psutil for accurate detection.")
+                patch['warnings'] = ["Could not detect RAM. Install psutil for accurate detection."]
+            return patch
 
-    def _detect_gpu(self, caps: SystemCapabilities):
-        """Detect GPU availability for LLM acceleration."""
-        # CUDA detection
+    def _detect_cuda_nvml(self) -> Optional[CapabilityPatch]:
+        """Query the NVIDIA driver in-process via NVML (nvidia-ml-py).
+
+        Returns None when NVML cannot be used so the caller can fall back to
+        nvidia-smi; an empty patch means NVML answered and found no GPU.
+        """
+        try:
+            import pynvml
+        except ImportError:
+            return None
+        try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError:
+            return None
+        try:
+            if pynvml.nvmlDeviceGetCount() == 0:
+                return {}
+            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):  # older bindings return bytes
+                name = name.decode(errors='replace')
+            total = pynvml.nvmlDeviceGetMemoryInfo(handle).total
+            return {
+                'has_cuda': True,
+                'cuda_device_name': name,
+                'cuda_vram_gb': round(total / (1024 ** 3), 1),
+                'gpu_backend': 'cuda',
+            }
+        except pynvml.NVMLError:
+            return None
+        finally:
+            try:
+                pynvml.nvmlShutdown()
+            except pynvml.NVMLError:
+                pass
+
+    def _detect_cuda_smi(self) -> CapabilityPatch:
+        """Query the first CUDA device through the nvidia-smi binary."""
         try:
             result = subprocess.run(
                 ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
-                capture_output=True, text=True, timeout=5
+                capture_output=True, timeout=5
             )
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split(',')
-                caps.has_cuda = True
-                caps.cuda_device_name = parts[0].strip()
-                if len(parts) > 1:
-                    caps.cuda_vram_gb = round(float(parts[1].strip()) / 1024, 1)
-                caps.gpu_backend = 'cuda'
         except (FileNotFoundError, subprocess.TimeoutExpired):
+            return {}
+        # Only the first device's "name, MiB" line matters; parse the raw
+        # bytes rather than decoding the whole output through the locale.
+        line = result.stdout.strip().split(b'\n', 1)[0]
+        if result.returncode != 0 or not line:
+            return {}
+        name, _, vram = line.partition(b',')
+        patch: CapabilityPatch = {
+            'has_cuda': True,
+            'cuda_device_name': name.strip().decode('utf-8', errors='replace'),
+            'gpu_backend': 'cuda',
+        }
+        try:
+            patch['cuda_vram_gb'] = round(float(vram.strip()) / 1024, 1)
+        except ValueError:
             pass
+        return patch
 
-        # Metal detection (macOS)
-        if caps.platform == 'Darwin' and not caps.has_cuda:
-            try:
-                result = subprocess.run(
-                    ["system_profiler", "SPDisplaysDataType"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if 'Metal' in result.stdout:
-                    caps.has_metal = True
-                    caps.gpu_backend = 'metal'
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
+    def _detect_gpu(self, system: str) -> CapabilityPatch:
+        """Detect GPU availability for LLM acceleration."""
+        # CUDA detection: NVML answers in-process; nvidia-smi is the fallback
+        cuda_patch = self._detect_cuda_nvml()
+        if cuda_patch is None:
+            cuda_patch = self._detect_cuda_smi()
+        if cuda_patch:
+            return cuda_patch
+
+        # Metal detection (macOS): every Mac that runs a supported macOS has
+        # Metal, so confirming the framework exists is enough. This avoids
+        # system_profiler, which takes seconds to enumerate displays.
+        if system == 'Darwin' and find_library('Metal') is not None:
+            return {'has_metal': True, 'gpu_backend': 'metal'}
 
-        if not caps.gpu_backend:
-            caps.gpu_backend = 'cpu'
+        return {'gpu_backend': 'cpu'}
 
     # ── Python Packages ──
 
-    def _detect_python_packages(self, caps: SystemCapabilities):
+    def _detect_python_packages(self) -> CapabilityPatch:
         """Check for installed Python packages."""
         checks = {
             'has_llama_cpp': 'llama_cpp',
@@ -163,57 +449,102 @@ class CapabilityDetector:
             'has_spacy': 'spacy',
             'has_flask_socketio': 'flask_socketio',
         }
+        # find_spec only consults the import finders, so heavy packages like
+        # spaCy and llama_cpp are located without executing their module code.
+        patch: CapabilityPatch = {}
         for attr, module in checks.items():
             try:
-                __import__(module)
-                setattr(caps, attr, True)
-            except Exception:
-                setattr(caps, attr, False)
+                patch[attr] = find_spec(module) is not None
+            except (ImportError, ValueError):
+                patch[attr] = False
+        return patch
 
     # ── System Binaries ──
 
-    def _detect_binaries(self, caps: SystemCapabilities):
+    @staticmethod
+    def _scan_path(names) -> Dict[str, str]:
+        """Locate several executables in a single walk over PATH.
+
+        Like calling shutil.which() per name, but PATH is split and
+        de-duplicated once, missing directories are skipped once, and the
+        walk stops as soon as every name has been found.
+        """
+        suffixes = ('',)
+        if os.name == 'nt':
+            suffixes = tuple(ext for ext in os.environ.get('PATHEXT', '.EXE;.BAT;.CMD').split(os.pathsep) if ext)
+
+        found: Dict[str, str] = {}
+        remaining = set(names)
+        for directory in dict.fromkeys(os.environ.get('PATH', os.defpath).split(os.pathsep)):
+            if not remaining:
+                break
+            if not directory or not os.path.isdir(directory):
+                continue
+            for name in tuple(remaining):
+                for suffix in suffixes:
+                    candidate = os.path.join(directory, name + suffix)
+                    if os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+                        found[name] = candidate
+                        remaining.discard(name)
+                        break
+        return found
+
+    def _detect_binaries(self) -> CapabilityPatch:
         """Check for installed system binaries."""
-        caps.has_graphviz_binary = shutil.which('dot') is not None
-        caps.has_d2_binary = shutil.which('d2') is not None
-        caps.has_mmdc_binary = shutil.which('mmdc') is not None
-        caps.has_node = shutil.which('node') is not None
-        caps.has_docker = shutil.which('docker') is not None
+        found = self._scan_path({'dot', 'd2', 'mmdc', 'node', 'docker'})
+        return {
+            'has_graphviz_binary': 'dot' in found,
+            'has_d2_binary': 'd2' in found,
+            'has_mmdc_binary': 'mmdc' in found,
+            'has_node': 'node' in found,
+            'has_docker': 'docker' in found,
+        }
 
     # ── Services ──
 
-    def _detect_services(self, caps: SystemCapabilities):
+    def _detect_services(self) -> CapabilityPatch:
         """Check for running services (Kroki, etc.)."""
-        caps.kroki_url = self.kroki_url
-        caps.ollama_base_url = self.ollama_base_url
-        try:
-            import urllib.request
-            req = urllib.request.Request(f"{self.kroki_url}/health", method='GET')
-            with urllib.request.urlopen(req, timeout=3) as resp:
-                caps.kroki_available = resp.status == 200
-        except Exception:
-            caps.kroki_available = False
-
-        ollama_info = self.detect_ollama(caps.ollama_base_url)
-        caps.ollama_available = bool(ollama_info.get("available"))
-        caps.ollama_reachable = bool(ollama_info.get("reachable"))
-        caps.ollama_models_count = len(ollama_info.get("models") or [])
-        if caps.ollama_models_count:
-            caps.ollama_recommended_model = ollama_info["models"][0].get("name")
-        for warn in ollama_info.get("warnings") or []:
-            caps.warnings.append(warn)
+        patch: CapabilityPatch = {
+            'kroki_url': self.kroki_url,
+            'ollama_base_url': self.ollama_base_url,
+            'kroki_available': self._kroki_reachable(deep_check=self.kroki_deep_check),
+        }
+
+        ollama_info = self.detect_ollama(self.ollama_base_url)
+        models = ollama_info.get("models") or []
+        patch['ollama_available'] = bool(ollama_info.get("available"))
+        patch['ollama_reachable'] = bool(ollama_info.get("reachable"))
+        patch['ollama_models_count'] = len(models)
+        if models:
+            patch['ollama_recommended_model'] = models[0].get("name")
+        patch['warnings'] = list(ollama_info.get("warnings") or [])
+        return patch
+
+    def _kroki_reachable(self, deep_check: bool = False) -> bool:
+        """Check whether Kroki is listening.
+
+        By default this only opens a TCP connection to the Kroki port, which
+        is enough to tell a running container from a missing one.
+        deep_check=True issues GET /health and requires a 200 response.
+        """
+        if deep_check:
+            try:
+                return self.http.get(f"{self.kroki_url}/health", timeout=3).status_code == 200
+            except Exception:
+                return False
+        return _port_open(self.kroki_url)
 
     # ── Recommendation Engine ──
 
     def _compute_available_extractors(self, caps: SystemCapabilities) -> None:
-        caps.available_extractors = ['heuristic']  # Always available
+        caps.available_extractors = {'heuristic'}  # Always available
         if caps.ollama_available:
-            caps.available_extractors.append('ollama')
+            caps.available_extractors.add('ollama')
 
         if not (caps.has_llama_cpp and caps.has_instructor):
             return
         if caps.available_ram_gb >= 5.0 or caps.has_cuda or caps.has_metal:
-            caps.available_extractors.append('local-llm')
+            caps.available_extractors.add('local-llm')
             return
         caps.warnings.append(
             f"local-llm available but only {caps.available_ram_gb}GB RAM free. "
@@ -221,8 +552,7 @@ class CapabilityDetector:
         )
 
     def _compute_available_renderers(self, caps: SystemCapabilities) -> None:
-        caps.available_renderers = ['html']  # Pure Python, always available
-        caps.available_renderers.append('mermaid')
+        caps.available_renderers = {'html', 'mermaid'}  # No external tools needed
 
         if not (caps.has_mmdc_binary or caps.has_node):
             caps.warnings.append(
@@ -230,11 +560,11 @@ class CapabilityDetector:
                 "Install: npm install -g @mermaid-js/mermaid-cli"
             )
         if caps.has_graphviz_python and caps.has_graphviz_binary:
-            caps.available_renderers.append('graphviz')
+            caps.available_renderers.add('graphviz')
         if caps.has_d2_binary:
-            caps.available_renderers.append('d2')
+            caps.available_renderers.add('d2')
         if caps.kroki_available:
-            caps.available_renderers.append('kroki')
+            caps.available_renderers.add('kroki')
 
     def _recommend_extraction(self, caps: SystemCapabilities) -> None:
         if 'ollama' in caps.available_extractors:
@@ -267,7 +597,7 @@ class CapabilityDetector:
         """Probe Ollama service and list local models."""
         try:
             from src.parser.ollama_extractor import discover_ollama_models
-        except Exception:
+        except ImportError:
             return {
                 "available": False,
                 "reachable": False,
@@ -277,7 +607,19 @@ class CapabilityDetector:
                 "error": "import_error",
             }
 
-        info = discover_ollama_models(base_url=base_url or self.ollama_base_url)
+        base = (base_url or self.ollama_base_url).rstrip("/")
+        if _port_open(base):
+            info = discover_ollama_models(base_url=base, session=self.http)
+        else:
+            # Nothing is listening, so skip the HTTP request and its timeout.
+            info = {
+                "available": False,
+                "reachable": False,
+                "base_url": base,
+                "models": [],
+                "warnings": ["Could not reach Ollama service."],
+                "error": "connection_refused",
+            }
         if not info.get("reachable"):
             info.setdefault("warnings", []).append(
                 f"Ollama not reachable at {info.get('base_url')}. Start Ollama to enable ollama extraction."
@@ -288,38 +630,24 @@ class CapabilityDetector:
         """Return a JSON-friendly summary of capabilities."""
         caps = self.detect()
         return {
-            'hardware': {
-                'platform': caps.platform,
-                'arch': caps.arch,
-                'cpu_count': caps.cpu_count,
-                'total_ram_gb': caps.total_ram_gb,
-                'available_ram_gb': caps.available_ram_gb,
-                'gpu_backend': caps.gpu_backend,
-                'cuda_device': caps.cuda_device_name,
-                'cuda_vram_gb': caps.cuda_vram_gb,
-            },
+            'hardware': _project(caps, _HARDWARE_SUMMARY_FIELDS),
             'extractors': {
-                'available': caps.available_extractors,
+                'available': ordered(caps.available_extractors, EXTRACTOR_ORDER),
                 'recommended': caps.recommended_extraction,
                 'details': {
                     'heuristic': {'ready': True, 'note': 'spaCy + EntityRuler'},
                     'ollama': {
                         'ready': 'ollama' in caps.available_extractors,
-                        'reachable': caps.ollama_reachable,
-                        'base_url': caps.ollama_base_url,
-                        'models_count': caps.ollama_models_count,
-                        'recommended_model': caps.ollama_recommended_model,
+                        **_project(caps, _OLLAMA_SUMMARY_FIELDS),
                     },
                     'local-llm': {
                         'ready': 'local-llm' in caps.available_extractors,
-                        'has_llama_cpp': caps.has_llama_cpp,
-                        'has_instructor': caps.has_instructor,
-                        'gpu': caps.gpu_backend,
+                        **_project(caps, _LOCAL_LLM_SUMMARY_FIELDS),
                     },
                 },
             },
             'renderers': {
-                'available': caps.available_renderers,
+                'available': ordered(caps.available_renderers, RENDERER_ORDER),
                 'recommended': caps.recommended_renderer,
                 'details': {
                     'mermaid': {'ready': True, 'image_export': caps.has_mmdc_binary},
@@ -329,7 +657,7 @@ class CapabilityDetector:
                     'html': {'ready': True, 'note': 'Pure Python, always available'},
                 },
             },
-            'warnings': caps.warnings,
+            'warnings': list(caps.warnings),
         }
 
     def validate_config(self, config) -> List[str]:
@@ -337,7 +665,20 @@ class CapabilityDetector:
 
         Returns list of warning messages. Empty list means config is valid.
         """
-        caps = self.detect()
+        # Only run the probes behind the checks that apply to this config, so
+        # e.g. heuristic + mermaid/html never touches the GPU or the network.
+        needed = set()
+        if config.extraction == 'ollama':
+            needed.add('services')
+        if config.extraction == 'local-llm':
+            needed.update(('ram', 'gpu', 'python_packages'))
+        if config.renderer == 'graphviz':
+            needed.update(('python_packages', 'binaries'))
+        if config.renderer == 'd2':
+            needed.add('binaries')
+        if config.renderer == 'kroki':
+            needed.add('services')
+        caps = self._detect_partial(needed)
         issues = []
 
         if config.extraction == 'ollama' and 'ollama' not in caps.available_extractors:
@@ -3,14 +3,23 @@
 Keeps CLI and web API behavior consistent for supported values and aliases.
 """
 
-from typing import Dict, List, Optional
-
-VALID_EXTRACTIONS = {"heuristic", "local-llm", "ollama", "auto"}
-VALID_RENDERERS = {"mermaid", "graphviz", "d2", "kroki", "html", "auto"}
-VALID_QUANTIZATIONS = {"4bit", "5bit", "8bit"}
-VALID_DIRECTIONS = {"TD", "LR", "BT", "RL"}
-VALID_FORMATS = {"png", "svg", "pdf", "html", "mmd"}
-VALID_SPLIT_MODES = {"auto", "section", "subsection", "procedure", "none"}
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+VALID_EXTRACTIONS = frozenset({"heuristic", "local-llm", "ollama", "auto"})
+VALID_RENDERERS = frozenset({"mermaid", "graphviz", "d2", "kroki", "html", "auto"})
+VALID_QUANTIZATIONS = frozenset({"4bit", "5bit", "8bit"})
+VALID_DIRECTIONS = frozenset({"TD", "LR", "BT", "RL"})
+VALID_FORMATS = frozenset({"png", "svg", "pdf", "html", "mmd"})
+VALID_SPLIT_MODES = frozenset({"auto", "section", "subsection", "procedure", "none"})
+
+# "Valid values: ..." lists for error messages, built once at import.
+_VALID_EXTRACTIONS_MSG = ", ".join(sorted(VALID_EXTRACTIONS))
+_VALID_RENDERERS_MSG = ", ".join(sorted(VALID_RENDERERS))
+_VALID_QUANTIZATIONS_MSG = ", ".join(sorted(VALID_QUANTIZATIONS))
+_VALID_DIRECTIONS_MSG = ", ".join(sorted(VALID_DIRECTIONS))
+_VALID_FORMATS_MSG = ", ".join(sorted(VALID_FORMATS))
+_VALID_SPLIT_MODES_MSG = ", ".join(sorted(VALID_SPLIT_MODES))
 
 # Soft compatibility aliases. These emit warnings and should be removed in a future minor release.
 _EXTRACTION_ALIASES = {"llm": "local-llm"}
@@ -21,7 +30,8 @@ def _normalize_with_alias(
     normalized: Dict[str, Optional[str]],
     key: str,
     aliases: Dict[str, str],
-    valid_values: set,
+    valid_values: frozenset,
+    valid_msg: str,
     warnings: List[str],
     errors: List[str],
     label: str,
@@ -43,14 +53,15 @@ def _normalize_with_alias(
 
     if lower not in valid_values:
         errors.append(
-            f"Invalid {label.lower()} '{value}'. Valid values: {', '.join(sorted(valid_values))}"
+            f"Invalid {label.lower()} '{value}'. Valid values: {valid_msg}"
         )
 
 
 def _normalize_and_validate_lowercase(
     normalized: Dict[str, Optional[str]],
     key: str,
-    valid_values: set,
+    valid_values: frozenset,
+    valid_msg: str,
     errors: List[str],
     label: str,
 ) -> None:
@@ -62,19 +73,14 @@ def _normalize_and_validate_lowercase(
     normalized[key] = lower
     if lower not in valid_values:
         errors.append(
-            f"Invalid {label.lower()} '{value}'. Valid values: {', '.join(sorted(valid_values))}"
+            f"Invalid {label.lower()} '{value}'. Valid values: {valid_msg}"
         )
 
 
-def normalize_pipeline_options(options: Dict[str, Optional[str]]) -> Dict[str, object]:
-    """Normalize and validate pipeline options.
-
-    Returns:
-        Dict with:
-            - normalized: normalized option dictionary
-            - errors: list of blocking errors
-            - warnings: list of non-blocking warnings
-    """
+def _normalize_options(
+    options: Dict[str, Optional[str]],
+) -> Tuple[Dict[str, Optional[str]], List[str], List[str]]:
+    """Return (normalized options, errors, warnings) for a copy of options."""
     normalized = dict(options)
     errors: List[str] = []
     warnings: List[str] = []
@@ -84,6 +90,7 @@ def normalize_pipeline_options(options: Dict[str, Optional[str]]) -> Dict[str, o
         key="extraction",
         aliases=_EXTRACTION_ALIASES,
         valid_values=VALID_EXTRACTIONS,
+        valid_msg=_VALID_EXTRACTIONS_MSG,
         warnings=warnings,
         errors=errors,
         label="Extraction",
@@ -93,6 +100,7 @@ def normalize_pipeline_options(options: Dict[str, Optional[str]]) -> Dict[str, o
         key="renderer",
         aliases=_RENDERER_ALIASES,
         valid_values=VALID_RENDERERS,
+        valid_msg=_VALID_RENDERERS_MSG,
         warnings=warnings,
         errors=errors,
         label="Renderer",
@@ -101,19 +109,20 @@ def normalize_pipeline_options(options: Dict[str, Optional[str]]) -> Dict[str, o
     quantization = normalized.get("quantization")
     if quantization and quantization not in VALID_QUANTIZATIONS:
         errors.append(
-            f"Invalid quantization '{quantization}'. Valid values: {', '.join(sorted(VALID_QUANTIZATIONS))}"
+            f"Invalid quantization '{quantization}'. Valid values: {_VALID_QUANTIZATIONS_MSG}"
         )
 
     direction = normalized.get("direction")
     if direction and direction not in VALID_DIRECTIONS:
         errors.append(
-            f"Invalid direction '{direction}'. Valid values: {', '.join(sorted(VALID_DIRECTIONS))}"
+            f"Invalid direction '{direction}'. Valid values: {_VALID_DIRECTIONS_MSG}"
         )
 
     _normalize_and_validate_lowercase(
         normalized=normalized,
         key="format",
         valid_values=VALID_FORMATS,
+        valid_msg=_VALID_FORMATS_MSG,
         errors=errors,
         label="Format",
     )
@@ -121,12 +130,43 @@ def normalize_pipeline_options(options: Dict[str, Optional[str]]) -> Dict[str, o
         normalized=normalized,
         key="split_mode",
         valid_values=VALID_SPLIT_MODES,
+        valid_msg=_VALID_SPLIT_MODES_MSG,
         errors=errors,
         label="Split mode",
     )
 
+    return normalized, errors, warnings
+
+
+@lru_cache(maxsize=256)
+def _normalize_frozen(items: tuple) -> Tuple[tuple, Tuple[str, ...], Tuple[str, ...]]:
+    """Memoized _normalize_options keyed on the option items.
+
+    Only called with str/None values: 1, 1.0 and True hash and compare
+    equal, so other values could be answered from a differently typed
+    entry. Results are stored as tuples so cached entries cannot be mutated.
+    """
+    normalized, errors, warnings = _normalize_options(dict(items))
+    return tuple(normalized.items()), tuple(errors), tuple(warnings)
+
+
+def normalize_pipeline_options(options: Dict[str, Optional[str]]) -> Dict[str, object]:
+    """Normalize and validate pipeline options.
+
+    Returns:
+        Dict with:
+            - normalized: normalized option dictionary
+            - errors: list of blocking errors
+            - warnings: list of non-blocking warnings
+    """
+    if all(value is None or isinstance(value, str) for value in options.values()):
+        normalized, errors, warnings = _normalize_frozen(tuple(options.items()))
+    else:
+        # Non-string values (e.g. from JSON bodies) are normalized directly.
+        normalized, errors, warnings = _normalize_options(options)
+
     return {
-        "normalized": normalized,
-        "errors": errors,
-        "warnings": warnings,
+        "normalized": dict(normalized),
+        "errors": list(errors),
+        "warnings": list(warnings),
     }
@@ -6,15 +6,122 @@ tooltip labels for uncertain nodes.
 Enhancement 5: Warning/critical annotation styling with colors.
 """
 
+import functools
+import html
+import os
 import re
+import threading
 import unicodedata
-import html
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.models import Connection, ConnectionType, Flowchart, FlowchartNode, NodeType
+from src.models import Connection, ConnectionType, Flowchart, FlowchartNode, NodeType, is_end_label, is_start_label
 
 LOW_CONFIDENCE_THRESHOLD = 0.7
 
+# Performance notes: generation is string-allocation bound, not compute
+# bound. Under cProfile on a 5000-node chart, most time goes to label
+# rewriting on _sanitize cache misses (unescape, translate, whitespace
+# regex). The rest is per-node f-strings and method dispatch. Nothing here
+# is numeric, so vectorized or native kernels have nothing to work on. Wins
+# come from fewer passes over the data and from caching repeated labels and
+# charts. Profile a large chart before adding further micro-optimizations.
+
+# Characters outside this set are blanked out of labels. < and > are allowed
+# so the <br/> line-break tags survive sanitization.
+_SANITIZE_STRIP_RE = re.compile(r'[^a-zA-Z0-9\s.,;:!?\'\"\-_/\\=+<>]')
+_COLLAPSE_WS_RE = re.compile(r'[ \t\r]+')
+_NON_ID_CHAR_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# Arrow glyphs have no NFKD decomposition and would be dropped by the ASCII
+# encode, so they are spelled out before it. A character-class regex finds
+# them in one scan; str.translate with a dict measured ~5x slower on
+# non-ASCII text because every non-arrow character is a failed lookup.
+_ARROW_REPLACEMENTS = {
+    '\u2192': '->', '\u2190': '<-', '\u2191': '^', '\u2193': 'v',
+    '\u21d2': '=>', '\u21d0': '<=', '\u2794': '->', '\u279e': '->',
+    '\u279c': '->', '\u25b6': '->', '\u25c0': '<-',
+}
+_ARROW_RE = re.compile('[' + ''.join(_ARROW_REPLACEMENTS) + ']')
+
+
+def _spell_arrow(match: re.Match) -> str:
+    return _ARROW_REPLACEMENTS[match.group()]
+
+
+def _ascii_translate_table(overrides: Optional[Dict[str, str]] = None) -> bytes:
+    """bytes.translate table that blanks characters _SANITIZE_STRIP_RE rejects."""
+    table = bytearray(range(256))
+    for code in range(128):
+        if _SANITIZE_STRIP_RE.match(chr(code)):
+            table[code] = ord(' ')
+    for char, replacement in (overrides or {}).items():
+        table[ord(char)] = ord(replacement)
+    return bytes(table)
+
+
+# Text is ASCII-encoded before stripping, so removing disallowed characters
+# (and, for labels, escaping) is a single bytes.translate over that buffer.
+_SANITIZE_TABLE = _ascii_translate_table()
+# Mermaid flowchart labels are not JSON strings; backslash-quote can break
+# parsing, so labels also normalize double quotes to apostrophes.
+_LABEL_TABLE = _ascii_translate_table({'"': "'"})
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize(text: str, table: bytes) -> str:
+    """Strip text down to Mermaid-safe ASCII using a translate table.
+
+    Labels repeat heavily within and across flowcharts ("Yes", "No",
+    "End", shared step names), so results are memoized.
+    """
+    if not text:
+        return text
+
+    # Normalize any HTML entities from imported/extracted text.
+    text = html.unescape(text)
+
+    # Protect our intentional line breaks by converting them to Mermaid HTML tags
+    text = text.replace('\n', '<br/>')
+
+    if text.isascii():
+        # Common case: nothing to decompose, transliterate or drop.
+        data = text.encode('ascii')
+    else:
+        text = _ARROW_RE.sub(_spell_arrow, text)
+        try:
+            data = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore')
+        except Exception:
+            data = ''.join(char for char in text if ord(char) < 128).encode('ascii')
+    text = data.translate(table).decode('ascii')
+
+    # Don't flatten all whitespace (which destroys spacing around tags).
+    # Labels with only single spaces are left alone: the substitution would
+    # be a no-op that still replaces every space, most of a miss's cost.
+    if '  ' in text or '\t' in text or '\r' in text:
+        text = _COLLAPSE_WS_RE.sub(' ', text)
+    return text.strip()
+
+
+def _sanitize_truncated(text: str, table: bytes, max_len: int) -> str:
+    """Sanitize text and cap it at max_len characters with an ellipsis.
+
+    Very long input is cut at a space first. Sanitizing never merges text
+    across a space (entities, decompositions and whitespace runs stop
+    there), so the head's output is a prefix of the full output and the
+    rest need not be processed once the head alone is over the limit.
+    """
+    if len(text) > 2 * max_len:
+        cut = text.find(' ', 2 * max_len)
+        if cut != -1:
+            head = _sanitize(text[:cut], table)
+            if len(head) > max_len:
+                return head[:max_len - 3] + "..."
+    text = _sanitize(text, table)
+    if len(text) > max_len:
+        text = text[:max_len - 3] + "..."
+    return text
+
 
 class MermaidGenerator:
     """Generate Mermaid.js flowchart syntax from Flowchart model."""
@@ -46,152 +153,130 @@ class MermaidGenerator:
         NodeType.CONNECTOR: "Connector",
     }
 
+    # Bound str.format of each shape template, so a node is one lookup + call.
+    _SHAPE_FORMATTERS = {
+        node_type: template.format for node_type, (template, _) in NODE_TYPE_TO_SHAPE.items()
+    }
+    _DEFAULT_SHAPE_FORMATTER = "[{}]".format
+
+    # Loop-back edges use dotted lines; every other edge is a solid arrow.
+    _CONNECTION_ARROWS = {ConnectionType.LOOP: "-.->"}
+
+    # (bucket, style) pairs in emission order. Loop targets are styled
+    # between the two tables so warning levels still take precedence.
+    _NODE_STYLE_TABLE = (
+        ("start_nodes", "fill:#90EE90,stroke:#333,stroke-width:2px"),
+        ("end_nodes", "fill:#FFB6C1,stroke:#333,stroke-width:2px"),
+        ("decision_nodes", "fill:#FFE4B5,stroke:#333,stroke-width:2px"),
+        ("predefined_nodes", "fill:#B0E0E6,stroke:#2196F3,stroke-width:2px"),
+        ("low_confidence_nodes", "stroke:#FF9800,stroke-width:3px,stroke-dasharray: 5 5"),
+    )
+    _LOOP_TARGET_STYLE = "fill:#E8D5F5,stroke:#9C27B0,stroke-width:2px"
+    _WARNING_STYLE_TABLE = (
+        ("critical_nodes", "stroke:#D32F2F,stroke-width:4px,fill:#FFCDD2"),
+        ("warning_nodes", "stroke:#F57C00,stroke-width:3px,fill:#FFE0B2"),
+        ("note_nodes", "stroke:#1976D2,stroke-width:2px,fill:#BBDEFB"),
+    )
+
+    THEMED_CACHE_SIZE = 64
+
+    # UIs re-render the same chart repeatedly, so themed output is memoized
+    # per generator class on a fingerprint of every field generation reads.
+    # Flowcharts are mutable, so the key is built from content, not id().
+    _themed_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+    _themed_cache_lock = threading.Lock()
+
+    _WARMED = False
+
     def __init__(self):
         self.direction = "TD"
 
+    @classmethod
+    def warm(cls) -> None:
+        """Run one throwaway generation so first real requests skip cold-start costs.
+
+        There is no template to compile and the label regexes are compiled at
+        import; the remaining first-call cost is the unicode table loading
+        inside ``_sanitize``.
+        Safe to call repeatedly; only the first call does any work.
+        """
+        if cls._WARMED:
+            return
+        nodes = [
+            FlowchartNode(id=f"W{index}", node_type=node_type, label=f"Warm {node_type.value} \u2192 &amp; ok")
+            for index, node_type in enumerate(cls.NODE_TYPE_TO_SHAPE)
+        ]
+        connections = [
+            Connection(from_node=nodes[index].id, to_node=nodes[index + 1].id, label="yes")
+            for index in range(len(nodes) - 1)
+        ]
+        cls().generate(Flowchart(nodes=nodes, connections=connections, title="Warm"))
+        cls._WARMED = True
+
     def generate(self, flowchart: Flowchart, direction: str = "TD") -> str:
         """Generate Mermaid.js flowchart code."""
         self.direction = direction
-        lines = []
-
-        lines.append(f"flowchart {self.direction}")
+        lines = [f"flowchart {self.direction}"]
 
         if flowchart.title:
             lines.append(f"    %% {self._sanitize_text(flowchart.title)}")
 
         # Node definitions
-        grouped_nodes = {}
+        grouped_nodes: Dict[Optional[str], List[FlowchartNode]] = {}
         for node in flowchart.nodes:
-            group_name = getattr(node, "group", None)
-            if group_name not in grouped_nodes:
-                grouped_nodes[group_name] = []
-            grouped_nodes[group_name].append(node)
+            grouped_nodes.setdefault(getattr(node, "group", None), []).append(node)
 
+        generate_node = self._generate_node
         for group_name, nodes in grouped_nodes.items():
             if group_name:
                 # Create a stable, unique subgraph ID from the group name
-                safe_group_id = re.sub(r'[^a-zA-Z0-9]', '_', group_name)
+                safe_group_id = _NON_ID_CHAR_RE.sub('_', group_name)
                 lines.append(f"    subgraph {safe_group_id} [\"{self._sanitize_text(group_name)}\"]")
-                for node in nodes:
-                    node_def = self._generate_node(node)
-                    lines.append(f"        {node_def}")
+                lines.extend([f"        {generate_node(node)}" for node in nodes])
                 lines.append("    end")
             else:
-                for node in nodes:
-                    node_def = self._generate_node(node)
-                    lines.append(f"    {node_def}")
+                lines.extend([f"    {generate_node(node)}" for node in nodes])
 
         lines.append("")
 
-        # Connections
+        # Connections; loop targets are collected in the same pass for styling
+        generate_connection = self._generate_connection
+        add_line = lines.append
+        loop_target_ids = set()
+        add_loop_target = loop_target_ids.add
+        loop = ConnectionType.LOOP
         for connection in flowchart.connections:
-            conn_def = self._generate_connection(connection)
-            lines.append(f"    {conn_def}")
+            if connection.connection_type == loop:
+                add_loop_target(connection.to_node)
+            add_line(f"    {generate_connection(connection)}")
 
         # Styling
         lines.append("")
-        lines.extend(self._generate_styles(flowchart))
+        lines.extend(self._generate_styles(flowchart, loop_target_ids))
 
         return "\n".join(lines)
 
     def _sanitize_text(self, text: str) -> str:
         """Sanitize text for safe Mermaid parsing."""
-        if not text:
-            return text
-
-        # Normalize any HTML entities from imported/extracted text.
-        text = html.unescape(text)
-        
-        # Protect our intentional line breaks by converting them to Mermaid HTML tags
-        text = text.replace('\n', '<br/>')
-
-        try:
-            text = unicodedata.normalize('NFKD', text)
-            text = text.encode('ascii', 'ignore').decode('ascii')
-        except Exception:
-            text = ''.join(char for char in text if ord(char) < 128)
-
-        arrow_replacements = {
-            '\u2192': '->', '\u2190': '<-', '\u2191': '^', '\u2193': 'v',
-            '\u21d2': '=>', '\u21d0': '<=', '\u2794': '->', '\u279e': '->',
-            '\u279c': '->', '\u25b6': '->', '\u25c0': '<-',
-        }
-        for uc, asc in arrow_replacements.items():
-            text = text.replace(uc, asc)
-
-        # ALLOW < and > so our <br/> tags survive sanitization
-        text = re.sub(r'[^a-zA-Z0-9\s.,;:!?\'\"\-_/\\=+<>]', ' ', text)
-        
-        # Don't flatten all whitespace (which destroys spacing around tags)
-        text = re.sub(r'[ \t\r]+', ' ', text)
-        return text.strip()
+        return _sanitize(text, _SANITIZE_TABLE)
 
     def _generate_node(self, node: FlowchartNode) -> str:
         """Generate Mermaid node definition."""
-        shape_template, _ = self.NODE_TYPE_TO_SHAPE.get(
-            node.node_type,
-            ("[{}]", "rect")
-        )
-
-        label = self._sanitize_text(node.label)
-        label = self._escape_label(label)
+        format_shape = self._SHAPE_FORMATTERS.get(node.node_type, self._DEFAULT_SHAPE_FORMATTER)
 
         # Don't add confidence annotations to labels - causes Mermaid parse errors
         # Low confidence is already indicated by visual styling (dashed borders)
+        label = _sanitize_truncated(node.label, _LABEL_TABLE, 120)
 
-        if len(label) > 120:
-            label = label[:117] + "..."
-
-        node_def = f"{node.id}{shape_template.format(label)}"
-        return node_def
+        return f"{node.id}{format_shape(label)}"
 
     def _generate_connection(self, connection: Connection) -> str:
         """Generate Mermaid connection definition with loop styling."""
-        # Loop-back edges use dotted lines
-        if connection.connection_type == ConnectionType.LOOP:
-            arrow = "-.->"
-        else:
-            arrow = "-->"
-
+        arrow = self._CONNECTION_ARROWS.get(connection.connection_type, "-->")
         if connection.label:
-            label = self._sanitize_text(connection.label)
-            label = self._escape_label(label)
-            if len(label) > 50:
-                label = label[:47] + "..."
+            label = _sanitize_truncated(connection.label, _LABEL_TABLE, 50)
             return f"{connection.from_node} {arrow}|{label}| {connection.to_node}"
-        else:
-            return f"{connection.from_node} {arrow} {connection.to_node}"
-
-    def _escape_label(self, text: str) -> str:
-        """Escape special characters in labels for Mermaid."""
-        # Keep rendered labels human-readable in exported artifacts.
-        # Avoid HTML entities so text like apostrophes does not become '&#39;'.
-        text = text.replace('|', '/')
-        # Mermaid flowchart labels are not JSON strings; backslash-quote can break parsing.
-        # Normalize double-quotes to apostrophes for parser-safe labels.
-        text = text.replace('"', "'")
-        return text
-
-    def _bucket_warning_level(self, buckets: Dict[str, List[str]], node: FlowchartNode) -> None:
-        warning_level = getattr(node, 'warning_level', '')
-        if warning_level == 'critical':
-            buckets["critical_nodes"].append(node.id)
-        elif warning_level == 'warning':
-            buckets["warning_nodes"].append(node.id)
-        elif warning_level == 'note':
-            buckets["note_nodes"].append(node.id)
-
-    def _bucket_node_type(self, buckets: Dict[str, List[str]], node: FlowchartNode) -> None:
-        if node.node_type == NodeType.TERMINATOR:
-            label = node.label.lower()
-            if "start" in label or "begin" in label:
-                buckets["start_nodes"].append(node.id)
-            elif "end" in label or "finish" in label:
-                buckets["end_nodes"].append(node.id)
-        elif node.node_type == NodeType.DECISION:
-            buckets["decision_nodes"].append(node.id)
-        elif node.node_type == NodeType.PREDEFINED:
-            buckets["predefined_nodes"].append(node.id)
+        return f"{connection.from_node} {arrow} {connection.to_node}"
 
     def _classify_style_buckets(self, flowchart: Flowchart) -> Dict[str, List[str]]:
         buckets = {
@@ -204,56 +289,106 @@ class MermaidGenerator:
             "warning_nodes": [],
             "note_nodes": [],
         }
+        # One pass over the nodes with the bucket appends bound up front.
+        add_start = buckets["start_nodes"].append
+        add_end = buckets["end_nodes"].append
+        add_decision = buckets["decision_nodes"].append
+        add_low_confidence = buckets["low_confidence_nodes"].append
+        add_predefined = buckets["predefined_nodes"].append
+        add_by_warning_level = {
+            'critical': buckets["critical_nodes"].append,
+            'warning': buckets["warning_nodes"].append,
+            'note': buckets["note_nodes"].append,
+        }
+        terminator, decision, predefined = NodeType.TERMINATOR, NodeType.DECISION, NodeType.PREDEFINED
 
         for node in flowchart.nodes:
-            confidence = getattr(node, 'confidence', 1.0)
-            self._bucket_warning_level(buckets, node)
-            self._bucket_node_type(buckets, node)
-
-            if confidence < LOW_CONFIDENCE_THRESHOLD:
-                buckets["low_confidence_nodes"].append(node.id)
+            node_id = node.id
+            add_warning = add_by_warning_level.get(getattr(node, 'warning_level', ''))
+            if add_warning is not None:
+                add_warning(node_id)
+
+            node_type = node.node_type
+            if node_type == terminator:
+                label = node.label
+                if is_start_label(label):
+                    add_start(node_id)
+                elif is_end_label(label):
+                    add_end(node_id)
+            elif node_type == decision:
+                add_decision(node_id)
+            elif node_type == predefined:
+                add_predefined(node_id)
+
+            if getattr(node, 'confidence', 1.0) < LOW_CONFIDENCE_THRESHOLD:
+                add_low_confidence(node_id)
 
         return buckets
 
     def _collect_loop_targets(self, flowchart: Flowchart) -> set[str]:
-        loop_target_ids = set()
-        for conn in flowchart.connections:
-            if conn.connection_type == ConnectionType.LOOP:
-                loop_target_ids.add(conn.to_node)
-        return loop_target_ids
-
-    def _append_style_group(self, styles: List[str], node_ids: List[str], style_suffix: str) -> None:
-        for node_id in node_ids:
-            styles.append(f"    style {node_id} {style_suffix}")
+        loop = ConnectionType.LOOP
+        return {conn.to_node for conn in flowchart.connections if conn.connection_type == loop}
 
-    def _generate_styles(self, flowchart: Flowchart) -> List[str]:
+    def _generate_styles(self, flowchart: Flowchart, loop_target_ids: Optional[set[str]] = None) -> List[str]:
         """Generate CSS styling for special and low-confidence nodes.
 
         Enhancement 5: Added warning-level styling (critical=red, warning=orange, note=blue).
+        ``loop_target_ids`` may be passed in when the caller already walked the
+        connections; otherwise they are collected here.
         """
-        styles = []
         buckets = self._classify_style_buckets(flowchart)
-        loop_target_ids = self._collect_loop_targets(flowchart)
-
-        self._append_style_group(styles, buckets["start_nodes"], "fill:#90EE90,stroke:#333,stroke-width:2px")
-        self._append_style_group(styles, buckets["end_nodes"], "fill:#FFB6C1,stroke:#333,stroke-width:2px")
-        self._append_style_group(styles, buckets["decision_nodes"], "fill:#FFE4B5,stroke:#333,stroke-width:2px")
-        self._append_style_group(styles, buckets["predefined_nodes"], "fill:#B0E0E6,stroke:#2196F3,stroke-width:2px")
-        self._append_style_group(
-            styles,
-            buckets["low_confidence_nodes"],
-            "stroke:#FF9800,stroke-width:3px,stroke-dasharray: 5 5"
-        )
+        if loop_target_ids is None:
+            loop_target_ids = self._collect_loop_targets(flowchart)
+
+        styles = [
+            f"    style {node_id} {style_suffix}"
+            for bucket_name, style_suffix in self._NODE_STYLE_TABLE
+            for node_id in buckets[bucket_name]
+        ]
+        terminal_ids = set(buckets["start_nodes"])
+        terminal_ids.update(buckets["end_nodes"])
+        styles.extend([
+            f"    style {node_id} {self._LOOP_TARGET_STYLE}"
+            for node_id in loop_target_ids
+            if node_id not in terminal_ids
+        ])
+        styles.extend([
+            f"    style {node_id} {style_suffix}"
+            for bucket_name, style_suffix in self._WARNING_STYLE_TABLE
+            for node_id in buckets[bucket_name]
+        ])
+        return styles
 
-        for node_id in loop_target_ids:
-            if node_id not in buckets["start_nodes"] and node_id not in buckets["end_nodes"]:
-                styles.append(f"    style {node_id} fill:#E8D5F5,stroke:#9C27B0,stroke-width:2px")
+    @classmethod
+    def clear_themed_cache(cls) -> None:
+        """Drop all memoized generate_with_theme results."""
+        with cls._themed_cache_lock:
+            cls._themed_cache.clear()
 
-        self._append_style_group(styles, buckets["critical_nodes"], "stroke:#D32F2F,stroke-width:4px,fill:#FFCDD2")
-        self._append_style_group(styles, buckets["warning_nodes"], "stroke:#F57C00,stroke-width:3px,fill:#FFE0B2")
-        self._append_style_group(styles, buckets["note_nodes"], "stroke:#1976D2,stroke-width:2px,fill:#BBDEFB")
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Drop memoized label sanitization and themed output.
 
-        return styles
+        Both caches are bounded; this is for long-running processes that
+        want to release the memory or start from a clean slate.
+        """
+        _sanitize.cache_clear()
+        cls.clear_themed_cache()
+
+    @staticmethod
+    def _fingerprint(flowchart: Flowchart) -> Tuple[Any, ...]:
+        """Hashable snapshot of every flowchart field that affects the output."""
+        return (
+            flowchart.title,
+            tuple(
+                (node.id, node.node_type, node.label, node.confidence, node.warning_level, node.group)
+                for node in flowchart.nodes
+            ),
+            tuple(
+                (connection.from_node, connection.to_node, connection.connection_type, connection.label)
+                for connection in flowchart.connections
+            ),
+        )
 
     def generate_with_theme(
         self,
@@ -261,8 +396,29 @@ class MermaidGenerator:
         theme: str = "default",
         direction: str = "TD",
     ) -> str:
-        """Generate Mermaid code with specific theme and strict routing."""
+        """Generate Mermaid code with specific theme and strict routing.
+
+        Results are memoized per flowchart content, theme and direction.
+        """
+        cls = type(self)
+        key = (cls, theme, direction, self._fingerprint(flowchart))
+        with cls._themed_cache_lock:
+            cached = cls._themed_cache.get(key)
+            if cached is not None:
+                cls._themed_cache.move_to_end(key)
+                self.direction = direction
+                return cached
+
         code = self.generate(flowchart, direction=direction)
         # Changed to basis for smooth routing to prevent overlapping lines
         theme_line = f"%%{{init: {{'theme':'{theme}', 'flowchart': {{'curve': 'basis'}}}}}}%%"
-        return f"{theme_line}\n{code}"
+        themed = f"{theme_line}\n{code}"
+        with cls._themed_cache_lock:
+            cls._themed_cache[key] = themed
+            if len(cls._themed_cache) > self.THEMED_CACHE_SIZE:
+                cls._themed_cache.popitem(last=False)
+        return themed
+
+
+if os.environ.get("FLOWCHART_WARM"):
+    MermaidGenerator.warm()
@@ -2,10 +2,73 @@
 
 import logging
 import re
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Workflow indicator keywords
+_WORKFLOW_KEYWORDS = (
+    'workflow', 'process', 'procedure', 'steps', 'flow',
+    'algorithm', 'sequence', 'instructions', 'guide',
+    'start', 'begin', 'initialize', 'end', 'finish'
+)
+
+# Patterns are compiled once here; these helpers run per line over whole documents.
+# Callers check a line's first character before the anchored step, bullet and
+# heading patterns, so most lines never enter the regex engine.
+_WORKFLOW_KEYWORD_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, _WORKFLOW_KEYWORDS)) + r')\b')
+_NOT_HEADER_STEP_RE = re.compile(r'^(?:\d+[\.\)\:\-\s]|Step\s+\d+\b)', re.IGNORECASE)
+_DASH_BULLET_RE = re.compile(r'^[-*]\s+')
+_DASH_BULLET_PREFIX_RE = re.compile(r'^[-*]\s*')
+_MD_HEADER_RE = re.compile(r'^#+\s+')
+_HEADING_MARK_RE = re.compile(r'^#+\s*')
+_NUMBERED_STEP_RE = re.compile(r'^\d+[\.\)]\s+')
+_NUMBERED_STEP_PARTS_RE = re.compile(r'^(\d+)[\)\.]\s+(.+)$')
+_BULLET_RE = re.compile(r'^[\-\*•]\s+')
+_BULLET_MARKS = ('-', '*', '•')
+_DECISION_WORD_RE = re.compile(r'\b(if|then|else|check|validate)\b')
+_SUMMARY_DECISION_WORD_RE = re.compile(r'\b(if|check|validate|verify)\b')
+_START_WORD_RE = re.compile(r'\b(start|begin)\b')
+_END_WORD_RE = re.compile(r'\b(end|finish|complete)\b')
+_BRANCH_START_RE = re.compile(r'^(if|when|once|then|otherwise|yes:|no:)', re.IGNORECASE)
+_WORD_SPLIT_RE = re.compile(r'[\s/:-]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_TOC_PAGE_RE = re.compile(r'\.{3,}\s*\d+\s*$')
+_TOC_SECTION_RE = re.compile(r'(section\s+\d+|\d+\.\d+)', re.IGNORECASE)
+_COMPACT_BULLET_RE = re.compile(r'^\s*[-*]\s*')
+_COMPACT_LETTER_STEP_RE = re.compile(r'^\s*[a-zA-Z][\.\)]\s+')
+_COMPACT_BRANCH_RE = re.compile(r'^\s*(yes|no|true|false)\s*[:\-]\s*', re.IGNORECASE)
+
+# _clean_text: page furniture, branch markers and excess whitespace
+_BOILERPLATE_RE = re.compile(
+    r'^\s*(confidential|internal use only|for training only)\s*$', re.IGNORECASE | re.MULTILINE
+)
+_PAGE_NUMBER_RE = re.compile(r'^\s*page\s+\d+(\s+of\s+\d+)?\s*$', re.IGNORECASE | re.MULTILINE)
+_COPYRIGHT_RE = re.compile(r'^\s*(copyright|all rights reserved).*$', re.IGNORECASE | re.MULTILINE)
+_PAGE_HEADER_RE = re.compile(r'^\s*(Page|Document|Section)\s+\d+.*$', re.IGNORECASE | re.MULTILINE)
+_BRANCH_MARKER_RE = re.compile(r'(?im)^\s*(yes|no|true|false)\s*[>\-:]\s*')
+_ELSE_MARKER_RE = re.compile(r'(?im)^\s*(otherwise|else)\s*[:>\-]\s*')
+_IF_ARROW_RE = re.compile(r'(?im)^\s*if\s+([^:\n]+?)\s*[-–—>]+\s*')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_INLINE_SPACES_RE = re.compile(r'[ \t]{2,}')
+
+
+@dataclass(frozen=True)
+class _TextStats:
+    """Line statistics gathered by ContentExtractor._analyze in one pass."""
+
+    too_short: bool
+    total_lines: int
+    numbered_steps: int
+    keyword_count: int
+    loose_decision_lines: int
+    decision_lines: int
+    summary_decision_lines: int
+    bullet_points: int
+    has_start: bool
+    has_end: bool
+
 
 class ContentExtractor:
     """Extract and identify workflow content from raw document text."""
@@ -59,11 +122,7 @@ class ContentExtractor:
         ]
 
         # Workflow indicator keywords
-        self.workflow_keywords = [
-            'workflow', 'process', 'procedure', 'steps', 'flow',
-            'algorithm', 'sequence', 'instructions', 'guide',
-            'start', 'begin', 'initialize', 'end', 'finish'
-        ]
+        self.workflow_keywords = list(_WORKFLOW_KEYWORDS)
 
     def extract_workflows(self, text: str) -> List[Dict[str, Any]]:
         """Extract all workflows from text.
@@ -136,22 +195,20 @@ class ContentExtractor:
         """Identify distinct sections in the document."""
         sections = []
         current_section = None
+        is_header = self._is_header
 
         for i, line in enumerate(lines):
             # Check if line is a header
-            if self._is_header(line):
+            if is_header(line):
                 # Save previous section if exists
                 if current_section:
                     current_section['end_line'] = i - 1
                     current_section['content'] = '\n'.join(
                         lines[current_section['start_line']:current_section['end_line'] + 1]
                     )
-                    current_section['is_workflow'] = self._looks_like_workflow(
-                        current_section['content']
-                    )
-                    current_section['confidence'] = self._calculate_confidence(
-                        current_section['content']
-                    )
+                    stats = self._analyze(current_section['content'])
+                    current_section['is_workflow'] = self._workflow_verdict(stats)
+                    current_section['confidence'] = self._confidence_score(stats)
                     sections.append(current_section)
 
                 # Start new section
@@ -170,12 +227,9 @@ class ContentExtractor:
             current_section['content'] = '\n'.join(
                 lines[current_section['start_line']:current_section['end_line'] + 1]
             )
-            current_section['is_workflow'] = self._looks_like_workflow(
-                current_section['content']
-            )
-            current_section['confidence'] = self._calculate_confidence(
-                current_section['content']
-            )
+            stats = self._analyze(current_section['content'])
+            current_section['is_workflow'] = self._workflow_verdict(stats)
+            current_section['confidence'] = self._confidence_score(stats)
             sections.append(current_section)
 
         return sections
@@ -187,13 +241,13 @@ class ContentExtractor:
         if not line:
             return False
 
-        if re.match(r'^(?:\d+[\.\)\:\-\s]|Step\s+\d+\b)', line, re.IGNORECASE):
+        if _NOT_HEADER_STEP_RE.match(line):
             return False
-        if re.match(r'^[-*]\s+', line):
+        if line.startswith(('-', '*')) and _DASH_BULLET_RE.match(line):
             return False
 
         # Markdown header
-        if re.match(r'^#+\s+', line):
+        if line.startswith('#') and _MD_HEADER_RE.match(line):
             return True
 
         # ALL CAPS (but not too long)
@@ -201,89 +255,100 @@ class ContentExtractor:
             return True
 
         # Contains workflow keywords
-        lower_line = line.lower()
-        for keyword in self.workflow_keywords:
-            if re.search(rf'\b{re.escape(keyword)}\b', lower_line) and len(line) < 80:
-                return True
-
-        return False
-
-    def _looks_like_workflow(self, text: str) -> bool:
-        """Determine if text looks like a workflow."""
-        if not text or len(text.strip()) < 20:
-            return False
+        return len(line) < 80 and _WORKFLOW_KEYWORD_RE.search(line.lower()) is not None
 
+    def _analyze(self, text: str) -> _TextStats:
+        """Scan text once, collecting every statistic the workflow heuristics use."""
         lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lower_text = text.lower()
 
-        if len(lines) < 2:
-            return False
-
-        # Count numbered steps
-        numbered_steps = 0
+        numbered_steps = loose_decision_lines = decision_lines = 0
+        summary_decision_lines = bullet_points = 0
         for line in lines:
-            if re.match(r'^\d+[\.\)]\s+', line):
+            lower_line = line.lower()
+            if line[:1].isdecimal() and _NUMBERED_STEP_RE.match(line):
                 numbered_steps += 1
+            if line.startswith(_BULLET_MARKS) and _BULLET_RE.match(line):
+                bullet_points += 1
+            # Every decision word contains one of these substrings, so lines
+            # without any of them skip the word-boundary regexes entirely.
+            loose_decision = (
+                'if' in lower_line or 'then' in lower_line
+                or 'else' in lower_line or 'check' in lower_line
+            )
+            if loose_decision:
+                loose_decision_lines += 1
+            if loose_decision or 'validate' in lower_line:
+                if _DECISION_WORD_RE.search(lower_line):
+                    decision_lines += 1
+            if loose_decision or 'validate' in lower_line or 'verify' in lower_line:
+                if _SUMMARY_DECISION_WORD_RE.search(lower_line):
+                    summary_decision_lines += 1
+
+        return _TextStats(
+            too_short=not text or len(text.strip()) < 20,
+            total_lines=len(lines),
+            numbered_steps=numbered_steps,
+            keyword_count=sum(1 for kw in self.workflow_keywords if kw in lower_text),
+            loose_decision_lines=loose_decision_lines,
+            decision_lines=decision_lines,
+            summary_decision_lines=summary_decision_lines,
+            bullet_points=bullet_points,
+            has_start=_START_WORD_RE.search(lower_text) is not None,
+            has_end=_END_WORD_RE.search(lower_text) is not None,
+        )
+
+    def _workflow_verdict(self, stats: _TextStats) -> bool:
+        """Decide from analyzed stats whether text looks like a workflow."""
+        if stats.too_short or stats.total_lines < 2:
+            return False
 
         # If more than 2 numbered steps, likely a workflow
-        if numbered_steps >= 2:
+        if stats.numbered_steps >= 2:
             return True
 
         # Check for workflow keywords
-        lower_text = text.lower()
-        keyword_count = sum(1 for kw in self.workflow_keywords if kw in lower_text)
-
-        if keyword_count >= 2:
+        if stats.keyword_count >= 2:
             return True
 
         # Check for decision indicators
-        decision_count = sum(
-            1 for line in lines
-            if any(pattern in line.lower() for pattern in ['if', 'then', 'else', 'check'])
-        )
-
-        if decision_count >= 1 and numbered_steps >= 1:
-            return True
+        return stats.loose_decision_lines >= 1 and stats.numbered_steps >= 1
 
-        return False
-
-    def _calculate_confidence(self, text: str) -> float:
-        """Calculate confidence score that text is a workflow (0-1)."""
-        if not text or len(text.strip()) < 20:
+    def _confidence_score(self, stats: _TextStats) -> float:
+        """Score analyzed stats as the likelihood of a workflow (0-1)."""
+        if stats.too_short or not stats.total_lines:
             return 0.0
 
         score = 0.0
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-
-        if not lines:
-            return 0.0
 
         # Count numbered steps
-        numbered_steps = sum(1 for line in lines if re.match(r'^\d+[\.\)]\s+', line))
-        if numbered_steps >= 3:
+        if stats.numbered_steps >= 3:
             score += 0.4
-        elif numbered_steps >= 2:
+        elif stats.numbered_steps >= 2:
             score += 0.2
 
         # Check for workflow keywords
-        lower_text = text.lower()
-        keyword_count = sum(1 for kw in self.workflow_keywords if kw in lower_text)
-        score += min(keyword_count * 0.1, 0.3)
+        score += min(stats.keyword_count * 0.1, 0.3)
 
         # Check for decision branches
-        decision_count = sum(
-            1 for line in lines
-            if re.search(r'\b(if|then|else|check|validate)\b', line.lower())
-        )
-        score += min(decision_count * 0.1, 0.2)
+        score += min(stats.decision_lines * 0.1, 0.2)
 
         # Check for start/end indicators
-        if re.search(r'\b(start|begin)\b', text.lower()):
+        if stats.has_start:
             score += 0.1
-        if re.search(r'\b(end|finish|complete)\b', text.lower()):
+        if stats.has_end:
             score += 0.1
 
         return min(score, 1.0)
 
+    def _looks_like_workflow(self, text: str) -> bool:
+        """Determine if text looks like a workflow."""
+        return self._workflow_verdict(self._analyze(text))
+
+    def _calculate_confidence(self, text: str) -> float:
+        """Calculate confidence score that text is a workflow (0-1)."""
+        return self._confidence_score(self._analyze(text))
+
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for workflow processing."""
         # Normalize line endings and common unicode markers first
@@ -293,36 +358,37 @@ class ContentExtractor:
         text = text.replace('\u2713', '').replace('\u2022', '- ').replace('\uf0b7', '- ')
 
         # Remove page furniture and repeated boilerplate
-        text = re.sub(r'^\s*(confidential|internal use only|for training only)\s*$', '', text, flags=re.IGNORECASE | re.MULTILINE)
-        text = re.sub(r'^\s*page\s+\d+(\s+of\s+\d+)?\s*$', '', text, flags=re.IGNORECASE | re.MULTILINE)
-        text = re.sub(r'^\s*(copyright|all rights reserved).*$','', text, flags=re.IGNORECASE | re.MULTILINE)
-        text = re.sub(r'^\s*(Page|Document|Section)\s+\d+.*$', '', text, flags=re.IGNORECASE | re.MULTILINE)
+        text = _BOILERPLATE_RE.sub('', text)
+        text = _PAGE_NUMBER_RE.sub('', text)
+        text = _COPYRIGHT_RE.sub('', text)
+        text = _PAGE_HEADER_RE.sub('', text)
 
         # Normalize branch markers into parser-friendly lines
-        text = re.sub(r'(?im)^\s*(yes|no|true|false)\s*[>\-:]\s*', lambda m: f"{m.group(1).title()}: ", text)
-        text = re.sub(r'(?im)^\s*(otherwise|else)\s*[:>\-]\s*', 'No: ', text)
-        text = re.sub(r'(?im)^\s*if\s+([^:\n]+?)\s*[-–—>]+\s*', r'If \1: ', text)
+        text = _BRANCH_MARKER_RE.sub(lambda m: f"{m.group(1).title()}: ", text)
+        text = _ELSE_MARKER_RE.sub('No: ', text)
+        text = _IF_ARROW_RE.sub(r'If \1: ', text)
 
         # Remove excessive whitespace
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        text = re.sub(r'[ \t]{2,}', ' ', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
+        text = _INLINE_SPACES_RE.sub(' ', text)
 
         return text.strip()
 
     def _normalize_heading_text(self, line: str) -> str:
-        stripped = re.sub(r'^#+\s*', '', line).strip()
-        return re.sub(r'\s+', ' ', stripped).strip()
+        stripped = _HEADING_MARK_RE.sub('', line).strip()
+        return _WHITESPACE_RE.sub(' ', stripped).strip()
 
     def _is_heading_line(self, line: str) -> bool:
-        return bool(re.match(r'^#+\s+', line.strip()))
+        line = line.strip()
+        return line.startswith('#') and _MD_HEADER_RE.match(line) is not None
 
     def _is_toc_line(self, line: str) -> bool:
         stripped = line.strip()
         if not stripped:
             return False
-        if re.search(r'\.{3,}\s*\d+\s*$', stripped):
+        if _TOC_PAGE_RE.search(stripped):
             return True
-        if '|' in stripped and re.search(r'(section\s+\d+|\d+\.\d+)', stripped, re.IGNORECASE):
+        if '|' in stripped and _TOC_SECTION_RE.search(stripped):
             return True
         return False
 
@@ -337,19 +403,19 @@ class ContentExtractor:
         stripped = line.strip()
         if not stripped:
             return False
-        if re.match(r'^\d+[\.\)]\s+', stripped):
+        if stripped[:1].isdecimal() and _NUMBERED_STEP_RE.match(stripped):
             return True
-        if re.match(r'^[-*]\s+', stripped):
-            candidate = re.sub(r'^[-*]\s*', '', stripped).strip()
-            if re.match(r'^(if|when|once|then|otherwise|yes:|no:)', candidate, re.IGNORECASE):
+        if stripped.startswith(('-', '*')) and _DASH_BULLET_RE.match(stripped):
+            candidate = _DASH_BULLET_PREFIX_RE.sub('', stripped).strip()
+            if _BRANCH_START_RE.match(candidate):
                 return True
-            first = re.split(r'[\s/:-]+', candidate.lower())[0]
+            first = _WORD_SPLIT_RE.split(candidate.lower())[0]
             return first in self.ACTION_VERBS
-        if re.match(r'^(if|when|once|then|otherwise|yes:|no:)', stripped, re.IGNORECASE):
+        if _BRANCH_START_RE.match(stripped):
             return True
         if '->' in stripped:
             return True
-        first = re.split(r'[\s/:-]+', stripped.lower())[0]
+        first = _WORD_SPLIT_RE.split(stripped.lower())[0]
         return first in self.ACTION_VERBS
 
     def _is_keepable_heading(self, line: str) -> bool:
@@ -361,10 +427,10 @@ class ContentExtractor:
 
     def _compact_step_line(self, line: str) -> str:
         stripped = line.strip()
-        stripped = re.sub(r'^\s*[-*]\s*', '- ', stripped)
-        stripped = re.sub(r'^\s*[a-zA-Z][\.\)]\s+', '- ', stripped)
-        stripped = re.sub(r'^\s*(yes|no|true|false)\s*[:\-]\s*', lambda m: f"{m.group(1).title()}: ", stripped, flags=re.IGNORECASE)
-        stripped = re.sub(r'\s+', ' ', stripped)
+        stripped = _COMPACT_BULLET_RE.sub('- ', stripped)
+        stripped = _COMPACT_LETTER_STEP_RE.sub('- ', stripped)
+        stripped = _COMPACT_BRANCH_RE.sub(lambda m: f"{m.group(1).title()}: ", stripped)
+        stripped = _WHITESPACE_RE.sub(' ', stripped)
         return stripped.strip()
 
     def preprocess_for_parser(self, text: str) -> str:
@@ -383,15 +449,23 @@ class ContentExtractor:
         processed_lines = []
         in_toc = False
 
+        # Bound once; the loop below runs for every line of the document.
+        add_line = processed_lines.append
+        is_toc_line = self._is_toc_line
+        is_heading_line = self._is_heading_line
+        is_structural_label = self._is_structural_label
+        compact_step_line = self._compact_step_line
+        is_action_line = self._is_action_line
+
         for line in lines:
             line = line.strip()
             if not line:
                 continue
 
-            if self._is_toc_line(line):
+            if is_toc_line(line):
                 continue
 
-            if self._is_heading_line(line):
+            if is_heading_line(line):
                 if 'table of contents' in self._normalize_heading_text(line).lower():
                     in_toc = True
                     continue
@@ -400,28 +474,26 @@ class ContentExtractor:
                 if in_toc:
                     continue
                 if self._is_keepable_heading(line):
-                    processed_lines.append(f"# {self._normalize_heading_text(line)}")
+                    add_line(f"# {self._normalize_heading_text(line)}")
                 continue
 
             if in_toc:
                 continue
 
-            if self._is_structural_label(line):
+            if is_structural_label(line):
                 continue
 
-            normalized = self._compact_step_line(line)
-            if not self._is_action_line(normalized):
+            normalized = compact_step_line(line)
+            if not is_action_line(normalized):
                 continue
 
-            # Normalize numbered steps and bare action bullets
-            match = re.match(r'^(\d+)[\)\.]\s+(.+)$', normalized)
+            # Normalize numbered steps; bullets and bare actions pass through as is
+            match = _NUMBERED_STEP_PARTS_RE.match(normalized) if normalized[:1].isdecimal() else None
             if match:
                 num, content = match.groups()
-                processed_lines.append(f"{num}. {content}")
-            elif re.match(r'^-\s+', normalized):
-                processed_lines.append(normalized)
+                add_line(f"{num}. {content}")
             else:
-                processed_lines.append(normalized)
+                add_line(normalized)
 
         return '\n'.join(processed_lines)
 
@@ -451,23 +523,15 @@ class ContentExtractor:
         Returns:
             Dictionary with workflow statistics
         """
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-
-        # Count different types of steps
-        numbered_steps = sum(1 for line in lines if re.match(r'^\d+[\.\)]\s+', line))
-        decision_steps = sum(
-            1 for line in lines
-            if re.search(r'\b(if|check|validate|verify)\b', line.lower())
-        )
-        bullet_points = sum(1 for line in lines if re.match(r'^[\-\*•]\s+', line))
+        stats = self._analyze(text)
 
         return {
-            'total_lines': len(lines),
-            'step_count': numbered_steps,
-            'decision_count': decision_steps,
-            'numbered_steps': numbered_steps,
-            'decision_steps': decision_steps,
-            'bullet_points': bullet_points,
-            'is_workflow': self._looks_like_workflow(text),
-            'confidence': self._calculate_confidence(text)
+            'total_lines': stats.total_lines,
+            'step_count': stats.numbered_steps,
+            'decision_count': stats.summary_decision_lines,
+            'numbered_steps': stats.numbered_steps,
+            'decision_steps': stats.summary_decision_lines,
+            'bullet_points': stats.bullet_points,
+            'is_workflow': self._workflow_verdict(stats),
+            'confidence': self._confidence_score(stats)
         }
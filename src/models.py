@@ -5,6 +5,8 @@ Enhanced with:
 - Document metadata preservation (Enhancement 8)
 """
 
+import re
+from collections import Counter
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
@@ -52,6 +54,23 @@ class ConnectionType(str, Enum):
     LOOP = "loop"
 
 
+# Terminator roles are read from labels. Anchored at a word start so
+# "Restart" or "Send" are not read as terminators, while "Started" and
+# "Finished" still are.
+_START_LABEL_RE = re.compile(r'\b(?:start|begin)', re.IGNORECASE)
+_END_LABEL_RE = re.compile(r'\b(?:end|finish|stop)', re.IGNORECASE)
+
+
+def is_start_label(label: str) -> bool:
+    """Return True if a label names a start point."""
+    return bool(label) and _START_LABEL_RE.search(label) is not None
+
+
+def is_end_label(label: str) -> bool:
+    """Return True if a label names an end point."""
+    return bool(label) and _END_LABEL_RE.search(label) is not None
+
+
 class Connection(BaseModel):
     """Represents a connection between two flowchart nodes."""
 
@@ -99,14 +118,14 @@ class Flowchart(BaseModel):
                 return node
         return None
 
-    def _get_terminator_nodes(self, label_fragment: str) -> List[FlowchartNode]:
+    def _get_terminator_nodes(self, is_role_label) -> List[FlowchartNode]:
         return [
             node
             for node in self.nodes
-            if node.node_type == NodeType.TERMINATOR and label_fragment in node.label.lower()
+            if node.node_type == NodeType.TERMINATOR and is_role_label(node.label)
         ]
 
-    def _validate_start_nodes(self, start_nodes: List[FlowchartNode]) -> List[str]:
+    def _validate_start_nodes(self, start_nodes: List[FlowchartNode], in_degree: Counter) -> List[str]:
         errors: List[str] = []
         if not start_nodes:
             errors.append("Missing START node (terminator)")
@@ -114,54 +133,57 @@ class Flowchart(BaseModel):
             errors.append(f"Multiple START nodes found: {len(start_nodes)}")
 
         for start_node in start_nodes:
-            incoming = [c for c in self.connections if c.to_node == start_node.id]
-            if incoming:
+            if in_degree[start_node.id]:
                 errors.append(
                     f"START node '{start_node.id}' has incoming connection(s) - "
                     "START nodes should only have outgoing connections"
                 )
         return errors
 
-    def _validate_end_nodes(self, end_nodes: List[FlowchartNode]) -> List[str]:
+    def _validate_end_nodes(
+        self,
+        end_nodes: List[FlowchartNode],
+        in_degree: Counter,
+        out_degree: Counter,
+    ) -> List[str]:
         errors: List[str] = []
         if not end_nodes:
             errors.append("Missing END node (terminator)")
             return errors
 
         for end_node in end_nodes:
-            outgoing = [c for c in self.connections if c.from_node == end_node.id]
-            if outgoing:
+            if out_degree[end_node.id]:
                 errors.append(
                     f"END node '{end_node.id}' has outgoing connection(s) - "
                     "END nodes should only have incoming connections"
                 )
 
-            incoming = [c for c in self.connections if c.to_node == end_node.id]
-            if not incoming:
+            if not in_degree[end_node.id]:
                 errors.append(
                     f"END node '{end_node.id}' has no incoming connections - END nodes must be reachable"
                 )
         return errors
 
-    def _validate_node_connectivity(self, start_nodes: List[FlowchartNode]) -> List[str]:
+    def _validate_node_connectivity(
+        self,
+        start_nodes: List[FlowchartNode],
+        in_degree: Counter,
+        out_degree: Counter,
+    ) -> List[str]:
         node_ids = {n.id for n in self.nodes}
-        connected_nodes = set()
-        for conn in self.connections:
-            connected_nodes.add(conn.from_node)
-            connected_nodes.add(conn.to_node)
+        connected_nodes = in_degree.keys() | out_degree.keys()
 
         orphaned = node_ids - connected_nodes - {n.id for n in start_nodes}
         if not orphaned:
             return []
         return [f"Orphaned nodes found: {orphaned}"]
 
-    def _validate_decision_branching(self) -> List[str]:
+    def _validate_decision_branching(self, out_degree: Counter) -> List[str]:
         errors: List[str] = []
         for node in self.nodes:
             if node.node_type != NodeType.DECISION:
                 continue
-            outgoing = [c for c in self.connections if c.from_node == node.id]
-            if len(outgoing) < 2:
+            if out_degree[node.id] < 2:
                 errors.append(f"Decision node '{node.id}' has fewer than 2 branches")
         return errors
 
@@ -171,13 +193,16 @@ class Flowchart(BaseModel):
         Returns:
             Tuple of (is_valid, list of error messages)
         """
-        start_nodes = self._get_terminator_nodes("start")
-        end_nodes = self._get_terminator_nodes("end")
+        start_nodes = self._get_terminator_nodes(is_start_label)
+        end_nodes = self._get_terminator_nodes(is_end_label)
+        # Degree counts from one pass over the connections feed every check
+        in_degree = Counter(c.to_node for c in self.connections)
+        out_degree = Counter(c.from_node for c in self.connections)
         errors = []
-        errors.extend(self._validate_start_nodes(start_nodes))
-        errors.extend(self._validate_end_nodes(end_nodes))
-        errors.extend(self._validate_node_connectivity(start_nodes))
-        errors.extend(self._validate_decision_branching())
+        errors.extend(self._validate_start_nodes(start_nodes, in_degree))
+        errors.extend(self._validate_end_nodes(end_nodes, in_degree, out_degree))
+        errors.extend(self._validate_node_connectivity(start_nodes, in_degree, out_degree))
+        errors.extend(self._validate_decision_branching(out_degree))
 
         return len(errors) == 0, errors
 
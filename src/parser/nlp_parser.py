@@ -1,7 +1,12 @@
 """NLP-based workflow text parser using spaCy dependency trees."""
 
+import functools
+import os
 import re
-from typing import List, Optional, Tuple
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.models import NodeType, WorkflowStep
 from src.parser.iso_mapper import ISO5807Mapper
@@ -14,41 +19,98 @@ try:
 except (ImportError, Exception) as e:
     SPACY_AVAILABLE = False
     spacy = None
-    import warnings
     warnings.warn(f"spaCy not available: {e}. Using fallback parser.")
 
 
+SPACY_MODEL_NAME = "en_core_web_sm"
+
+# Extraction only reads POS tags, lemmas and the dependency tree, so the
+# named-entity recognizer is never loaded.
+SPACY_EXCLUDE = ("ner",)
+
+_NUMBERED_STEP_RE = re.compile(r'^\s*\d+[\.\)]\s')
+_LETTER_BULLET_RE = re.compile(r'^[a-z]\.\s')
+_BRANCH_KEYWORD_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'^If\s+(yes|no|true|false)',
+        r'^(Yes|No|True|False)\s*:',
+        r'^(Valid|Invalid)\s*:',
+        r'^(Success|Failure)\s*:',
+        r'^(Pass|Fail)\s*:',
+    )
+)
+_BULLET_PREFIX_RE = re.compile(r'^[-\u2022\*]\s*')
+_LETTER_PREFIX_RE = re.compile(r'^[a-z]\.\s*', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_nlp(model: str = SPACY_MODEL_NAME, exclude: Tuple[str, ...] = SPACY_EXCLUDE):
+    """Load a spaCy pipeline once per process for each (model, exclude) pair.
+
+    Failed loads are cached as None so later parsers fall back immediately
+    instead of retrying the load.
+    """
+    try:
+        return spacy.load(model, exclude=list(exclude))
+    except OSError:
+        warnings.warn(f"spaCy model not found. Install: python -m spacy download {model}")
+    except Exception as e:
+        warnings.warn(f"spaCy init failed: {e}")
+    return None
+
+
 class NLPParser:
     """Parse natural language workflow descriptions into structured steps."""
 
-    _SPACY_MODEL = None
-    _SPACY_MODEL_LOAD_FAILED = False
+    DEFAULT_PIPE_BATCH_SIZE = 256
+    PARSE_CACHE_SIZE = 128
+
+    # Parsing is pure for a given pipeline and text, so results are shared
+    # across parser instances. Keys hold the nlp object itself (or None for
+    # the fallback parser) so a different pipeline never reuses stale steps.
+    _parse_cache: "OrderedDict[Tuple[Any, str], Tuple[WorkflowStep, ...]]" = OrderedDict()
+    _parse_cache_lock = threading.Lock()
 
     def __init__(self, use_spacy: bool = True):
         self.use_spacy = use_spacy and SPACY_AVAILABLE
         self.nlp = None
         self.iso_mapper = ISO5807Mapper()
         self.fallback = FallbackParser()
+        self._docs: Dict[str, Any] = {}
 
         if self.use_spacy:
-            try:
-                if NLPParser._SPACY_MODEL is None and not NLPParser._SPACY_MODEL_LOAD_FAILED:
-                    NLPParser._SPACY_MODEL = spacy.load("en_core_web_sm")
-                self.nlp = NLPParser._SPACY_MODEL
-            except OSError:
-                print("Warning: spaCy model not found. Install: python -m spacy download en_core_web_sm")
-                NLPParser._SPACY_MODEL_LOAD_FAILED = True
-                self.use_spacy = False
-            except Exception as e:
-                print(f"Warning: spaCy init failed: {e}")
-                NLPParser._SPACY_MODEL_LOAD_FAILED = True
+            self.nlp = _get_nlp(SPACY_MODEL_NAME, SPACY_EXCLUDE)
+            if self.nlp is None:
                 self.use_spacy = False
 
+    @classmethod
+    def clear_parse_cache(cls) -> None:
+        """Drop all memoized parse results."""
+        with cls._parse_cache_lock:
+            cls._parse_cache.clear()
+
     def parse(self, text: str) -> List[WorkflowStep]:
         """Parse workflow text into structured steps.
 
         If spaCy is unavailable, uses the deterministic FallbackParser.
+        Results are memoized per pipeline and text; callers always get
+        fresh copies they are free to mutate.
         """
+        key = (self.nlp if self.use_spacy else None, text)
+        with NLPParser._parse_cache_lock:
+            cached = NLPParser._parse_cache.get(key)
+            if cached is not None:
+                NLPParser._parse_cache.move_to_end(key)
+        if cached is None:
+            cached = tuple(self._parse_uncached(text))
+            with NLPParser._parse_cache_lock:
+                NLPParser._parse_cache[key] = cached
+                if len(NLPParser._parse_cache) > self.PARSE_CACHE_SIZE:
+                    NLPParser._parse_cache.popitem(last=False)
+        return [step.model_copy(deep=True) for step in cached]
+
+    def _parse_uncached(self, text: str) -> List[WorkflowStep]:
         if not self.use_spacy or self.nlp is None:
             return self.fallback.parse(text)
 
@@ -59,13 +121,38 @@ class NLPParser:
         if not lines:
             return []
 
+        self._docs = self._pipe_docs(lines)
+        try:
+            return self._parse_lines(lines)
+        finally:
+            self._docs = {}
+
+    def _pipe_docs(self, lines: List[str]) -> Dict[str, Any]:
+        """Run every candidate step text through spaCy in one batched ``nlp.pipe`` call."""
+        texts = list(dict.fromkeys(
+            normalized
+            for normalized in (WorkflowPatterns.normalize_step_text(line) for line in lines)
+            if normalized
+        ))
+        if not texts:
+            return {}
+        try:
+            batch_size = int(os.environ.get("FLOWCHART_SPACY_BATCH_SIZE", self.DEFAULT_PIPE_BATCH_SIZE))
+        except ValueError:
+            batch_size = self.DEFAULT_PIPE_BATCH_SIZE
+        try:
+            return dict(zip(texts, self.nlp.pipe(texts, batch_size=max(1, batch_size))))
+        except Exception:
+            return {}
+
+    def _parse_lines(self, lines: List[str]) -> List[WorkflowStep]:
         steps = []
         current_step = None
         current_group = None
 
         for i, line in enumerate(lines):
             # Detect section headers
-            is_plain_numbered_step = bool(re.match(r'^\s*\d+[\.\)]\s+', line.strip()))
+            is_plain_numbered_step = bool(_NUMBERED_STEP_RE.match(line.strip()))
             if not is_plain_numbered_step and WorkflowPatterns.is_section_header(line):
                 current_group = WorkflowPatterns.normalize_section_header(line)
                 current_step = None
@@ -90,7 +177,7 @@ class NLPParser:
                     steps.append(step)
                     current_step = step
             except Exception as e:
-                print(f"Warning: Failed to parse '{line[:50]}...': {e}")
+                warnings.warn(f"Failed to parse '{line[:50]}...': {e}")
                 continue
 
         self._ensure_default_decision_branches(steps)
@@ -144,26 +231,19 @@ class NLPParser:
         # Classic bullet formats
         if stripped.startswith('-') or stripped.startswith('\u2022') or stripped.startswith('*'):
             return True
-        if re.match(r'^[a-z]\.\s', stripped):
+        if _LETTER_BULLET_RE.match(stripped):
             return True
 
         # Check for branch keywords at start
-        branch_patterns = [
-            r'^If\s+(yes|no|true|false)',
-            r'^(Yes|No|True|False)\s*:',
-            r'^(Valid|Invalid)\s*:',
-            r'^(Success|Failure)\s*:',
-            r'^(Pass|Fail)\s*:',
-        ]
-        for pattern in branch_patterns:
-            if re.search(pattern, stripped, re.IGNORECASE):
+        for pattern in _BRANCH_KEYWORD_RES:
+            if pattern.search(stripped):
                 return True
 
         # Check indentation: if indented 4+ spaces and no step number, likely a branch
         leading_spaces = len(line) - len(line.lstrip())
         if leading_spaces >= 4:
             # Not a numbered step
-            if not re.match(r'^\d+[\.\)]\s', stripped):
+            if not _NUMBERED_STEP_RE.match(stripped):
                 # Contains branch-like keywords
                 if any(keyword in stripped.lower() for keyword in ['if yes', 'if no', 'yes:', 'no:', 'otherwise']):
                     return True
@@ -181,8 +261,8 @@ class NLPParser:
         text = line.strip()
 
         # Remove leading bullets/markers
-        text = re.sub(r'^[-\u2022\*]\s*', '', text)
-        text = re.sub(r'^[a-z]\.\s*', '', text, flags=re.IGNORECASE)
+        text = _BULLET_PREFIX_RE.sub('', text)
+        text = _LETTER_PREFIX_RE.sub('', text)
 
         return text.strip() if text else None
 
@@ -265,7 +345,9 @@ class NLPParser:
     def _extract_with_spacy(self, text: str) -> Tuple[str, Optional[str], Optional[str]]:
         """Extract using spaCy dependency tree."""
         try:
-            doc = self.nlp(text)
+            doc = self._docs.get(text)
+            if doc is None:
+                doc = self.nlp(text)
 
             action = self._extract_action_from_doc(doc)
             subject = None
@@ -18,8 +18,16 @@ from src.parser.llm_extractor import (
 )
 
 
-def discover_ollama_models(base_url: str = "http://localhost:11434", timeout: float = 3.0) -> Dict[str, Any]:
-    """Return Ollama availability and model list from `/api/tags`."""
+def discover_ollama_models(
+    base_url: str = "http://localhost:11434",
+    timeout: float = 3.0,
+    session: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """Return Ollama availability and model list from `/api/tags`.
+
+    Pass a `requests.Session` as `session` to reuse a keep-alive connection
+    across repeated probes; otherwise a one-off urllib request is made.
+    """
     base = (base_url or "http://localhost:11434").rstrip("/")
     endpoint = f"{base}/api/tags"
     result: Dict[str, Any] = {
@@ -32,9 +40,14 @@ def discover_ollama_models(base_url: str = "http://localhost:11434", timeout: fl
     }
 
     try:
-        req = urlrequest.Request(endpoint, method="GET")
-        with urlrequest.urlopen(req, timeout=timeout) as resp:
-            body = resp.read().decode("utf-8", errors="replace")
+        if session is not None:
+            resp = session.get(endpoint, timeout=timeout)
+            resp.raise_for_status()
+            body = resp.text
+        else:
+            req = urlrequest.Request(endpoint, method="GET")
+            with urlrequest.urlopen(req, timeout=timeout) as resp:
+                body = resp.read().decode("utf-8", errors="replace")
         payload = json.loads(body) if body else {}
         models = payload.get("models") or []
         normalized = []
@@ -52,7 +65,8 @@ def discover_ollama_models(base_url: str = "http://localhost:11434", timeout: fl
         result["models"] = sorted(normalized, key=lambda m: m["name"])
         if not normalized:
             result["warnings"].append("Ollama reachable but no models found. Pull a model first.")
-    except urlerror.URLError as e:
+    except (urlerror.URLError, OSError) as e:
+        # requests' exceptions derive from OSError, like URLError does.
         result["error"] = str(e.reason) if hasattr(e, "reason") else str(e)
         result["warnings"].append("Could not reach Ollama service.")
     except Exception as e:
@@ -14,6 +14,27 @@ from typing import List, Optional, Tuple
 
 from src.models import NodeType
 
+_OTHERWISE_RE = re.compile(r'\botherwise\b', re.IGNORECASE)
+_CHECK_VERB_RE = re.compile(r'^(?:check|verify|validate|confirm)\b')
+_CONDITIONAL_WORD_RE = re.compile(r'\b(?:if|whether|that)\b')
+_LOOP_TARGET_RE = re.compile(
+    r'(?:return|go back|repeat from|loop back to|restart at|resume from|retry from|redo from)'
+    r'\s+(?:to\s+)?step\s+(\d+)',
+    re.IGNORECASE,
+)
+_IF_CLAUSE_RE = re.compile(r'if\s+(.+?)[:,]')
+_HEADING_MARK_RE = re.compile(r'^#+\s*')
+_STEP_NUMBER_RE = re.compile(r'^(\d+)[.)]\s*')
+_BULLET_RE = re.compile(r'^[-*\u2022]\s*')
+_SECTION_MARKER_RE = re.compile(
+    r'^(?:Section|Phase|Stage|Step Group)\s+[\dA-ZIVX._-]+(?:\s*[:.\-]\s*|\s+)[A-Z0-9]',
+    re.IGNORECASE,
+)
+_PHASE_HEADER_RE = re.compile(r'^(?:Phase|Stage)\s+[\dA-ZIVX._-]+\s+[A-Z].{2,}$', re.IGNORECASE)
+_MAJOR_HEADING_RE = re.compile(r'^\d+\.0\s+[A-Z]')
+_DOTTED_HEADING_RE = re.compile(r'^\d+(?:\.\d+)+\s+[A-Z][A-Za-z0-9 /&()\-]{2,}$')
+_NUMBERED_HEADING_RE = re.compile(r'^\d+[.)]\s+[A-Z].{3,}$')
+
 
 class WorkflowPatterns:
     """Centralized patterns for NLP workflow parsing."""
@@ -185,6 +206,19 @@ class WorkflowPatterns:
         r'\bnext\s+phase\s+is\s+[\'"]?(.+?)[\'"]?\b',
     ]
 
+    # Compiled once at import; the detectors below run on every parsed line.
+    _COMPILED_DECISION = tuple(re.compile(p) for p in DECISION_PATTERNS)
+    _COMPILED_DECISION_EXCLUSIONS = tuple(re.compile(p) for p in DECISION_EXCLUSIONS)
+    _COMPILED_LOOP = tuple(re.compile(p) for p in LOOP_PATTERNS)
+    _COMPILED_CROSSREF = tuple(re.compile(p) for p in CROSSREF_PATTERNS)
+    _COMPILED_PARALLEL = tuple(re.compile(p) for p in PARALLEL_PATTERNS)
+    _COMPILED_WARNING = {
+        level: tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+        for level, patterns in WARNING_PATTERNS.items()
+    }
+    _COMPILED_INLINE_BRANCH = tuple(re.compile(p, re.IGNORECASE) for p in INLINE_BRANCH_PATTERNS)
+    _COMPILED_STATE_TRANSITION = tuple(re.compile(p, re.IGNORECASE) for p in STATE_TRANSITION_PATTERNS)
+
     POSITIVE_BRANCHES = ['yes', 'true', 'valid', 'success', 'pass', 'approved', 'correct', 'complete']
     NEGATIVE_BRANCHES = ['no', 'false', 'invalid', 'failure', 'fail', 'rejected', 'incorrect', 'incomplete']
 
@@ -195,8 +229,8 @@ class WorkflowPatterns:
         Returns:
             The name of the target phase/state if found, else None.
         """
-        for pattern in cls.STATE_TRANSITION_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in cls._COMPILED_STATE_TRANSITION:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
@@ -231,8 +265,8 @@ class WorkflowPatterns:
         """
         # Check each level in order of severity
         for level in ['critical', 'warning', 'note']:
-            for pattern in cls.WARNING_PATTERNS.get(level, []):
-                if re.search(pattern, text, re.IGNORECASE):
+            for pattern in cls._COMPILED_WARNING.get(level, ()):
+                if pattern.search(text):
                     return level
 
         return ''
@@ -244,12 +278,12 @@ class WorkflowPatterns:
         Returns:
             Tuple of (condition, failure_action, success_action) or None
         """
-        for pattern in cls.INLINE_BRANCH_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in cls._COMPILED_INLINE_BRANCH:
+            match = pattern.search(text)
             if match:
                 if 'otherwise' in text.lower():
                     # Split on 'otherwise'
-                    parts = re.split(r'\botherwise\b', text, flags=re.IGNORECASE)
+                    parts = _OTHERWISE_RE.split(text)
                     if len(parts) >= 2:
                         return (parts[0].strip(), parts[1].strip(), '')
                 elif 'fails' in text.lower() or 'error' in text.lower():
@@ -281,8 +315,8 @@ class WorkflowPatterns:
         text_lower = text.lower().strip()
 
         # Rule 1: Check exclusions first
-        for excl in cls.DECISION_EXCLUSIONS:
-            if re.search(excl, text_lower):
+        for excl in cls._COMPILED_DECISION_EXCLUSIONS:
+            if excl.search(text_lower):
                 return False
 
         # Rule 2: Question format is always a decision
@@ -290,16 +324,16 @@ class WorkflowPatterns:
             return True
 
         # Rule 3: Check for explicit conditional patterns
-        for pattern in cls.DECISION_PATTERNS:
-            if re.search(pattern, text_lower):
+        for pattern in cls._COMPILED_DECISION:
+            if pattern.search(text_lower):
                 return True
 
         # Rule 4: If text starts with check/verify/validate but has no conditional phrase,
         # it's likely a process action, not a decision
-        if re.match(r'^(?:check|verify|validate|confirm)\b', text_lower):
+        if _CHECK_VERB_RE.match(text_lower):
             # Look for conditional indicators
             has_conditional = bool(
-                re.search(r'\b(?:if|whether|that)\b', text_lower) or
+                _CONDITIONAL_WORD_RE.search(text_lower) or
                 text_lower.endswith('?')
             )
             return has_conditional
@@ -310,31 +344,24 @@ class WorkflowPatterns:
     def is_loop(cls, text: str) -> bool:
         """Check if text represents a loop."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in cls.LOOP_PATTERNS)
+        return any(pattern.search(text_lower) for pattern in cls._COMPILED_LOOP)
 
     @classmethod
     def is_crossref(cls, text: str) -> bool:
         """Check if text contains a cross-reference to another procedure."""
         text_lower = text.lower() if text else ''
-        return any(re.search(pattern, text_lower) for pattern in cls.CROSSREF_PATTERNS)
+        return any(pattern.search(text_lower) for pattern in cls._COMPILED_CROSSREF)
 
     @classmethod
     def is_parallel(cls, text: str) -> bool:
         """Check if text indicates a parallel action."""
         text_lower = text.lower() if text else ''
-        return any(re.search(pattern, text_lower) for pattern in cls.PARALLEL_PATTERNS)
+        return any(pattern.search(text_lower) for pattern in cls._COMPILED_PARALLEL)
 
     @classmethod
     def extract_loop_target(cls, text: str) -> Optional[int]:
         """Extract step number from loop-back/retry references."""
-        match = re.search(
-            (
-                r'(?:return|go back|repeat from|loop back to|restart at|resume from|retry from|redo from)'
-                r'\s+(?:to\s+)?step\s+(\d+)'
-            ),
-            text,
-            re.IGNORECASE,
-        )
+        match = _LOOP_TARGET_RE.search(text)
         if match:
             try:
                 return int(match.group(1))
@@ -348,7 +375,7 @@ class WorkflowPatterns:
         branches = []
         text_lower = text.lower()
 
-        if_match = re.search(r'if\s+(.+?)[:,]', text_lower)
+        if_match = _IF_CLAUSE_RE.search(text_lower)
         if if_match:
             branches.append("Yes")
             branches.append("No")
@@ -370,9 +397,9 @@ class WorkflowPatterns:
     @classmethod
     def normalize_step_text(cls, text: str) -> str:
         """Normalize and clean step text."""
-        text = re.sub(r'^#+\s*', '', text)
-        text = re.sub(r'^\d+[.)]\s*', '', text)
-        text = re.sub(r'^[-*\u2022]\s*', '', text)
+        text = _HEADING_MARK_RE.sub('', text)
+        text = _STEP_NUMBER_RE.sub('', text)
+        text = _BULLET_RE.sub('', text)
         text = ' '.join(text.split())
         if text:
             text = text[0].upper() + text[1:]
@@ -381,7 +408,7 @@ class WorkflowPatterns:
     @classmethod
     def extract_step_number(cls, text: str) -> Optional[int]:
         """Extract step number from text."""
-        match = re.match(r'^(\d+)[.)]\s*', text)
+        match = _STEP_NUMBER_RE.match(text)
         if match:
             return int(match.group(1))
         return None
@@ -394,28 +421,24 @@ class WorkflowPatterns:
             return False
             
         # Explicit markers are high confidence
-        if re.match(
-            r'^(?:Section|Phase|Stage|Step Group)\s+[\dA-ZIVX._-]+(?:\s*[:.\-]\s*|\s+)[A-Z0-9]',
-            stripped,
-            re.IGNORECASE,
-        ):
+        if _SECTION_MARKER_RE.match(stripped):
             return True
 
         # SOP-style phase headers without punctuation, e.g. "Phase 2 Intake Review"
-        if re.match(r'^(?:Phase|Stage)\s+[\dA-ZIVX._-]+\s+[A-Z].{2,}$', stripped, re.IGNORECASE):
+        if _PHASE_HEADER_RE.match(stripped):
             return True
             
         # Major headings with .0
-        if re.match(r'^\d+\.0\s+[A-Z]', stripped):
+        if _MAJOR_HEADING_RE.match(stripped):
             return True
 
         # Numbered SOP/section headings such as "2.1 Intake Review"
-        if re.match(r'^\d+(?:\.\d+)+\s+[A-Z][A-Za-z0-9 /&()\-]{2,}$', stripped):
+        if _DOTTED_HEADING_RE.match(stripped):
             return True
 
         # Top-level numbered section headings such as "2. Label Sent to Customer"
-        if re.match(r'^\d+[.)]\s+[A-Z].{3,}$', stripped) and not stripped.endswith('.'):
-            title_without_number = re.sub(r'^\d+[.)]\s*', '', stripped)
+        if _NUMBERED_HEADING_RE.match(stripped) and not stripped.endswith('.'):
+            title_without_number = _STEP_NUMBER_RE.sub('', stripped)
             words = title_without_number.split()
             first_word = words[0].lower() if words else ""
             if (
@@ -437,4 +460,4 @@ class WorkflowPatterns:
     @classmethod
     def normalize_section_header(cls, text: str) -> str:
         """Remove markdown prefixes while preserving the visible section title."""
-        return re.sub(r'^#+\s*', '', text.strip())
+        return _HEADING_MARK_RE.sub('', text.strip())
@@ -8,7 +8,7 @@ hardware-aware fallback and universal accessibility.
 import time
 import warnings
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Tuple
 
 from src.builder.graph_builder import GraphBuilder
 from src.builder.validator import ISO5807Validator
@@ -75,6 +75,7 @@ class FlowchartPipeline:
         self._capability_detector = None
         self._last_render_metadata = {}
         self._last_extraction_metadata = {}
+        self._last_validation: Optional[Tuple[bool, List[str], List[str]]] = None
         self._last_timings = {}
 
     @property
@@ -130,10 +131,12 @@ class FlowchartPipeline:
         builder = GraphBuilder()
         flowchart = builder.build(steps, title=title)
 
+        self._last_validation = None
         if self.config.validate:
             validate_started = time.perf_counter()
             validator = ISO5807Validator()
             is_valid, errors, warns = validator.validate(flowchart)
+            self._last_validation = (is_valid, list(errors), list(warns))
             if errors:
                 for err in errors:
                     warnings.warn(f"Validation error: {err}")
@@ -155,7 +158,10 @@ class FlowchartPipeline:
         requested_renderer = self.config.renderer
         renderer_type = requested_renderer
 
-        if renderer_type == "auto":
+        if format == "mmd":
+            # Mermaid source needs only the generator; skip renderer selection.
+            renderer_type = "mermaid"
+        elif renderer_type == "auto":
             renderer_type = self._auto_select_renderer()
 
         fallback_chain = []
@@ -219,6 +225,10 @@ class FlowchartPipeline:
         """Return metadata from the most recent extraction attempt."""
         return dict(self._last_extraction_metadata)
 
+    def get_last_validation(self) -> Optional[Tuple[bool, List[str], List[str]]]:
+        """Return (is_valid, errors, warnings) from the most recent build, if it was validated."""
+        return self._last_validation
+
     def get_last_timings(self) -> dict:
         """Return timing metadata from the most recent pipeline stages."""
         return dict(self._last_timings)
@@ -343,7 +353,7 @@ class FlowchartPipeline:
 
     def _render_mermaid(self, flowchart: Flowchart, output_path: str, format: str) -> bool:
         """Render via Mermaid (existing pipeline)."""
-        from src.renderer.image_renderer import ImageRenderer
+        from src.renderer.image_renderer import get_image_renderer
 
         generator = MermaidGenerator()
         mermaid_code = generator.generate_with_theme(
@@ -353,13 +363,12 @@ class FlowchartPipeline:
         )
 
         if format == "mmd":
-            Path(output_path).write_text(mermaid_code, encoding="utf-8")
+            Path(output_path).write_bytes(mermaid_code.encode("utf-8"))
             return True
         elif format == "html":
             return self._render_html(flowchart, output_path)
         else:
-            renderer = ImageRenderer()
-            return renderer.render(mermaid_code, output_path, format=format)
+            return get_image_renderer().render(mermaid_code, output_path, format=format)
 
     def _render_graphviz(self, flowchart: Flowchart, output_path: str, format: str) -> bool:
         """Render via native Graphviz."""
@@ -7,9 +7,9 @@ Supports:
 - Kroki (unified multi-engine rendering via Docker)
 """
 
-from src.renderer.image_renderer import ImageRenderer
+from src.renderer.image_renderer import ImageRenderer, get_image_renderer
 
-__all__ = ["ImageRenderer"]
+__all__ = ["ImageRenderer", "get_image_renderer"]
 
 # Lazy imports for optional renderers
 
@@ -2,6 +2,7 @@
 
 import shutil
 import subprocess
+import warnings
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -74,11 +75,12 @@ class ImageRenderer:
             True if successful, False otherwise
         """
         if not self.mmdc_path:
-            print("\nWarning: mermaid-cli (mmdc) not found.")
-            print("   Image rendering requires mermaid-cli to be installed.")
-            print("\n   Install with: npm install -g @mermaid-js/mermaid-cli")
-            print("   Or use npx: npx -y @mermaid-js/mermaid-cli")
-            print("\n   For now, use .mmd or .html output formats.")
+            warnings.warn(
+                "mermaid-cli (mmdc) not found; image rendering requires it. "
+                "Install with: npm install -g @mermaid-js/mermaid-cli "
+                "(or use npx: npx -y @mermaid-js/mermaid-cli). "
+                "For now, use .mmd or .html output formats."
+            )
             return False
 
         # Write mermaid code to temporary file
@@ -89,8 +91,7 @@ class ImageRenderer:
             output_dir = Path(output_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            with open(temp_mmd, "w", encoding="utf-8") as f:
-                f.write(mermaid_code)
+            temp_mmd.write_bytes(mermaid_code.encode("utf-8"))
 
             # Build mmdc command
             if " " in self.mmdc_path:  # npx command
@@ -122,19 +123,19 @@ class ImageRenderer:
             )
 
             if result.returncode != 0:
-                print(f"Error rendering: {result.stderr}")
+                message = f"Mermaid rendering failed: {result.stderr}"
                 if "puppeteer" in result.stderr.lower():
-                    print("\nTip: Try installing Puppeteer: npm install -g puppeteer")
+                    message += " Tip: Try installing Puppeteer: npm install -g puppeteer"
+                warnings.warn(message)
                 return False
 
-            print(f"Successfully rendered to: {output_path}")
             return True
 
         except subprocess.TimeoutExpired:
-            print("Error: Rendering timeout (60s). The diagram may be too complex.")
+            warnings.warn("Mermaid rendering timeout (60s). The diagram may be too complex.")
             return False
         except Exception as e:
-            print(f"Error during rendering: {e}")
+            warnings.warn(f"Mermaid rendering error: {e}")
             return False
 
         finally:
@@ -144,3 +145,18 @@ class ImageRenderer:
                     temp_mmd.unlink()
             except Exception:
                 pass  # Ignore cleanup errors
+
+
+_SHARED_RENDERER: Optional[ImageRenderer] = None
+
+
+def get_image_renderer() -> ImageRenderer:
+    """Return the process-wide ImageRenderer.
+
+    The renderer holds no per-render state, so one instance serves every
+    pipeline and web request instead of re-resolving mermaid-cli each time.
+    """
+    global _SHARED_RENDERER
+    if _SHARED_RENDERER is None:
+        _SHARED_RENDERER = ImageRenderer()
+    return _SHARED_RENDERER
@@ -6,6 +6,12 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_capability_cache(tmp_path, monkeypatch):
+    """Point the capability cache at a per-test file instead of ~/.cache/flowcharts."""
+    monkeypatch.setenv("FLOWCHART_CAPS_CACHE", str(tmp_path / "caps.json"))
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
@@ -1,7 +1,8 @@
 """Tests for graph builder."""
 
 from src.builder.graph_builder import GraphBuilder
-from src.models import NodeType, WorkflowStep
+from src.builder.validator import ISO5807Validator
+from src.models import NodeType, WorkflowStep, is_end_label, is_start_label
 from src.parser.nlp_parser import NLPParser
 
 
@@ -99,3 +100,45 @@ def test_grouped_layout_places_phases_on_separate_rows():
     assert positions["STEP_1"][0] == positions["STEP_2"][0]
     assert positions["STEP_3"][0] > positions["STEP_1"][0]
     assert positions["STEP_4"][0] > positions["STEP_3"][0]
+
+
+def test_cycle_check_handles_long_linear_chains():
+    """Cycle detection must not recurse once per node."""
+    validator = ISO5807Validator()
+    graph = {str(i): [str(i + 1)] for i in range(5000)}
+    graph["5000"] = []
+
+    assert validator._dfs_has_cycle("0", graph, set(), set()) is False
+
+    graph["5000"] = ["0"]
+    assert validator._dfs_has_cycle("0", graph, set(), set()) is True
+
+
+def test_terminator_label_roles_match_word_starts():
+    """Start/end detection ignores words that merely contain the keyword."""
+    assert is_start_label("Start")
+    assert is_start_label("Begin onboarding")
+    assert not is_start_label("Restart service")
+    assert is_end_label("Finished")
+    assert is_end_label("Stop")
+    assert not is_end_label("Send email")
+
+
+def test_terminator_label_roles_agree_across_model_and_generator():
+    """Flowchart.validate_structure and Mermaid styling use the same start/end rule."""
+    from src.generator.mermaid_generator import MermaidGenerator
+    from src.models import Connection, Flowchart, FlowchartNode
+
+    flowchart = Flowchart(
+        nodes=[
+            FlowchartNode(id="A", node_type=NodeType.TERMINATOR, label="Begin"),
+            FlowchartNode(id="B", node_type=NodeType.PROCESS, label="Restart service"),
+            FlowchartNode(id="C", node_type=NodeType.TERMINATOR, label="Stop"),
+        ],
+        connections=[Connection(from_node="A", to_node="B"), Connection(from_node="B", to_node="C")],
+    )
+
+    assert flowchart.validate_structure() == (True, [])
+    buckets = MermaidGenerator()._classify_style_buckets(flowchart)
+    assert buckets["start_nodes"] == ["A"]
+    assert buckets["end_nodes"] == ["C"]
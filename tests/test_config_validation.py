@@ -1,5 +1,7 @@
 """Tests for shared pipeline option validation and normalization."""
 
+import pytest
+
 from src.config_validation import normalize_pipeline_options
 from src.models import Flowchart
 from src.pipeline import FlowchartPipeline, PipelineConfig
@@ -49,6 +51,31 @@ def test_normalize_options_rejects_invalid_values():
     assert len(result["errors"]) == 6
 
 
+def test_normalize_options_returns_fresh_results_for_cached_inputs():
+    options = {"extraction": "llm", "format": "PNG"}
+    first = normalize_pipeline_options(options)
+    first["normalized"]["format"] = "mutated"
+    first["warnings"].clear()
+
+    second = normalize_pipeline_options(options)
+    assert second["normalized"] == {"extraction": "local-llm", "format": "png"}
+    assert len(second["warnings"]) == 1
+    assert options == {"extraction": "llm", "format": "PNG"}
+
+
+def test_normalize_options_handles_unhashable_values():
+    result = normalize_pipeline_options({"renderer": "mermaid", "extra": ["a", "b"]})
+    assert result["errors"] == []
+    assert result["normalized"]["extra"] == ["a", "b"]
+
+
+def test_normalize_options_keeps_value_types_across_calls():
+    normalize_pipeline_options({"quantization": 1, "renderer": "mermaid"})
+    result = normalize_pipeline_options({"quantization": True, "renderer": "mermaid"})
+    assert result["normalized"]["quantization"] is True
+    assert result["errors"] == ["Invalid quantization 'True'. Valid values: 4bit, 5bit, 8bit"]
+
+
 def test_pipeline_records_render_fallback_metadata(monkeypatch):
     pipeline = FlowchartPipeline(PipelineConfig(renderer="graphviz"))
     flowchart = Flowchart(nodes=[], connections=[], title="Test")
@@ -65,3 +92,20 @@ def test_pipeline_records_render_fallback_metadata(monkeypatch):
     assert metadata["fallback_chain"] == ["mermaid", "html"]
     assert metadata["final_renderer"] == "html"
     assert metadata["success"] is True
+
+
+def test_pipeline_renders_mmd_with_mermaid_generator_only(monkeypatch):
+    pipeline = FlowchartPipeline(PipelineConfig(renderer="auto"))
+    flowchart = Flowchart(nodes=[], connections=[], title="Test")
+    dispatched = []
+
+    def fake_dispatch(renderer_type, *args, **kwargs):
+        dispatched.append(renderer_type)
+        return True
+
+    monkeypatch.setattr(pipeline, "_auto_select_renderer", lambda: pytest.fail("auto-selection should be skipped"))
+    monkeypatch.setattr(pipeline, "_dispatch_render", fake_dispatch)
+
+    assert pipeline.render(flowchart, "output.mmd", format="mmd") is True
+    assert dispatched == ["mermaid"]
+    assert pipeline.get_last_render_metadata()["resolved_renderer"] == "mermaid"
@@ -1,5 +1,6 @@
 """End-to-end integration tests."""
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -11,6 +12,8 @@ from src.builder.validator import ISO5807Validator
 from src.generator.mermaid_generator import MermaidGenerator
 from src.parser.nlp_parser import NLPParser
 
+pytestmark = pytest.mark.e2e
+
 
 def _cli_runner_and_app():
     """Import CLI lazily so unsupported Python versions skip cleanly."""
@@ -166,6 +169,183 @@ class TestEndToEnd:
             assert "Start" in content
             assert "End" in content
 
+    def test_cli_generate_json_events(self):
+        """Test CLI generate command emits newline-delimited JSON with --json."""
+        runner, app = _cli_runner_and_app()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "workflow.txt"
+            input_file.write_text("1. Start\n2. Process data\n3. End\n")
+            output_file = Path(tmpdir) / "output.mmd"
+
+            result = runner.invoke(app, ["generate", str(input_file), "-o", str(output_file), "--json"])
+
+            assert result.exit_code == 0, f"CLI failed: {result.output}"
+            events = [json.loads(line) for line in result.output.splitlines() if line.strip()]
+            names = [event["event"] for event in events]
+            assert names[0] == "reading"
+            assert "extracted" in names
+            assert names[-1] == "rendered"
+            assert events[-1]["output"] == str(output_file)
+
+    def test_cli_generate_json_reports_render_fallback(self, monkeypatch):
+        """Test --json keeps stdout pure NDJSON and reports the fallback output."""
+        from src.pipeline import FlowchartPipeline
+
+        runner, app = _cli_runner_and_app()
+
+        def failing_dispatch(self, renderer_type, flowchart, output_path, format):
+            print(f"{renderer_type} diagnostics that must not reach the event stream")
+            return False
+
+        monkeypatch.setattr(FlowchartPipeline, "_dispatch_render", failing_dispatch)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "workflow.txt"
+            input_file.write_text("1. Start\n2. Process data\n3. End\n")
+            output_file = Path(tmpdir) / "out.png"
+
+            result = runner.invoke(
+                app,
+                ["generate", str(input_file), "-o", str(output_file), "--renderer", "mermaid", "--json"],
+            )
+
+            assert result.exit_code == 0, f"CLI failed: {result.output}"
+            events = [json.loads(line) for line in result.stdout.splitlines() if line.strip()]
+            rendered = events[-1]
+            assert rendered["event"] == "rendered"
+            assert rendered["output"] == str(output_file.with_suffix(".html"))
+            assert rendered["format"] == "html"
+            assert rendered["renderer"] == "html"
+            assert Path(rendered["output"]).exists()
+
+    def test_cli_generate_skips_capability_probe_when_explicit(self, monkeypatch):
+        """Test explicit extraction and renderer choices do not probe capabilities."""
+        from src.pipeline import FlowchartPipeline
+
+        runner, app = _cli_runner_and_app()
+        calls = {"capabilities": 0}
+        original = FlowchartPipeline.get_capabilities
+
+        def counting_capabilities(self):
+            calls["capabilities"] += 1
+            return original(self)
+
+        monkeypatch.setattr(FlowchartPipeline, "get_capabilities", counting_capabilities)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "workflow.txt"
+            input_file.write_text("1. Start\n2. Process data\n3. End\n")
+            output_file = Path(tmpdir) / "output.mmd"
+
+            result = runner.invoke(
+                app,
+                [
+                    "generate", str(input_file), "-o", str(output_file),
+                    "--extraction", "heuristic", "--renderer", "mermaid", "--json",
+                ],
+            )
+
+            assert result.exit_code == 0, f"CLI failed: {result.output}"
+            assert calls["capabilities"] == 0
+            config = next(json.loads(line) for line in result.stdout.splitlines() if '"config"' in line)
+            assert config["extraction"] == "heuristic"
+            assert config["renderer"] == "mermaid"
+
+    def test_cli_generate_titles_stem_words_split_on_spaces_and_underscores(self):
+        """Test the default title capitalizes every word of the input file stem."""
+        runner, app = _cli_runner_and_app()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "my_work  flow.txt"
+            input_file.write_text("1. Start\n2. Process data\n3. End\n")
+            output_file = Path(tmpdir) / "output.mmd"
+
+            result = runner.invoke(app, ["generate", str(input_file), "-o", str(output_file)])
+
+            assert result.exit_code == 0, f"CLI failed: {result.output}"
+            assert "%% My Work Flow\n" in output_file.read_text(encoding="utf-8")
+
+    def test_cli_generate_validates_flowchart_once(self, monkeypatch):
+        """Test CLI generate reuses the pipeline's validation result."""
+        runner, app = _cli_runner_and_app()
+        calls = {"validate": 0}
+        original = ISO5807Validator.validate
+
+        def counting_validate(self, flowchart):
+            calls["validate"] += 1
+            return original(self, flowchart)
+
+        monkeypatch.setattr(ISO5807Validator, "validate", counting_validate)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "workflow.txt"
+            input_file.write_text("1. Start\n2. Process data\n3. End\n")
+            output_file = Path(tmpdir) / "output.mmd"
+
+            result = runner.invoke(app, ["generate", str(input_file), "-o", str(output_file), "--json"])
+
+            assert result.exit_code == 0, f"CLI failed: {result.output}"
+            assert calls["validate"] == 1
+
+    def test_cli_generate_missing_file_reports_error(self):
+        """Test CLI generate reports a missing input file as a JSON error event."""
+        runner, app = _cli_runner_and_app()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = Path(tmpdir) / "missing.txt"
+            result = runner.invoke(app, ["generate", str(missing), "--json"])
+
+            assert result.exit_code == 1
+            event = json.loads(result.output.strip().splitlines()[-1])
+            assert event["event"] == "error"
+            assert "not found" in event["message"]
+
+    def test_tutorial_runs_cli_commands_in_process(self, monkeypatch):
+        """Test tutorial commands run through the Typer app without a subshell."""
+        _cli_runner_and_app()
+        from cli.tutorial_command import _run_flowchart_command
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.chdir(tmpdir)
+            Path("workflow.txt").write_text("1. Start\n2. Process data\n3. End\n")
+
+            assert _run_flowchart_command("flowchart generate workflow.txt -o out.mmd") is True
+            assert Path("out.mmd").exists()
+            assert _run_flowchart_command("flowchart generate missing.txt -o out.mmd") is False
+            assert _run_flowchart_command("flowchart generate workflow.txt --no-such-option") is False
+
+    def test_tutorial_writes_into_workspace_without_chdir(self, monkeypatch):
+        """Test tutorial steps address files under the workspace path."""
+        _cli_runner_and_app()
+        from cli import tutorial_command
+
+        monkeypatch.setenv("FLOWCHART_TUTORIAL_PACE", "0")
+        monkeypatch.setattr(tutorial_command.Confirm, "ask", lambda *args, **kwargs: True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.chdir(tmpdir)
+            workdir = Path("flowchart_tutorial")
+            workdir.mkdir()
+            commands = []
+            monkeypatch.setattr(tutorial_command, "_run_flowchart_command", commands.append)
+
+            tutorial_command.step_1_simple_workflow(workdir)
+
+            assert Path.cwd() == Path(tmpdir).resolve()
+            assert (workdir / "simple_workflow.txt").exists()
+            assert commands == [
+                "flowchart generate flowchart_tutorial/simple_workflow.txt "
+                "-o flowchart_tutorial/simple.png --renderer graphviz"
+            ]
+
+    def test_tutorial_pace_env_disables_pauses(self, monkeypatch):
+        """Test FLOWCHART_TUTORIAL_PACE=0 skips tutorial sleeps."""
+        from cli import tutorial_command
+
+        sleeps = []
+        monkeypatch.setattr(tutorial_command.time, "sleep", sleeps.append)
+        monkeypatch.setenv("FLOWCHART_TUTORIAL_PACE", "0")
+        tutorial_command._pause(2)
+        assert sleeps == []
+
+        monkeypatch.setenv("FLOWCHART_TUTORIAL_PACE", "0.5")
+        tutorial_command._pause(2)
+        assert sleeps == [1.0]
+
     def test_cli_validate_command(self):
         """Test CLI validate command."""
         runner, app = _cli_runner_and_app()
@@ -182,6 +362,44 @@ class TestEndToEnd:
             result = runner.invoke(app, ["validate", str(input_file)])
             assert result.exit_code == 0, f"Validation failed: {result.output}"
 
+    def test_cli_validate_reuses_result_for_unchanged_workflow(self, monkeypatch):
+        """Test CLI validate memoizes results for identical workflow text."""
+        import cli.main as cli_main
+
+        runner, app = _cli_runner_and_app()
+        calls = {"validate": 0}
+        original = ISO5807Validator.validate
+
+        def counting_validate(self, flowchart):
+            calls["validate"] += 1
+            return original(self, flowchart)
+
+        monkeypatch.setattr(ISO5807Validator, "validate", counting_validate)
+        monkeypatch.setattr(cli_main, "_VALIDATION_CACHE", type(cli_main._VALIDATION_CACHE)())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "workflow.txt"
+            input_file.write_text("1. Start\n2. Process data\n3. End\n")
+
+            first = runner.invoke(app, ["validate", str(input_file), "--verbose"])
+            second = runner.invoke(app, ["validate", str(input_file), "--verbose"])
+
+            assert first.exit_code == second.exit_code == 0
+            assert first.output == second.output
+            assert calls["validate"] == 1
+
+            input_file.write_text("1. Start\n2. Load data\n3. End\n")
+            runner.invoke(app, ["validate", str(input_file)])
+            assert calls["validate"] == 2
+
+    def test_cli_validate_missing_file_reports_to_stderr(self):
+        """Test CLI error messages are written to stderr."""
+        runner, app = _cli_runner_and_app()
+        result = runner.invoke(app, ["validate", "does-not-exist.txt"])
+
+        assert result.exit_code == 1
+        assert "Input file not found" in result.stderr
+        assert "Input file not found" not in result.stdout
+
     def test_cli_info_command(self):
         """Test CLI info command."""
         runner, app = _cli_runner_and_app()
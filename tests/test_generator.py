@@ -110,3 +110,53 @@ def test_generator_normalizes_double_quotes_for_mermaid_parse_safety():
     assert '"repair your computer"' not in code
     assert "'repair your computer'" in code
     assert "'yes'" in code
+
+
+def test_generator_spells_out_arrow_glyphs_in_labels():
+    flowchart = Flowchart(
+        title="Arrow Test",
+        nodes=[
+            FlowchartNode(id="A", node_type=NodeType.PROCESS, label="Draft \u2192 Review"),
+            FlowchartNode(id="B", node_type=NodeType.TERMINATOR, label="End"),
+        ],
+        connections=[Connection(from_node="A", to_node="B", label="back \u2190 out")],
+    )
+
+    code = MermaidGenerator().generate(flowchart)
+
+    assert "A[Draft -> Review]" in code
+    assert "|back <- out|" in code
+
+
+def test_generator_truncates_very_long_labels():
+    long_label = " ".join(f"step{index} and more" for index in range(400))
+    flowchart = Flowchart(
+        nodes=[
+            FlowchartNode(id="A", node_type=NodeType.PROCESS, label=long_label),
+            FlowchartNode(id="B", node_type=NodeType.TERMINATOR, label="End"),
+        ],
+        connections=[Connection(from_node="A", to_node="B", label=long_label)],
+    )
+
+    code = MermaidGenerator().generate(flowchart)
+
+    assert f"A[{long_label[:117]}...]" in code
+    assert f"|{long_label[:47]}...|" in code
+
+
+def test_warm_runs_once(monkeypatch):
+    calls = {"generate": 0}
+    original = MermaidGenerator.generate
+
+    def counting_generate(self, flowchart, direction="TD"):
+        calls["generate"] += 1
+        return original(self, flowchart, direction=direction)
+
+    monkeypatch.setattr(MermaidGenerator, "generate", counting_generate)
+    monkeypatch.setattr(MermaidGenerator, "_WARMED", False)
+
+    MermaidGenerator.warm()
+    MermaidGenerator.warm()
+
+    assert calls["generate"] == 1
+    assert MermaidGenerator._WARMED is True
@@ -198,3 +198,53 @@ def test_merged_pipeline_text_keeps_phase_groups_for_export():
         "2. Label Sent to Customer",
         "2. Label Sent to Customer",
     ]
+
+
+def test_batch_processing_renders_every_workflow_concurrently(tmp_path):
+    from types import SimpleNamespace
+
+    from cli.batch_command import _run_batch_processing
+    from src.pipeline import PipelineConfig
+
+    workflows = [
+        SimpleNamespace(title=f"Flow {index}", content=f"1. Start\n2. Process item {index}\n3. End")
+        for index in range(4)
+    ]
+
+    success, failed = _run_batch_processing(
+        pipeline_config=PipelineConfig(validate=False),
+        workflows=workflows,
+        output_dir=tmp_path,
+        output_format="mmd",
+        zip_output=False,
+    )
+
+    assert (success, failed) == (4, 0)
+    assert sorted(path.name for path in tmp_path.glob("*.mmd")) == [f"Flow_{index}.mmd" for index in range(4)]
+
+
+def test_batch_processing_gives_duplicate_titles_distinct_outputs(tmp_path):
+    from types import SimpleNamespace
+
+    from cli.batch_command import _run_batch_processing
+    from src.pipeline import PipelineConfig
+
+    workflows = [
+        SimpleNamespace(title="Order Flow", content="1. Start\n2. Take order\n3. End"),
+        SimpleNamespace(title="Order Flow", content="1. Start\n2. Ship order\n3. End"),
+    ]
+
+    success, failed = _run_batch_processing(
+        pipeline_config=PipelineConfig(validate=False),
+        workflows=workflows,
+        output_dir=tmp_path,
+        output_format="mmd",
+        zip_output=False,
+    )
+
+    assert (success, failed) == (2, 0)
+    outputs = sorted(tmp_path.glob("*.mmd"))
+    assert [path.name for path in outputs] == ["Order_Flow.mmd", "Order_Flow_2.mmd"]
+    contents = [path.read_text(encoding="utf-8") for path in outputs]
+    assert "Take order" in contents[0]
+    assert "Ship order" in contents[1]
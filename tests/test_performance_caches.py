@@ -1,29 +1,58 @@
 """Performance-related cache regression tests."""
 
 from src.parser import nlp_parser
-from src.renderer.image_renderer import ImageRenderer
+from src.renderer.image_renderer import ImageRenderer, get_image_renderer
 
 
 def test_nlp_parser_spacy_model_load_is_cached(monkeypatch):
     class DummySpacy:
         load_calls = 0
+        load_kwargs = None
 
         @staticmethod
-        def load(_name):
+        def load(_name, **kwargs):
             DummySpacy.load_calls += 1
+            DummySpacy.load_kwargs = kwargs
             return object()
 
     monkeypatch.setattr(nlp_parser, "SPACY_AVAILABLE", True)
     monkeypatch.setattr(nlp_parser, "spacy", DummySpacy)
-    nlp_parser.NLPParser._SPACY_MODEL = None
-    nlp_parser.NLPParser._SPACY_MODEL_LOAD_FAILED = False
+    nlp_parser._get_nlp.cache_clear()
 
-    first = nlp_parser.NLPParser(use_spacy=True)
-    second = nlp_parser.NLPParser(use_spacy=True)
+    try:
+        first = nlp_parser.NLPParser(use_spacy=True)
+        second = nlp_parser.NLPParser(use_spacy=True)
+    finally:
+        nlp_parser._get_nlp.cache_clear()
 
     assert first.nlp is not None
-    assert second.nlp is not None
+    assert first.nlp is second.nlp
     assert DummySpacy.load_calls == 1
+    assert DummySpacy.load_kwargs == {"exclude": ["ner"]}
+
+
+def test_nlp_parser_failed_spacy_load_is_cached(monkeypatch):
+    class MissingModelSpacy:
+        load_calls = 0
+
+        @staticmethod
+        def load(_name, **_kwargs):
+            MissingModelSpacy.load_calls += 1
+            raise OSError("model not installed")
+
+    monkeypatch.setattr(nlp_parser, "SPACY_AVAILABLE", True)
+    monkeypatch.setattr(nlp_parser, "spacy", MissingModelSpacy)
+    nlp_parser._get_nlp.cache_clear()
+
+    try:
+        first = nlp_parser.NLPParser(use_spacy=True)
+        second = nlp_parser.NLPParser(use_spacy=True)
+    finally:
+        nlp_parser._get_nlp.cache_clear()
+
+    assert first.use_spacy is False
+    assert second.use_spacy is False
+    assert MissingModelSpacy.load_calls == 1
 
 
 def test_image_renderer_mmdc_lookup_is_cached(monkeypatch):
@@ -55,3 +84,418 @@ def test_image_renderer_mmdc_lookup_is_cached(monkeypatch):
     assert r1.mmdc_path == "npx -y @mermaid-js/mermaid-cli"
     assert r2.mmdc_path == "npx -y @mermaid-js/mermaid-cli"
     assert calls["run"] == 1
+
+
+def test_nlp_parser_batches_lines_through_nlp_pipe(monkeypatch):
+    class DummyNlp:
+        def __init__(self):
+            self.pipe_calls = 0
+            self.call_count = 0
+
+        def __call__(self, _text):
+            self.call_count += 1
+            return []
+
+        def pipe(self, texts, batch_size=1):
+            self.pipe_calls += 1
+            return iter([[] for _ in texts])
+
+    dummy = DummyNlp()
+    monkeypatch.setattr(nlp_parser, "SPACY_AVAILABLE", True)
+    monkeypatch.setattr(nlp_parser, "_get_nlp", lambda *_args: dummy)
+
+    parser = nlp_parser.NLPParser(use_spacy=True)
+    steps = parser.parse("1. Start\n2. Read input file\n3. Save record to database\n4. End")
+
+    assert len(steps) == 4
+    assert dummy.pipe_calls == 1
+    assert dummy.call_count == 0
+
+
+def test_nlp_parser_memoizes_parse_results_with_fresh_copies(monkeypatch):
+    calls = {"parse": 0}
+    original = nlp_parser.NLPParser._parse_uncached
+
+    def counting_parse(self, text):
+        calls["parse"] += 1
+        return original(self, text)
+
+    monkeypatch.setattr(nlp_parser.NLPParser, "_parse_uncached", counting_parse)
+    nlp_parser.NLPParser.clear_parse_cache()
+
+    text = "1. Start\n2. Check if input is valid\n3. End"
+    first = nlp_parser.NLPParser(use_spacy=False).parse(text)
+    first[0].text = "mutated"
+    second = nlp_parser.NLPParser(use_spacy=False).parse(text)
+    nlp_parser.NLPParser.clear_parse_cache()
+
+    assert calls["parse"] == 1
+    assert second[0].text != "mutated"
+    assert [step.text for step in second[1:]] == [step.text for step in first[1:]]
+
+
+def test_get_image_renderer_returns_shared_instance(monkeypatch):
+    monkeypatch.setattr("src.renderer.image_renderer._SHARED_RENDERER", None)
+
+    assert get_image_renderer() is get_image_renderer()
+
+
+def test_info_table_is_built_once():
+    from cli.main import ISO_SYMBOLS, _build_info_table
+
+    table = _build_info_table()
+
+    assert _build_info_table() is table
+    assert table.row_count == len(ISO_SYMBOLS)
+
+
+def test_capability_probes_run_concurrently(monkeypatch):
+    import threading
+
+    from src.capability_detector import CapabilityDetector
+
+    detector = CapabilityDetector(cache_ttl=0)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def gpu_probe(_system):
+        barrier.wait()
+        return {"gpu_backend": "cpu", "warnings": ["gpu"]}
+
+    def services_probe():
+        barrier.wait()
+        return {"kroki_available": True, "warnings": ["services"]}
+
+    monkeypatch.setattr(detector, "_detect_gpu", gpu_probe)
+    monkeypatch.setattr(detector, "_detect_services", services_probe)
+
+    caps = detector.detect()
+
+    assert caps.gpu_backend == "cpu"
+    assert caps.kroki_available is True
+    assert caps.warnings[:2] == ["gpu", "services"]
+
+
+def test_capability_probes_are_reused_from_disk_cache(monkeypatch, tmp_path):
+    from src.capability_detector import CapabilityDetector
+
+    cache_path = tmp_path / "caps.json"
+    calls = []
+
+    def make_detector():
+        detector = CapabilityDetector(cache_path=cache_path)
+        monkeypatch.setattr(detector, "_detect_gpu", lambda _system: calls.append("gpu") or {"gpu_backend": "cpu"})
+        monkeypatch.setattr(
+            detector, "_detect_services", lambda: calls.append("services") or {"kroki_available": True}
+        )
+        return detector
+
+    first = make_detector().detect()
+    second = make_detector().detect()
+    refreshed = make_detector().detect(force_refresh=True)
+
+    assert cache_path.exists()
+    assert calls == ["gpu", "services", "gpu", "services"]
+    assert first.kroki_available is second.kroki_available is refreshed.kroki_available is True
+    assert second.available_renderers == first.available_renderers
+
+
+def test_package_and_binary_probes_are_not_persisted(monkeypatch, tmp_path):
+    import json
+
+    from src.capability_detector import CapabilityDetector
+
+    cache_path = tmp_path / "caps.json"
+    calls = []
+
+    def make_detector():
+        detector = CapabilityDetector(cache_path=cache_path)
+        monkeypatch.setattr(detector, "_detect_gpu", lambda _system: {"gpu_backend": "cpu"})
+        monkeypatch.setattr(detector, "_detect_services", lambda: {})
+        monkeypatch.setattr(
+            detector, "_detect_python_packages", lambda: calls.append("packages") or {"has_spacy": True}
+        )
+        monkeypatch.setattr(detector, "_detect_binaries", lambda: calls.append("binaries") or {})
+        return detector
+
+    make_detector().detect()
+    second = make_detector().detect()
+
+    assert sorted(calls) == ["binaries", "binaries", "packages", "packages"]
+    assert second.has_spacy is True
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))["probes"]
+    assert "python_packages" not in cached
+    assert "binaries" not in cached
+
+
+def test_gpu_probe_prefers_nvml_over_nvidia_smi(monkeypatch):
+    import sys
+    import types
+
+    from src import capability_detector
+
+    class FakeMemory:
+        total = 8 * 1024 ** 3
+
+    fake_nvml = types.SimpleNamespace(
+        NVMLError=Exception,
+        nvmlInit=lambda: None,
+        nvmlShutdown=lambda: None,
+        nvmlDeviceGetCount=lambda: 1,
+        nvmlDeviceGetHandleByIndex=lambda _index: "gpu0",
+        nvmlDeviceGetName=lambda _handle: b"Fake GPU",
+        nvmlDeviceGetMemoryInfo=lambda _handle: FakeMemory(),
+    )
+    monkeypatch.setitem(sys.modules, "pynvml", fake_nvml)
+
+    def fail_subprocess(*_args, **_kwargs):
+        raise AssertionError("nvidia-smi should not run when NVML is available")
+
+    monkeypatch.setattr(capability_detector.subprocess, "run", fail_subprocess)
+
+    patch = capability_detector.CapabilityDetector(cache_ttl=0)._detect_gpu("Linux")
+
+    assert patch == {
+        "has_cuda": True,
+        "cuda_device_name": "Fake GPU",
+        "cuda_vram_gb": 8.0,
+        "gpu_backend": "cuda",
+    }
+
+
+def test_scan_path_finds_binaries_in_one_walk(monkeypatch, tmp_path):
+    import os
+
+    from src.capability_detector import CapabilityDetector
+
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    for directory, name in ((first, "dot"), (second, "dot"), (second, "node")):
+        binary = directory / name
+        binary.write_text("#!/bin/sh\n")
+        binary.chmod(0o755)
+    (first / "d2").write_text("not executable")
+
+    path = os.pathsep.join([str(first), str(tmp_path / "missing"), str(first), str(second)])
+    monkeypatch.setenv("PATH", path)
+
+    found = CapabilityDetector._scan_path({"dot", "node", "d2", "docker"})
+
+    assert found == {"dot": str(first / "dot"), "node": str(second / "node")}
+
+
+def test_kroki_probe_only_checks_the_port_is_open():
+    import socket
+
+    from src.capability_detector import CapabilityDetector
+
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+        detector = CapabilityDetector(kroki_url=f"http://127.0.0.1:{port}", cache_ttl=0)
+        assert detector._kroki_reachable() is True
+
+    assert detector._kroki_reachable() is False
+
+
+def test_ollama_probe_skips_http_when_port_is_closed(monkeypatch):
+    import socket
+
+    from src.capability_detector import CapabilityDetector
+    from src.parser import ollama_extractor
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    def fail_discover(**_kwargs):
+        raise AssertionError("HTTP discovery should not run when the port is closed")
+
+    monkeypatch.setattr(ollama_extractor, "discover_ollama_models", fail_discover)
+
+    info = CapabilityDetector(cache_ttl=0).detect_ollama(f"http://127.0.0.1:{port}")
+
+    assert info["reachable"] is False
+    assert info["models"] == []
+    assert any("not reachable" in warning for warning in info["warnings"])
+
+
+def test_metal_probe_checks_framework_without_system_profiler(monkeypatch):
+    import sys
+
+    from src import capability_detector
+
+    commands = []
+
+    def fake_run(cmd, **_kwargs):
+        commands.append(cmd[0])
+        raise FileNotFoundError(cmd[0])
+
+    monkeypatch.setitem(sys.modules, "pynvml", None)
+    monkeypatch.setattr(capability_detector.subprocess, "run", fake_run)
+    monkeypatch.setattr(capability_detector, "find_library", lambda name: f"/System/Library/Frameworks/{name}")
+
+    patch = capability_detector.CapabilityDetector(cache_ttl=0)._detect_gpu("Darwin")
+
+    assert patch == {"has_metal": True, "gpu_backend": "metal"}
+    assert commands == ["nvidia-smi"]
+
+
+def test_validate_config_runs_only_the_probes_it_needs(monkeypatch):
+    from src.capability_detector import PROBE_NAMES, CapabilityDetector
+    from src.pipeline import PipelineConfig
+
+    detector = CapabilityDetector(cache_ttl=0)
+    calls = []
+    for name in PROBE_NAMES:
+        monkeypatch.setattr(
+            detector, f"_detect_{name}", lambda *_args, name=name: calls.append(name) or {}
+        )
+
+    assert detector.validate_config(PipelineConfig(extraction="heuristic", renderer="html")) == []
+    assert calls == []
+
+    issues = detector.validate_config(PipelineConfig(extraction="heuristic", renderer="kroki"))
+    assert calls == ["services"]
+    assert any("Kroki" in issue for issue in issues)
+
+    detector.detect()
+    assert sorted(calls) == sorted(PROBE_NAMES)
+
+
+def test_ollama_discovery_reuses_keep_alive_session():
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from src.capability_detector import CapabilityDetector
+
+    request_peers = []
+
+    class TagsHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            request_peers.append(self.client_address)
+            body = json.dumps({"models": [{"name": "llama3.2:3b", "size": 0}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TagsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    detector = CapabilityDetector(cache_ttl=0)
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        first = detector.detect_ollama(base_url)
+        second = detector.detect_ollama(base_url)
+    finally:
+        detector.http.close()
+        server.shutdown()
+        server.server_close()
+
+    assert first["reachable"] and second["available"]
+    assert second["models"][0]["name"] == "llama3.2:3b"
+    # Both /api/tags requests arrive over the same pooled connection.
+    assert len(request_peers) == 2
+    assert len(set(request_peers)) == 1
+
+
+def test_nvidia_smi_fallback_parses_first_device_from_bytes(monkeypatch):
+    import types
+
+    from src import capability_detector
+
+    output = b"NVIDIA RTX 4090, 24564\r\nNVIDIA RTX 3090, 24576\n"
+    monkeypatch.setattr(
+        capability_detector.subprocess, "run",
+        lambda *_args, **_kwargs: types.SimpleNamespace(returncode=0, stdout=output),
+    )
+
+    patch = capability_detector.CapabilityDetector(cache_ttl=0)._detect_cuda_smi()
+
+    assert patch == {
+        "has_cuda": True,
+        "cuda_device_name": "NVIDIA RTX 4090",
+        "cuda_vram_gb": 24.0,
+        "gpu_backend": "cuda",
+    }
+
+
+def test_mermaid_label_sanitization_is_memoized():
+    from src.generator import mermaid_generator
+    from src.models import Connection, Flowchart, FlowchartNode, NodeType
+
+    mermaid_generator._sanitize.cache_clear()
+    flowchart = Flowchart(
+        title="Repeats",
+        nodes=[
+            FlowchartNode(id="D1", node_type=NodeType.DECISION, label="Approved?"),
+            FlowchartNode(id="D2", node_type=NodeType.DECISION, label="Approved?"),
+            FlowchartNode(id="END", node_type=NodeType.TERMINATOR, label="End"),
+        ],
+        connections=[
+            Connection(from_node="D1", to_node="D2", label="Yes"),
+            Connection(from_node="D2", to_node="END", label="Yes"),
+        ],
+    )
+
+    code = mermaid_generator.MermaidGenerator().generate(flowchart)
+    info = mermaid_generator._sanitize.cache_info()
+
+    assert "D2{Approved?}" in code
+    assert info.hits == 2
+    assert info.misses == 4  # title, "Approved?", "End", "Yes"
+
+
+def test_generate_with_theme_is_memoized_on_flowchart_content(monkeypatch):
+    from src.generator.mermaid_generator import MermaidGenerator
+    from src.models import Connection, Flowchart, FlowchartNode, NodeType
+
+    calls = {"generate": 0}
+    original = MermaidGenerator.generate
+
+    def counting_generate(self, flowchart, direction="TD"):
+        calls["generate"] += 1
+        return original(self, flowchart, direction=direction)
+
+    monkeypatch.setattr(MermaidGenerator, "generate", counting_generate)
+    MermaidGenerator.clear_themed_cache()
+    flowchart = Flowchart(
+        nodes=[
+            FlowchartNode(id="S", node_type=NodeType.TERMINATOR, label="Start"),
+            FlowchartNode(id="E", node_type=NodeType.TERMINATOR, label="End"),
+        ],
+        connections=[Connection(from_node="S", to_node="E")],
+    )
+
+    first = MermaidGenerator().generate_with_theme(flowchart, theme="dark")
+    second = MermaidGenerator().generate_with_theme(flowchart, theme="dark")
+    flowchart.nodes[1].label = "Finish"
+    changed = MermaidGenerator().generate_with_theme(flowchart, theme="dark")
+    MermaidGenerator.clear_themed_cache()
+
+    assert second == first
+    assert "E([Finish])" in changed
+    assert calls["generate"] == 2
+
+
+def test_mermaid_generator_clear_caches_drops_labels_and_themed_output():
+    from src.generator import mermaid_generator
+    from src.models import Flowchart, FlowchartNode, NodeType
+
+    flowchart = Flowchart(nodes=[FlowchartNode(id="S", node_type=NodeType.TERMINATOR, label="Start")])
+    mermaid_generator.MermaidGenerator().generate_with_theme(flowchart)
+
+    mermaid_generator.MermaidGenerator.clear_caches()
+
+    assert mermaid_generator._sanitize.cache_info().currsize == 0
+    assert not mermaid_generator.MermaidGenerator._themed_cache
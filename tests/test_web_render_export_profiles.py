@@ -8,6 +8,8 @@ import web.app as web_app
 from PIL import Image
 from PyPDF2 import PdfReader
 
+from src.renderer.image_renderer import ImageRenderer
+
 
 app = web_app.app
 
@@ -25,7 +27,7 @@ def test_render_polished_export_returns_file_and_renderer_headers(monkeypatch):
         assert background == "white"
         return True
 
-    monkeypatch.setattr(web_app.ImageRenderer, "render", fake_render)
+    monkeypatch.setattr(ImageRenderer, "render", fake_render)
 
     with app.test_client() as client:
         response = client.post(
@@ -54,7 +56,7 @@ def test_render_rejects_invalid_pdf_artifact(monkeypatch):
         p.write_bytes(b"NOT_A_PDF")
         return True
 
-    monkeypatch.setattr(web_app.ImageRenderer, "render", fake_render)
+    monkeypatch.setattr(ImageRenderer, "render", fake_render)
     monkeypatch.setattr(web_app.HTMLFallbackRenderer, "render", lambda _self, _code, _path, title="Flowchart": False)
 
     with app.test_client() as client:
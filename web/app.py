@@ -111,9 +111,9 @@ def _fit_png_to_pdf_page(
         first_page.save(pdf_bytes, format='PDF', save_all=bool(rest), append_images=rest)
         return pdf_bytes.getvalue()
 from src.generator.mermaid_generator import MermaidGenerator
-from src.renderer.image_renderer import ImageRenderer
+from src.renderer.image_renderer import get_image_renderer
 from src.pipeline import FlowchartPipeline, PipelineConfig
-from src.capability_detector import CapabilityDetector
+from src.capability_detector import EXTRACTOR_ORDER, RENDERER_ORDER, CapabilityDetector, ordered
 from src.parser.ollama_extractor import discover_ollama_models
 from src.quality_assurance import evaluate_quality, build_source_snapshot, QualityThresholds
 from src.models import NodeType
@@ -859,7 +859,7 @@ def get_capabilities():
     """Return full hardware + software capability assessment."""
     force = request.args.get('refresh', 'false').lower() == 'true'
     if force:
-        cap_detector._cache = None
+        cap_detector.detect(force_refresh=True)
     return jsonify({'success': True, **cap_detector.get_summary()})
 
 
@@ -2043,7 +2043,7 @@ def render_to_file():
                     render_meta['final_renderer'] = 'html'
                     render_meta['output_path'] = str(html_path)
                 else:
-                    renderer = ImageRenderer()
+                    renderer = get_image_renderer()
                     success = renderer.render(
                         mermaid_code,
                         str(output_path),
@@ -2255,6 +2255,7 @@ def health_check():
 
 if __name__ == '__main__':
     runtime_config = _resolve_server_runtime_config()
+    MermaidGenerator.warm()
     startup_report = run_startup_preflight(
         project_root=Path(__file__).resolve().parent.parent,
         ollama_base_url=DEFAULT_OLLAMA_BASE_URL,
@@ -2277,8 +2278,10 @@ if __name__ == '__main__':
     # Show capabilities at startup
     caps = cap_detector.detect()
     print(f"\n  Hardware:  {caps.total_ram_gb}GB RAM | {caps.cpu_count} CPUs | GPU: {caps.gpu_backend}")
-    print(f"  Extract:  {', '.join(caps.available_extractors)} (recommended: {caps.recommended_extraction})")
-    print(f"  Render:   {', '.join(caps.available_renderers)} (recommended: {caps.recommended_renderer})")
+    extractors = ', '.join(ordered(caps.available_extractors, EXTRACTOR_ORDER))
+    renderers = ', '.join(ordered(caps.available_renderers, RENDERER_ORDER))
+    print(f"  Extract:  {extractors} (recommended: {caps.recommended_extraction})")
+    print(f"  Render:   {renderers} (recommended: {caps.recommended_renderer})")
     if caps.warnings:
         print(f"  Warnings: {len(caps.warnings)}")
         for w in caps.warnings[:3]: